@@ -0,0 +1,85 @@
+# benchBlockBlastBoard.py
+# Cost of the Block Blast game-over check (any_move_possible) and line scan
+# (Board.find_full_lines) in Best/blockBlastGPT5.py as the board grows from 8x8 to 32x32.
+#
+# Each size is filled with a random pattern dense enough that no tray piece fits, the
+# worst case for a scan: every anchor of every piece is tried before it can answer False.
+# any_move_possible reads the Board's incremental legal-placement counts; "mask scan"
+# is Geometry.fits_anywhere per piece and "cell scan" the old list-of-lists Board (nested
+# loops over anchors and shape cells), both on the same pattern for comparison.
+# "count update" is what the counts cost instead: LegalCounts.update per placement,
+# averaged over a random game on the same size.
+#
+# Usage: python Benchmarks/benchBlockBlastBoard.py [sizes...]
+
+import random
+import sys
+
+from benchUtils import load_game, per_call_ms, report, use_dummy_sdl
+
+
+def cell_scan(cells, n, tray):
+    # any_move_possible as it was: every anchor, every shape cell, via Python lists
+    for piece in tray:
+        for r in range(n):
+            for c in range(n):
+                if all(0 <= r + dr < n and 0 <= c + dc < n and cells[r + dr][c + dc] is None
+                       for dr, dc in piece.cells):
+                    return True
+    return False
+
+
+def blocked_board(bb, n, tray, rng):
+    # random fill, then plug single cells until no tray piece fits
+    board = bb.Board(n)
+    for r in range(n):
+        for c in range(n):
+            if rng.random() < 0.5:
+                board.bits |= 1 << (r * n + c)
+    while any(board.geo.fits_anywhere(board.bits, p.shape) for p in tray):
+        board.bits |= 1 << rng.randrange(n * n)
+    for i in range(n * n):
+        if board.bits >> i & 1:
+            board.colors[i] = bb.PIECE_COLORS[0]
+    board.legal.update(board.bits)
+    return board
+
+
+def update_ms(bb, n, rng, placements=2000):
+    # random legal placements with line clears; only the count updates are timed
+    geo = bb.geometry(n)
+    legal = bb.LegalCounts(geo)
+    board, spent = 0, 0.0
+    for _ in range(placements):
+        spots = [p for p in geo.placements[rng.randrange(len(bb.SHAPES))] if not board & p.mask]
+        if not spots:
+            board = 0
+            continue
+        board, _ = geo.place(board, rng.choice(spots))
+        spent += per_call_ms(lambda: legal.update(board), repeat=1)
+    return spent / placements
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [8, 16, 24, 32]
+    use_dummy_sdl()
+    bb = load_game("Best/blockBlastGPT5.py")
+    rng = random.Random(0)
+    for n in sizes:
+        bb.set_grid_size(n)
+        n = bb.GRID_SIZE
+        tray = [bb.Piece(bb.SHAPES[s], bb.PIECE_COLORS[0], bb.CELL, s) for s in (5, 14)]
+        board = blocked_board(bb, n, tray, rng)
+        cells = [[board.colors[r * n + c] for c in range(n)] for r in range(n)]
+        report(f"Block Blast {n}x{n}, no move for a 2x2 square and a plus (CELL {bb.CELL} px)", [
+            ("any_move_possible", per_call_ms(lambda: bb.any_move_possible(board, tray)) * 1000.0, "us"),
+            ("mask scan", per_call_ms(lambda: any(board.geo.fits_anywhere(board.bits, p.shape)
+                                                  for p in tray)) * 1000.0, "us"),
+            ("cell scan", per_call_ms(lambda: cell_scan(cells, n, tray), repeat=20) * 1000.0, "us"),
+            ("count update", update_ms(bb, n, rng) * 1000.0, "us/placement"),
+            ("find_full_lines", per_call_ms(board.find_full_lines) * 1000.0, "us"),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchBlockBlastSolver.py
+# Latency of the Block Blast tray solver (Best/blockBlastBitboard.solve_tray), measured
+# on the boards it actually meets: the solver plays seeded games against uniform random
+# trays, and every call is timed.
+#
+# "exhaustive" is the share of trays where every order and position was searched within
+# the budget; the rest were answered by the widest beam that finished.
+#
+# Usage: python Benchmarks/benchBlockBlastSolver.py [trays] [budget ms] [board size]
+
+import os
+import random
+import sys
+import time
+
+from benchUtils import REPO_ROOT, report
+
+sys.path.insert(0, os.path.join(REPO_ROOT, "Best"))
+import blockBlastBitboard as bb  # noqa: E402
+
+
+def main():
+    trays = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    budget = float(sys.argv[2]) / 1000.0 if len(sys.argv) > 2 else 0.002
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    geo = bb.geometry(size)
+    rng = random.Random(0)
+    board, score, games = 0, 0, 1
+    times, exhaustive = [], 0
+    for _ in range(trays):
+        shapes = [rng.randrange(len(bb.SHAPES)) for _ in range(3)]
+        start = time.perf_counter()
+        moves, _, done = bb.solve_tray(geo, board, shapes, budget)
+        times.append((time.perf_counter() - start) * 1000.0)
+        exhaustive += done
+        for _, placement in moves:
+            board, n_lines = geo.place(board, placement)
+            score += bb.clear_points(n_lines)
+        if len(moves) < len(shapes):
+            board, games = 0, games + 1  # a piece had nowhere to go: game over, start again
+    times.sort()
+    report(f"Block Blast solver: {size}x{size}, {trays} trays, {budget * 1000:.1f} ms budget, {games} games", [
+        ("mean", sum(times) / len(times), "ms"),
+        ("p99", times[int(len(times) * 0.99)], "ms"),
+        ("max", times[-1], "ms"),
+        ("exhaustive", 100.0 * exhaustive / trays, "%"),
+        ("points per tray", score / trays, "pts"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchGeminiTetrisMoves.py
+# Moves/second for Tetris/tetrisGemini2.5Pro2.py, before and after the grid-lookup
+# validity check.
+#
+# "before" replays the original is_valid_space (a 200-entry accepted_pos list
+# rebuilt per call, then a linear `in` scan per piece cell) against the same
+# board; "after" calls the game's current is_valid_space. Each move is one
+# left/right/rotate/down attempt including its validity check and revert.
+#
+# Usage: python Benchmarks/benchGeminiTetrisMoves.py [seconds]
+
+import random
+import sys
+
+from benchUtils import load_game, rate, report
+
+
+def legacy_is_valid_space(game, piece):
+    accepted_pos = [[(j, i) for j in range(10) if game.grid[i][j] == (0, 0, 0)] for i in range(20)]
+    accepted_pos = [j for sub in accepted_pos for j in sub]
+    for pos in piece.get_formatted_shape():
+        if pos not in accepted_pos:
+            if pos[1] > -1:
+                return False
+    return True
+
+
+def make_game(tetris):
+    game = tetris.TetrisGame()
+    rng = random.Random(7)
+    # A ragged 8-row stack so moves collide now and then
+    for y in range(12, 20):
+        for x in range(10):
+            if rng.random() < 0.7:
+                game.grid[y][x] = tetris.SHAPE_COLORS[rng.randrange(7)]
+    game.current_piece.y = 6
+    return game
+
+
+def move_loop(game, valid):
+    rng = random.Random(1)
+    piece = game.current_piece
+    moves = [("x", -1), ("x", 1), ("rotation", 1), ("y", 1), ("y", -1)]
+
+    def one_move():
+        attr, d = moves[rng.randrange(5)]
+        setattr(piece, attr, getattr(piece, attr) + d)
+        if not valid(piece):
+            setattr(piece, attr, getattr(piece, attr) - d)
+    return one_move
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    tetris = load_game("Tetris/tetrisGemini2.5Pro2.py")
+    game = make_game(tetris)
+    before = rate(move_loop(game, lambda p: legacy_is_valid_space(game, p)), seconds)
+    after = rate(move_loop(game, game.is_valid_space), seconds)
+    report("tetrisGemini2.5Pro2 piece moves", [
+        ("before (accepted_pos list)", before, "moves/s"),
+        ("after (grid lookup)", after, "moves/s"),
+        ("speedup", after / before, "x"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchPacmanGeminiRender.py
+# Blits and draw time per frame in PacMan/pacmanGemini2.5Pro.py.
+#
+# The game bakes walls and pellets into a background layer and draws its sprites through
+# a LayeredDirty group, so a gameplay frame only erases and redraws what moved. Every
+# blit into the screen is counted (Surface.blit, and each item of Surface.blits/fblits).
+# The player is steered by seeded random arrow keys; update() is one fixed step of
+# simulated time and draw() no longer ticks the clock, so runs are repeatable and not
+# capped at 60 FPS.
+#
+# Usage: python Benchmarks/benchPacmanGeminiRender.py [frames]
+
+import random
+import sys
+import time
+
+import pygame
+
+from benchUtils import load_game, report, use_dummy_sdl
+
+
+class CountingSurface(pygame.Surface):
+    blits_done = 0
+
+    def blit(self, *args, **kwargs):
+        CountingSurface.blits_done += 1
+        return super().blit(*args, **kwargs)
+
+    def blits(self, seq, doreturn=1):
+        seq = list(seq)
+        CountingSurface.blits_done += len(seq)
+        return super().blits(seq, doreturn)
+
+    def fblits(self, seq, *args):
+        seq = list(seq)
+        CountingSurface.blits_done += len(seq)
+        return super().fblits(seq, *args)
+
+
+class Keys:
+    def __init__(self):
+        self.held = None
+
+    def __getitem__(self, key):
+        return key == self.held
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    use_dummy_sdl()
+    pacman = load_game("PacMan/pacmanGemini2.5Pro.py")
+    keys = Keys()
+    pygame.key.get_pressed = lambda: keys
+    random.seed(0)
+    rng = random.Random(0)
+
+    game = pacman.Game()
+    game.save_high_score = lambda: None
+    game.screen = CountingSurface((pacman.SCREEN_WIDTH, pacman.SCREEN_HEIGHT))
+    game.reset_game()
+    blits, times = [], []
+    games = 1
+    for frame in range(frames):
+        if frame % 30 == 0:
+            keys.held = rng.choice((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN))
+        if game.state == "GAME_OVER":
+            game.reset_game()
+            games += 1
+        game.update()
+        before = CountingSurface.blits_done
+        start = time.perf_counter()
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000.0)
+        blits.append(CountingSurface.blits_done - before)
+    blits.sort()
+    times.sort()
+    report(f"Gemini Pac-Man render: {frames} frames over {games} games", [
+        ("blits mean", sum(blits) / frames, "per frame"),
+        ("blits max", blits[-1], "per frame"),
+        ("draw mean", sum(times) / frames, "ms"),
+        ("draw p99", times[int(frames * 0.99)], "ms"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchPacmanGeminiSim.py
+# How fast PacMan/pacmanGemini2.5Pro.py simulates when nothing is drawn.
+#
+# The game's timers (ghost release, scatter/chase switches, frightened expiry, level start
+# and death pauses) are deadline callbacks on simulated clocks that advance by one
+# SIM_STEP_MS per Game.update(), so the game plays the same whether steps run at 60 per
+# second or as fast as the CPU allows. This plays seeded games headless (random arrow keys
+# every half second, restarting on game over) for a fixed amount of simulated time.
+#
+# Usage: python Benchmarks/benchPacmanGeminiSim.py [simulated seconds]
+
+import random
+import sys
+import time
+
+import pygame
+
+from benchUtils import load_game, report, use_dummy_sdl
+
+
+class Keys:
+    def __init__(self):
+        self.held = None
+
+    def __getitem__(self, key):
+        return key == self.held
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 600.0
+    use_dummy_sdl()
+    pacman = load_game("PacMan/pacmanGemini2.5Pro.py")
+    keys = Keys()
+    pygame.key.get_pressed = lambda: keys
+    random.seed(0)
+    rng = random.Random(0)
+
+    game = pacman.Game()
+    game.save_high_score = lambda: None
+    game.reset_game()
+    steps = int(seconds * 1000 / pacman.SIM_STEP_MS)
+    games, deaths, lives = 1, 0, game.player.lives
+    start = time.perf_counter()
+    for step in range(steps):
+        if step % (pacman.FPS // 2) == 0:
+            keys.held = rng.choice((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN))
+        if game.state == "GAME_OVER":
+            game.reset_game()
+            games += 1
+        game.update()
+        if game.player.lives != lives:
+            deaths += lives > game.player.lives
+            lives = game.player.lives
+    elapsed = time.perf_counter() - start
+    report(f"Gemini Pac-Man headless: {seconds:.0f} s simulated over {games} games, {deaths} deaths", [
+        ("steps", steps / elapsed, "per s"),
+        ("update", elapsed * 1e6 / steps, "us/step"),
+        ("speed-up", seconds / elapsed, "x real time"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchPacmanGrokAlloc.py
+# Memory allocated per simulation frame in PacMan/pacmanGrok4.py, measured with tracemalloc.
+#
+# Runs the gameplay step of main() headless (chase/scatter timer, player.update(), every
+# ghost's update(), the player/ghost collision test) with the player steered by seeded
+# random turns, restarting positions on a death and the maze once it is cleared.
+# "transient" is how far traced memory rose above its level at the start of the frame
+# (tracemalloc peak, less what reading the counters costs), "net" is what the frame left
+# behind. The first frames, which fill caches and free lists, are not measured. What is
+# left is scalar churn (ints past CPython's small-int cache, the odd target tuple); no
+# positions, tiles or directions are created per frame.
+#
+# Usage: python Benchmarks/benchPacmanGrokAlloc.py [frames]
+
+import random
+import sys
+import time
+import tracemalloc
+
+from benchUtils import load_game, report, use_dummy_sdl
+
+CHASE_SCATTER = [7, 20, 7, 20, 5, 20, 5, -1]
+WARMUP = 300
+
+
+def traced(fn, frame_numbers):
+    """Per-call (transient, net) bytes traced while fn(frame) runs."""
+    transient, net = [], []
+    for frame in frame_numbers:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn(frame)
+        current, peak = tracemalloc.get_traced_memory()
+        transient.append(peak - before)
+        net.append(current - before)
+    return transient, net
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    use_dummy_sdl()
+    pacman = load_game("PacMan/pacmanGrok4.py")
+    random.seed(0)
+    rng = random.Random(0)
+    pacman.player = player = pacman.Player()
+    pacman.ghosts = ghosts = [
+        pacman.Ghost('blinky', (27, 0)),
+        pacman.Ghost('pinky', (0, 0)),
+        pacman.Ghost('inky', (27, 30)),
+        pacman.Ghost('clyde', (0, 30)),
+    ]
+    pacman.global_current_mode = 'scatter'
+    pacman.eaten_multiplier = 1
+    pacman.state = 'gameplay'
+    pacman.reset_maze()
+    pacman.reset_positions()
+    turns = list(pacman.directions.values())
+    cs_index, cs_timer = 0, CHASE_SCATTER[0] * pacman.FPS
+
+    def step(frame):
+        nonlocal cs_index, cs_timer
+        if frame % 25 == 0:
+            player.next_dir = rng.choice(turns)
+        cs_timer -= 1
+        if cs_timer <= 0:
+            cs_index += 1
+            if cs_index < len(CHASE_SCATTER):
+                cs_timer = CHASE_SCATTER[cs_index] * pacman.FPS if CHASE_SCATTER[cs_index] > 0 else 999999
+            pacman.global_current_mode = 'scatter' if cs_index % 2 == 0 else 'chase'
+            for g in ghosts:
+                if g.mode not in ('frightened', 'eaten', 'pen'):
+                    g.mode = pacman.global_current_mode
+        player.update()
+        for g in ghosts:
+            g.update()
+        for g in ghosts:
+            if pacman.distance(player.pos, g.pos) < pacman.TILE_SIZE // 2:
+                if g.mode == 'frightened':
+                    g.mode = 'eaten'
+                    pacman.eaten_multiplier *= 2
+                elif g.mode != 'eaten':
+                    pacman.reset_positions()
+                    break
+        if not player.power:
+            pacman.eaten_multiplier = 1
+        if pacman.state == 'cleared':
+            pacman.reset_maze()
+            pacman.reset_positions()
+            pacman.state = 'gameplay'
+
+    for frame in range(WARMUP):
+        step(frame)
+    tracemalloc.start()
+    # reading the counters allocates too; a frame that does nothing measures that
+    idle, _ = traced(lambda frame: None, range(frames))
+    transient, net = traced(step, range(WARMUP, WARMUP + frames))
+    transient = [t - min(idle) for t in transient]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for frame in range(WARMUP + frames, WARMUP + 2 * frames):
+        step(frame)
+    elapsed = (time.perf_counter() - start) * 1e6 / frames
+    transient.sort()
+    report(f"Grok Pac-Man simulation: {frames} frames, player + {len(ghosts)} ghosts", [
+        ("transient mean", sum(transient) / frames, "bytes/frame"),
+        ("transient p99", transient[int(frames * 0.99)], "bytes/frame"),
+        ("net total", sum(net), "bytes"),
+        ("step", elapsed, "us/frame"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchPacmanStepper.py
+# Cost of grid movement in PacMan/pacmanGPT5_2.py: TileStepper.tick and Ghost.choose_dir,
+# which read the per-tile exit tables Maze.parse builds, and the whole Game.update step.
+#
+# A headless game is driven at the fixed 240 Hz simulation step with seeded random arrow
+# keys (a new one every half second), restarting on game over. The movement calls are
+# timed inside that run, so they see the mix of turns, stops, tunnel wraps and ghost
+# states a real game produces.
+#
+# Usage: python Benchmarks/benchPacmanStepper.py [ticks]
+
+import random
+import sys
+import time
+
+import pygame
+
+from benchUtils import load_game, report, use_dummy_sdl
+
+
+class Keys:
+    def __init__(self):
+        self.held = None
+
+    def __getitem__(self, key):
+        return key == self.held
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    use_dummy_sdl()
+    pacman = load_game("PacMan/pacmanGPT5_2.py")
+    random.seed(0)
+    rng = random.Random(0)
+    spent = {"tick": 0.0, "choose_dir": 0.0}
+    calls = {"tick": 0, "choose_dir": 0}
+
+    def timed(name, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            spent[name] += time.perf_counter() - start
+            calls[name] += 1
+            return result
+        return wrapper
+
+    pacman.TileStepper.tick = timed("tick", pacman.TileStepper.tick)
+    pacman.Ghost.choose_dir = timed("choose_dir", pacman.Ghost.choose_dir)
+
+    keys = Keys()
+    game = pacman.Game(None, None, None)
+    game.started = True
+    games = 1
+    start = time.perf_counter()
+    for t in range(ticks):
+        if t % (pacman.SIM_HZ // 2) == 0:
+            keys.held = rng.choice((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN))
+        if game.game_over:
+            game = pacman.Game(None, None, None)
+            game.started = True
+            games += 1
+        game.update(pacman.DT, keys)
+    elapsed = time.perf_counter() - start
+    report(f"GPT5_2 Pac-Man movement: {ticks} ticks at {pacman.SIM_HZ} Hz over {games} games", [
+        ("TileStepper.tick", spent["tick"] * 1e6 / calls["tick"], "us/call"),
+        ("Ghost.choose_dir", spent["choose_dir"] * 1e6 / calls["choose_dir"], "us/call"),
+        ("Game.update", elapsed * 1e6 / ticks, "us/tick"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchPacmanWallCollision.py
+# Per-frame wall collision cost in PacMan/pacmanGemini2.5ProPrompt2.py as the wall count
+# grows: the WallGrid tile lookup the game uses now against the old scan of every wall
+# sprite (`any(wall.rect.colliderect(r) for wall in walls)`).
+#
+# One frame's worth of queries is what the game asks for: the player's turn test and
+# hit test, plus three candidate directions for each of four ghosts at an intersection.
+# The maze is tiled k x k times to raise the wall count; the query rects stay the same.
+#
+# Usage: python Benchmarks/benchPacmanWallCollision.py [max tiling]
+
+import random
+import sys
+
+import pygame
+
+from benchUtils import load_game, per_call_ms, report, use_dummy_sdl
+
+QUERIES_PER_FRAME = 2 + 4 * 3
+
+
+def main():
+    max_k = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    use_dummy_sdl()
+    pacman = load_game("PacMan/pacmanGemini2.5ProPrompt2.py")
+    tile = pacman.TILE_SIZE
+    rng = random.Random(0)
+    # sprite-sized rects nudged off open tiles of the original maze, as move() builds them
+    open_tiles = [(x, y) for y, row in enumerate(pacman.LEVEL) for x, ch in enumerate(row) if ch != '1']
+    queries = []
+    for _ in range(QUERIES_PER_FRAME):
+        x, y = rng.choice(open_tiles)
+        r = pygame.Rect(0, 0, tile, tile)
+        r.center = (x * tile + tile // 2 + rng.choice((-2, 0, 2)), y * tile + tile // 2 + rng.choice((-2, 0, 2)))
+        queries.append(r)
+
+    k = 1
+    while k <= max_k:
+        level = [row * k for row in pacman.LEVEL] * k
+        grid = pacman.WallGrid(level)
+        walls = [pacman.Wall(x * tile, y * tile)
+                 for y, row in enumerate(level) for x, ch in enumerate(row) if ch == '1']
+        report(f"Pac-Man (Gemini Prompt2) walls: maze x{k * k}, {len(walls)} walls, "
+               f"{QUERIES_PER_FRAME} queries/frame", [
+            ("tile grid", per_call_ms(lambda: [grid.collides(r) for r in queries], 2000) * 1000.0,
+             "us/frame"),
+            ("sprite scan", per_call_ms(lambda: [any(w.rect.colliderect(r) for w in walls)
+                                                 for r in queries], 20) * 1000.0, "us/frame"),
+        ])
+        k *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchTankAIScheduler.py
+# Per-frame enemy AI time in Best/tank_duelGrok4GPT5Improved.py with and without the
+# AIScheduler's frame budget.
+#
+# "every frame" is AI_FRAME_BUDGET = None: each enemy runs check_los every frame and
+# repaths (bfs) whenever its path_timer runs out, so the timers of tanks spawned together
+# fire on the same frames. "budgeted" is the game's default budget of think units. Both
+# run the same seeded level for the same number of frames with the player standing still;
+# the table shows the spread of Arena.ai_time per frame. "clustered" starts every enemy on
+# a ring just inside AI_NEAR_DIST of the player, so all of them are urgent at once and
+# far more want to think than the budget covers. "never thought" counts the enemies still
+# alive at the end that did not think once; the round-robin must bring it to 0.
+#
+# Usage: python Benchmarks/benchTankAIScheduler.py [level] [frames] [arena size]
+
+import math
+import random
+import sys
+
+import pygame
+
+from benchUtils import load_game, report, use_dummy_sdl
+
+
+class NoKeys:
+    def __getitem__(self, key):
+        return False
+
+
+def frame_times(tank, level, frames, budget, clustered=False):
+    """Sorted AI ms per frame, and how many live enemies never thought."""
+    tank.AI_FRAME_BUDGET = budget
+    random.seed(3)
+    arena = tank.Arena()
+    arena.level = level
+    arena.new_game()
+    arena.player.alive = False  # a target that never fights back keeps every level comparable
+    if clustered:
+        px, py = arena.player.center
+        radius = tank.AI_NEAR_DIST * 0.8
+        for i, enemy in enumerate(arena.enemies):
+            angle = 2 * math.pi * i / len(arena.enemies)
+            enemy.rect.center = (int(px + radius * math.cos(angle)), int(py + radius * math.sin(angle)))
+    thought = set()
+    update_ai = tank.Tank.update_ai
+
+    def counting_update_ai(enemy, dt, player, block_positions, think=True):
+        if think:
+            thought.add(id(enemy))
+        return update_ai(enemy, dt, player, block_positions, think)
+
+    tank.Tank.update_ai = counting_update_ai
+    times = []
+    try:
+        for _ in range(frames):
+            before = arena.ai_time
+            arena.update(1.0 / 60, NoKeys())
+            times.append((arena.ai_time - before) * 1000.0)
+    finally:
+        tank.Tank.update_ai = update_ai
+    never = sum(1 for e in arena.enemies if e.alive and id(e) not in thought)
+    return sorted(times), never
+
+
+def main():
+    level = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    use_dummy_sdl()
+    pygame.init()
+    tank = load_game("Best/tank_duelGrok4GPT5Improved.py")
+    if size:
+        tank.set_arena_size(size)
+    default_budget = tank.AI_FRAME_BUDGET
+    for title, budget, clustered in (("every frame", None, False), ("budgeted", default_budget, False),
+                                     ("budgeted, clustered", default_budget, True)):
+        t, never = frame_times(tank, level, frames, budget, clustered)
+        report(f"Tank Duel AI, {title}: level {level} ({2 ** (level - 1)} enemies), "
+               f"{tank.COLS}x{tank.ROWS}, {frames} frames", [
+            ("mean", sum(t) / len(t), "ms/frame"),
+            ("p95", t[int(len(t) * 0.95)], "ms/frame"),
+            ("max", t[-1], "ms/frame"),
+            ("never thought", never, "enemies"),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchTankBullets.py
+# Bullet update time in Best/tank_duelGrok4GPT5Improved.py, before and after the
+# NumPy structure-of-arrays BulletPool.
+#
+# "before" replays the old per-object loop (a Bullet per shot, moved one by one, hit-tested
+# against the block set, the player and every enemy, removed with list.remove); "after" is
+# Arena.update_bullets. Both keep the same number of bullets in flight on a large arena full
+# of enemies: each step tops the count back up with shots fired from random tanks.
+#
+# Usage: python Benchmarks/benchTankBullets.py [bullets] [arena size] [level]
+
+import random
+import sys
+
+import pygame
+
+from benchUtils import load_game, per_call_ms, report, use_dummy_sdl
+
+
+class LegacyBullet:
+    def __init__(self, tank, pos, dir_vec, owner):
+        offset = tank.CELL_SIZE * 0.7
+        self.pos = [pos[0] + dir_vec[0] * offset, pos[1] + dir_vec[1] * offset]
+        self.dir = dir_vec
+        self.speed = tank.BULLET_SPEED
+        self.owner = owner
+
+    def update(self, dt):
+        self.pos[0] += self.dir[0] * self.speed * dt
+        self.pos[1] += self.dir[1] * self.speed * dt
+
+
+def legacy_update(tank, arena, bullets, dt):
+    player = arena.player
+    for bullet in bullets[:]:
+        bullet.update(dt)
+        x, y = bullet.pos
+        out = not (0 < x < tank.WIDTH and 0 < y < tank.HEIGHT)
+        exploded = (int(y) // tank.CELL_SIZE, int(x) // tank.CELL_SIZE) in arena.block_positions
+        if not exploded and player.alive and player.rect.collidepoint(bullet.pos) and bullet.owner == 'ai':
+            exploded = True
+        if not exploded and bullet.owner == 'player':
+            for enemy in arena.enemies:
+                if enemy.alive and enemy.rect.collidepoint(bullet.pos):
+                    exploded = True
+                    break
+        if out or exploded:
+            arena.explosions.append(tank.Explosion((x, y), arena.explosion_radius(bullet.owner)))
+            bullets.remove(bullet)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    level = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    use_dummy_sdl()
+    pygame.init()
+    tank = load_game("Best/tank_duelGrok4GPT5Improved.py")
+    tank.set_arena_size(size)
+    random.seed(5)
+    arena = tank.Arena()
+    arena.level = level
+    arena.new_game()
+    tanks = [arena.player] + arena.enemies
+    dirs = list(tank.DIRECTIONS.values())
+    dt = 1.0 / 60
+    rng = random.Random(7)
+
+    def shot():
+        t = rng.choice(tanks)
+        return t.center, rng.choice(dirs), 'player' if t is arena.player or rng.random() < 0.5 else 'ai'
+
+    legacy = []
+
+    def before():
+        while len(legacy) < count:
+            pos, d, owner = shot()
+            legacy.append(LegacyBullet(tank, pos, d, owner))
+        legacy_update(tank, arena, legacy, dt)
+        arena.explosions.clear()
+
+    pool = arena.bullets
+
+    def after():
+        while len(pool) < count:
+            pos, d, owner = shot()
+            pool.spawn(pos, d, tank.OWNER_PLAYER if owner == 'player' else tank.OWNER_AI)
+        arena.update_bullets(dt)
+        arena.explosions.clear()
+
+    t_before = per_call_ms(before, 200)
+    t_after = per_call_ms(after, 200)
+    report(f"Tank Duel: {count} bullets, {size}x{size} arena, {len(arena.enemies)} enemies", [
+        ("before (Bullet objects)", t_before, "ms/step"),
+        ("after (BulletPool)", t_after, "ms/step"),
+        ("speedup", t_before / t_after, "x"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
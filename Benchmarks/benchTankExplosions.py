@@ -0,0 +1,77 @@
+# benchTankExplosions.py
+# Explosion draw time in Best/tank_duelGrok4GPT5Improved.py, before and after the
+# pre-rendered animation frames.
+#
+# "before" replays the original Explosion.draw (a fresh SRCALPHA surface per explosion
+# per frame, two filled circles, three rings and 18 trig sparks); "after" blits the
+# cached frame. Each frame draws a batch of live explosions spread across their lifetime.
+#
+# Usage: python Benchmarks/benchTankExplosions.py [explosions]
+
+import math
+import random
+import sys
+
+import pygame
+
+from benchUtils import load_game, per_call_ms, report, use_dummy_sdl
+
+
+def legacy_draw(tank, ex, screen):
+    SRCALPHA = pygame.SRCALPHA
+    t = tank.clamp(ex.age / ex.duration, 0.0, 1.0)
+    R = int(ex.radius * (0.6 + 0.6 * t))
+    alpha = int(220 * (1.0 - t))
+    surf = pygame.Surface((R*2+4, R*2+4), SRCALPHA)
+    pygame.draw.circle(surf, (255, 200, 60, alpha), (R+2, R+2), int(R*0.7))
+    pygame.draw.circle(surf, (255, 120, 20, alpha), (R+2, R+2), int(R*0.4))
+    screen.blit(surf, (ex.pos[0]-R-2, ex.pos[1]-R-2))
+    for i in range(3):
+        rr = int(ex.radius * (0.35 + 0.25 * i + 0.4*t))
+        pygame.draw.circle(screen, (255, 180, 40), (int(ex.pos[0]), int(ex.pos[1])), rr, 2)
+    for ang in ex.spark_angles:
+        L = int(ex.radius * (0.3 + 0.7 * t))
+        x2 = int(ex.pos[0] + math.cos(ang) * L)
+        y2 = int(ex.pos[1] + math.sin(ang) * L)
+        pygame.draw.line(screen, (255, 230, 120), (int(ex.pos[0]), int(ex.pos[1])), (x2, y2), 2)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    use_dummy_sdl()
+    pygame.init()
+    tank = load_game("Best/tank_duelGrok4GPT5Improved.py")
+    screen = pygame.display.set_mode((tank.WIDTH, tank.HEIGHT))
+    rng = random.Random(3)
+    radii = tank.PLAYER_WEAPON_RADII + [tank.ENEMY_EXPLOSION_RADIUS]
+    explosions = []
+    for i in range(count):
+        ex = tank.Explosion((rng.uniform(0, tank.WIDTH), rng.uniform(0, tank.HEIGHT)), radii[i % len(radii)])
+        ex.age = ex.duration * i / count
+        ex.spark_angles = [rng.uniform(0, math.tau) for _ in range(tank.SPARKS)]
+        explosions.append(ex)
+
+    def before():
+        for ex in explosions:
+            legacy_draw(tank, ex, screen)
+
+    def after():
+        for ex in explosions:
+            ex.draw(screen)
+
+    warm = per_call_ms(tank.warm_explosion_frames, 1)
+    cached_bytes = sum(s.get_width() * s.get_height() * 4
+                       for frames in tank._explosion_frames.values() for s, _ in frames)
+    t_before = per_call_ms(before, 100)
+    t_after = per_call_ms(after, 100)
+    report(f"Tank Duel: {count} live explosions per frame", [
+        ("before (drawn per frame)", t_before, "ms/frame"),
+        ("after (cached frames)", t_after, "ms/frame"),
+        ("speedup", t_before / t_after, "x"),
+        ("one-time frame build", warm, "ms"),
+        ("frame cache size", cached_bytes / 1e6, "MB"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
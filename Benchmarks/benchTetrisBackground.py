@@ -0,0 +1,65 @@
+# benchTetrisBackground.py
+# Per-frame draw time for the four Tetris variants that now cache their static
+# playfield/panel geometry in a BackgroundCache.
+#
+# "static layer" is what each frame used to redraw (fill, well/panels, grid lines,
+# fixed labels), timed by calling the cache's render function directly; "cached blit"
+# is what replaces it now. "frame" is the game's whole draw call with the cache warm.
+#
+# Usage: python Benchmarks/benchTetrisBackground.py [repeat]
+
+import sys
+
+import pygame
+
+from benchUtils import load_game, per_call_ms, report, use_dummy_sdl
+
+
+def bench(title, cache, theme, draw_frame, repeat):
+    target = pygame.display.get_surface()
+    scratch = target.copy()
+    draw_frame()  # warm the cache
+    static = per_call_ms(lambda: cache.render(scratch), repeat)
+    cached = per_call_ms(lambda: cache.blit(scratch, theme), repeat)
+    frame = per_call_ms(draw_frame, repeat)
+    report(title, [
+        ("static layer, redrawn", static, "ms"),
+        ("static layer, cached blit", cached, "ms"),
+        ("saved per frame", static - cached, "ms"),
+        ("whole frame, cached", frame, "ms"),
+    ])
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    use_dummy_sdl()
+    pygame.init()
+
+    best = load_game("Best/tetrisGPT5.py")
+    screen = pygame.display.set_mode((best.SCREEN_W, best.SCREEN_H))
+    font_small = pygame.font.SysFont("consolas", 20)
+    font_big = pygame.font.SysFont("consolas", 28, bold=True)
+    game = best.Game(best.Game.MODE_MARATHON)
+    bench("Best/tetrisGPT5 Game.draw", best.WELL_BACKGROUND, (best.BG, best.GRID, best.WELL_BG),
+          lambda: game.draw(screen, font_small, font_big), repeat)
+
+    gpt = load_game("Tetris/tetrisGPT5_2.py")
+    screen = pygame.display.set_mode((gpt.WIN_W, gpt.WIN_H))
+    board = gpt.Board()
+    bench("Tetris/tetrisGPT5_2 draw_board", gpt.BOARD_BACKGROUND,
+          (gpt.BG, gpt.GRID_BG, gpt.GRID_LINE, gpt.PANEL_BG, gpt.MUTED),
+          lambda: gpt.draw_board(screen, board), repeat)
+
+    grok = load_game("Tetris/tetrisGrok2.py")
+    game = grok.Game()
+    bench("Tetris/tetrisGrok2 Game.draw_hud", grok.HUD_BACKGROUND,
+          (grok.BLACK, grok.GRAY, grok.DARK_GRAY, grok.WHITE), game.draw_hud, repeat)
+
+    gemini = load_game("Tetris/tetrisGemini2.5Pro2.py")
+    game = gemini.TetrisGame()
+    bench("Tetris/tetrisGemini2.5Pro2 TetrisGame.draw_window", game.background, None,
+          game.draw_window, repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchUtils.py
+# Shared helpers for the headless benchmarks in this folder.
+#
+# The game files are plain scripts (some with dots in their names), so they are
+# loaded by path instead of imported. SDL is pointed at the dummy video/audio
+# drivers first so nothing opens a window.
+
+import importlib.util
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_dummy_sdl():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+
+def load_game(rel_path, name=None):
+    """Load a game script (path relative to the repo root) as a module without running main()."""
+    use_dummy_sdl()
+    path = os.path.join(REPO_ROOT, rel_path)
+    # games may import modules that sit next to them
+    if os.path.dirname(path) not in sys.path:
+        sys.path.insert(0, os.path.dirname(path))
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0].replace(".", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def rate(fn, seconds=1.0):
+    """Call fn() repeatedly for ~seconds; return calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    now = start
+    while now < deadline:
+        for _ in range(100):
+            fn()
+        calls += 100
+        now = time.perf_counter()
+    return calls / (now - start)
+
+
+def per_call_ms(fn, repeat=200):
+    """Average wall time of fn() in milliseconds over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def report(title, rows):
+    """Print (label, value, unit) rows as an aligned table."""
+    print(title)
+    width = max(len(label) for label, _, _ in rows)
+    for label, value, unit in rows:
+        print(f"  {label:<{width}}  {value:>14,.1f} {unit}")
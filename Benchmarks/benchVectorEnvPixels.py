@@ -0,0 +1,48 @@
+# benchVectorEnvPixels.py
+# Pixel observations of Best/vectorEnv.py when the caller keeps them, as replay buffers and
+# frame stacks do.
+#
+# observation="pixels" hands out pygame.surfarray.pixels3d views, which lock their surface.
+# For every game this holds the first observation of instance 0 while stepping, with a
+# stack of the last `stack` observations kept as well, and compares the held frame to a
+# copy taken when it was returned. "kept frame changed" is the number of differing pixel
+# values and must be 0; a failed redraw onto a locked surface would raise instead. The
+# step rate is for the whole batch, with the stack kept.
+#
+# Usage: python Benchmarks/benchVectorEnvPixels.py [steps] [envs] [stack]
+
+import os
+import sys
+import time
+from collections import deque
+
+from benchUtils import REPO_ROOT, report, use_dummy_sdl
+
+sys.path.insert(0, os.path.join(REPO_ROOT, "Best"))
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    num_envs = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    stack = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    use_dummy_sdl()
+    import vectorEnv  # noqa: E402  (after the SDL drivers are set)
+
+    for game in vectorEnv.GAMES:
+        env = vectorEnv.VectorEnv(game, num_envs, seed=0, observation="pixels")
+        kept = env.reset()[0]
+        snapshot = kept.copy()
+        frames = deque(maxlen=stack)
+        start = time.perf_counter()
+        for _ in range(steps):
+            obs, _, _, _ = env.step(env.sample_actions())
+            frames.append(obs[0])
+        elapsed = time.perf_counter() - start
+        report(f"VectorEnv pixels, {game}: {num_envs} envs, {steps} steps, last {stack} frames kept", [
+            ("steps", steps * num_envs / elapsed, "env steps/s"),
+            ("kept frame changed", int((kept != snapshot).sum()), "values"),
+        ])
+
+
+if __name__ == "__main__":
+    main()
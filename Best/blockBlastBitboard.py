@@ -0,0 +1,322 @@
+# blockBlastBitboard.py
+# Bitboard core for Best/blockBlastGPT5.py: shapes, placement masks, line clears and the
+# tray solver. Pure Python, no pygame.
+#
+# A board is one int with bit r * n + c set for each filled cell (r, c) of an n x n grid.
+# Every legal-in-bounds position of every shape is precomputed as a Placement mask, so
+# "does it fit" is `board & mask == 0` and placing is `board | mask`.
+
+import itertools
+import time
+
+# --------------------------
+# Shapes (no rotation)
+# Each shape is a list of coordinate tuples relative to (0,0)
+# --------------------------
+def shape_from_matrix(mat):
+    cells = []
+    for r, row in enumerate(mat):
+        for c, v in enumerate(row):
+            if v:
+                cells.append((r, c))
+    return norm_shape(cells)
+
+def norm_shape(cells):
+    # normalize so smallest r,c starts at (0,0)
+    min_r = min(r for r, _ in cells)
+    min_c = min(c for _, c in cells)
+    return sorted([(r - min_r, c - min_c) for r, c in cells])
+
+# A curated set (small to medium) to fit 8x8 well
+SHAPES = [
+    # singles / dominos
+    shape_from_matrix([[1]]),
+    shape_from_matrix([[1,1]]),
+    shape_from_matrix([[1],[1]]),
+    # tri-lines
+    shape_from_matrix([[1,1,1]]),
+    shape_from_matrix([[1],[1],[1]]),
+    # 2x2 square
+    shape_from_matrix([[1,1],[1,1]]),
+    # L-2x3 variants
+    shape_from_matrix([[1,0],[1,0],[1,1]]),
+    shape_from_matrix([[0,1],[0,1],[1,1]]),
+    shape_from_matrix([[1,1],[1,0],[1,0]]),
+    shape_from_matrix([[1,1],[0,1],[0,1]]),
+    # T shapes
+    shape_from_matrix([[1,1,1],[0,1,0]]),
+    shape_from_matrix([[0,1,0],[1,1,1]]),
+    # 3-block corner
+    shape_from_matrix([[1,1],[1,0]]),
+    shape_from_matrix([[1,1],[0,1]]),
+    # plus sign (3x3 light)
+    shape_from_matrix([[0,1,0],[1,1,1],[0,1,0]]),
+]
+
+def clear_points(n_lines):
+    """Score for clearing n_lines rows/columns with one placement."""
+    if n_lines <= 0:
+        return 0
+    return 100 * n_lines + 50 * (n_lines - 1)
+
+# --------------------------
+# Geometry: masks for one board size
+# --------------------------
+class Placement:
+    __slots__ = ("mask", "r", "c", "lines", "shape", "index")
+
+    def __init__(self, mask, r, c, lines, shape, index):
+        self.mask = mask    # bits covered by the shape at top-left (r, c)
+        self.r = r
+        self.c = c
+        self.lines = lines  # row/column masks this placement can complete
+        self.shape = shape  # index into SHAPES
+        self.index = index  # position among all placements of this geometry
+
+class Geometry:
+    """Row, column and placement masks for an n x n board."""
+
+    def __init__(self, n):
+        self.n = n
+        self.full = (1 << (n * n)) - 1
+        row = (1 << n) - 1
+        self.rows = [row << (r * n) for r in range(n)]
+        col = sum(1 << (r * n) for r in range(n))
+        self.cols = [col << c for c in range(n)]
+        self.first_col = self.cols[0]
+        self.last_col = self.cols[-1]
+        self.first_row = self.rows[0]
+        self.last_row = self.rows[-1]
+        # every shape at every in-bounds top-left, in row-major order
+        self.placements = []
+        self.anchors = []  # per shape: (rows, cols) of in-bounds top-left positions
+        self.covering = [[] for _ in range(n * n)]  # per cell: the placements over it
+        index = 0
+        for shape, cells in enumerate(SHAPES):
+            h = max(r for r, _ in cells) + 1
+            w = max(c for _, c in cells) + 1
+            shape_mask = sum(1 << (r * n + c) for r, c in cells)
+            self.anchors.append((n - h + 1, n - w + 1))
+            spots = []
+            for r in range(n - h + 1):
+                for c in range(n - w + 1):
+                    lines = tuple(self.rows[r:r + h]) + tuple(self.cols[c:c + w])
+                    p = Placement(shape_mask << (r * n + c), r, c, lines, shape, index)
+                    spots.append(p)
+                    for dr, dc in cells:
+                        self.covering[(r + dr) * n + c + dc].append(p)
+                    index += 1
+            self.placements.append(spots)
+        self.n_placements = index
+
+    def bit(self, r, c):
+        return 1 << (r * self.n + c)
+
+    def placement(self, shape, r, c):
+        """Placement of `shape` with its top-left at (r, c), or None if it leaves the board."""
+        rows, cols = self.anchors[shape]
+        if 0 <= r < rows and 0 <= c < cols:
+            return self.placements[shape][r * cols + c]
+        return None
+
+    def place(self, board, placement):
+        """Board after placing (no overlap check) and clearing full lines; returns (board, n_lines)."""
+        board |= placement.mask
+        cleared = 0
+        n_lines = 0
+        for line in placement.lines:
+            if board & line == line:
+                cleared |= line
+                n_lines += 1
+        return board & ~cleared, n_lines
+
+    def fits_anywhere(self, board, shape):
+        for p in self.placements[shape]:
+            if not board & p.mask:
+                return True
+        return False
+
+    def evaluate(self, board):
+        """Heuristic board quality (higher is better): few filled cells, smooth edges, no holes."""
+        n = self.n
+        empty = self.full & ~board
+        # filled/empty edges between neighbours; the border counts as filled
+        edges = ((board ^ (board >> 1)) & ~self.last_col & self.full).bit_count()
+        edges += ((board ^ (board >> n)) & ~self.last_row & self.full).bit_count()
+        edges += (empty & self.first_col).bit_count() + (empty & self.last_col).bit_count()
+        edges += (empty & self.first_row).bit_count() + (empty & self.last_row).bit_count()
+        # empty cells with no empty neighbour fit only the single-cell shape
+        open_nbr = (((empty >> 1) & ~self.last_col) | ((empty << 1) & ~self.first_col)
+                    | (empty >> n) | (empty << n)) & self.full
+        holes = (empty & ~open_nbr).bit_count()
+        return -10 * board.bit_count() - 6 * edges - 30 * holes
+
+_geometries = {}
+
+def geometry(n):
+    geo = _geometries.get(n)
+    if geo is None:
+        geo = _geometries[n] = Geometry(n)
+    return geo
+
+# --------------------------
+# Incremental legal-placement counts
+# --------------------------
+class LegalCounts:
+    """Number of legal placements of each shape on a board that changes a few cells at a time.
+
+    blocked[p.index] is how many filled cells lie under placement p; a placement is legal
+    while that is 0. update() walks Geometry.covering for the cells that changed only, so
+    "can any tray piece still move" is a lookup in counts instead of a scan of the board.
+    """
+
+    def __init__(self, geo):
+        self.geo = geo
+        self.board = 0
+        self.blocked = [0] * geo.n_placements
+        self.counts = [len(spots) for spots in geo.placements]
+
+    def update(self, board):
+        blocked = self.blocked
+        counts = self.counts
+        covering = self.geo.covering
+        filled = board & ~self.board
+        while filled:
+            low = filled & -filled
+            filled ^= low
+            for p in covering[low.bit_length() - 1]:
+                if not blocked[p.index]:
+                    counts[p.shape] -= 1
+                blocked[p.index] += 1
+        emptied = self.board & ~board
+        while emptied:
+            low = emptied & -emptied
+            emptied ^= low
+            for p in covering[low.bit_length() - 1]:
+                blocked[p.index] -= 1
+                if not blocked[p.index]:
+                    counts[p.shape] += 1
+        self.board = board
+
+# --------------------------
+# Tray solver
+# --------------------------
+STUCK_PENALTY = 10000  # per piece left in the tray with nowhere to go
+SOLVER_WIDTHS = (1, 2, 3, 5, 8, 13, None)  # beam widths tried in turn; None = every child
+
+class OutOfTime(Exception):
+    pass
+
+def solve_tray(geo, board, shapes, budget=0.002):
+    """Best way to play a tray of shape indices on `board`.
+
+    Searches placement orders and positions, clearing lines between placements, and scores
+    a line of play as points gained plus Geometry.evaluate of the final board. Children are
+    ranked by their one-move score and searched with a widening beam (SOLVER_WIDTHS): width
+    1 is greedy, None is every order and every position. Each width memoizes on (board,
+    remaining shapes), so orders that reach the same board are searched once, and child
+    lists and fully searched subtrees are kept across widths. Every width runs against the
+    deadline, child generation included, and the widest search that finishes within
+    `budget` seconds wins. Before any of them, a first-fit pass plays each order of the tray
+    with every piece at its first free position (placement order, no evaluation of the
+    candidates), so there is an answer even when the greedy pass does not fit in the budget,
+    as on the larger boards; whichever of the two scores higher is returned.
+
+    Returns (moves, value, exhaustive): moves is a list of (index into `shapes`, Placement)
+    in play order, exhaustive is True when every order and position was searched.
+    """
+    deadline = time.perf_counter() + budget
+    children_of = {}
+    exact = {}  # results of subtrees searched without any cut: valid at every width
+
+    def children(board, remaining):
+        key = (board, remaining)
+        kids = children_of.get(key)
+        if kids is None:
+            kids = []
+            for i, shape in enumerate(remaining):
+                if shape in remaining[:i]:
+                    continue  # same shape, same subtree
+                rest = remaining[:i] + remaining[i + 1:]
+                for p in geo.placements[shape]:
+                    if not board & p.mask:
+                        if time.perf_counter() > deadline:
+                            raise OutOfTime()  # one shape's placements can outlast the budget
+                        after, n_lines = geo.place(board, p)
+                        gain = clear_points(n_lines)
+                        kids.append((gain + geo.evaluate(after), gain, after, rest, shape, p))
+            kids.sort(key=lambda ch: ch[0], reverse=True)
+            children_of[key] = kids
+        return kids
+
+    def search(board, remaining, width, memo):
+        key = (board, remaining)
+        hit = exact.get(key) or memo.get(key)
+        if hit is not None:
+            return hit
+        if time.perf_counter() > deadline:
+            raise OutOfTime()
+        kids = children(board, remaining)
+        if not kids:
+            best = (geo.evaluate(board) - STUCK_PENALTY * len(remaining), (), True)
+        elif len(remaining) == 1:
+            # last piece: the one-move score is exact
+            score, _, _, _, shape, p = kids[0]
+            best = (score, ((shape, p),), True)
+        else:
+            best = None
+            complete = width is None or len(kids) <= width
+            for _, gain, after, rest, shape, p in kids[:width]:
+                value, line, done = search(after, rest, width, memo)
+                complete = complete and done
+                value += gain
+                if best is None or value > best[0]:
+                    best = (value, ((shape, p),) + line)
+            best += (complete,)
+        (exact if best[2] else memo)[key] = best
+        return best
+
+    first_free = {}
+
+    def first_fit(remaining):
+        best = None
+        for order in set(itertools.permutations(remaining)):
+            b, value, line = board, 0, ()
+            for shape in order:
+                key = (b, shape)
+                p = first_free.get(key, False)
+                if p is False:
+                    p = first_free[key] = next((p for p in geo.placements[shape] if not b & p.mask), None)
+                if p is None:
+                    value -= STUCK_PENALTY
+                    continue
+                b, n_lines = geo.place(b, p)
+                value += clear_points(n_lines)
+                line += ((shape, p),)
+            value += geo.evaluate(b)
+            if best is None or value > best[0]:
+                best = (value, line, False)
+        return best
+
+    remaining = tuple(sorted(shapes))
+    fallback = first_fit(remaining)
+    result = None
+    for width in SOLVER_WIDTHS:
+        try:
+            result = search(board, remaining, width, {})
+        except OutOfTime:
+            break
+        if result[2]:
+            break  # nothing was cut: this was already the full search
+    if result is None or (not result[2] and fallback[0] > result[0]):
+        result = fallback
+    value, line, exhaustive = result
+
+    # map shapes back to tray positions
+    used = set()
+    moves = []
+    for shape, p in line:
+        i = next(i for i, s in enumerate(shapes) if s == shape and i not in used)
+        used.add(i)
+        moves.append((i, p))
+    return moves, value, exhaustive
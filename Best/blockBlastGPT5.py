@@ -4,13 +4,18 @@ import json
 import random
 from pathlib import Path
 
+from blockBlastBitboard import SHAPES, LegalCounts, geometry, solve_tray
+
 # --------------------------
 # Config
 # --------------------------
 WINDOW_W, WINDOW_H = 540, 900  # portrait
 FPS = 60
 
-GRID_SIZE = 8
+GRID_SIZE = 8  # cells per side; set_grid_size() changes it (8..MAX_GRID_SIZE)
+MAX_GRID_SIZE = 32
+GRID_FIT = 432  # pixels the grid may span; CELL shrinks so bigger boards still fit
+MAX_CELL = 54
 CELL = 54  # grid cell size in pixels
 GRID_PAD = 10
 GRID_W = GRID_SIZE * CELL
@@ -43,55 +48,27 @@ PIECE_COLORS = [
 FLASH_COLOR = (255, 255, 255)
 FLASH_MS = 220
 
-HIGHSCORE_FILE = Path("block_blast_highscore.json")
+AUTOPLAY_MS = 250          # between autoplay moves (longer than the clear flash)
+AUTOPLAY_RESTART_MS = 1000  # autoplay starts a new game after this long on game over
 
-# --------------------------
-# Shapes (no rotation)
-# Each shape is a list of coordinate tuples relative to (0,0)
-# --------------------------
-def shape_from_matrix(mat):
-    cells = []
-    for r, row in enumerate(mat):
-        for c, v in enumerate(row):
-            if v:
-                cells.append((r, c))
-    return norm_shape(cells)
-
-def norm_shape(cells):
-    # normalize so smallest r,c starts at (0,0)
-    min_r = min(r for r, _ in cells)
-    min_c = min(c for _, c in cells)
-    return sorted([(r - min_r, c - min_c) for r, c in cells])
-
-# A curated set (small to medium) to fit 8x8 well
-SHAPES = [
-    # singles / dominos
-    shape_from_matrix([[1]]),
-    shape_from_matrix([[1,1]]),
-    shape_from_matrix([[1],[1]]),
-    # tri-lines
-    shape_from_matrix([[1,1,1]]),
-    shape_from_matrix([[1],[1],[1]]),
-    # 2x2 square
-    shape_from_matrix([[1,1],[1,1]]),
-    # L-2x3 variants
-    shape_from_matrix([[1,0],[1,0],[1,1]]),
-    shape_from_matrix([[0,1],[0,1],[1,1]]),
-    shape_from_matrix([[1,1],[1,0],[1,0]]),
-    shape_from_matrix([[1,1],[0,1],[0,1]]),
-    # T shapes
-    shape_from_matrix([[1,1,1],[0,1,0]]),
-    shape_from_matrix([[0,1,0],[1,1,1]]),
-    # 3-block corner
-    shape_from_matrix([[1,1],[1,0]]),
-    shape_from_matrix([[1,1],[0,1]]),
-    # plus sign (3x3 light)
-    shape_from_matrix([[0,1,0],[1,1,1],[0,1,0]]),
-]
+HIGHSCORE_FILE = Path("block_blast_highscore.json")
 
 # --------------------------
 # Utility
 # --------------------------
+def set_grid_size(n):
+    """Resize the board and rescale the layout; call before creating a Game."""
+    global GRID_SIZE, CELL, GRID_W, GRID_H, GRID_LEFT
+    GRID_SIZE = min(max(int(n), 8), MAX_GRID_SIZE)
+    CELL = min(MAX_CELL, GRID_FIT // GRID_SIZE)
+    GRID_W = GRID_SIZE * CELL
+    GRID_H = GRID_SIZE * CELL
+    GRID_LEFT = (WINDOW_W - GRID_W) // 2
+
+def corner_radius(cell_size):
+    # rounded blocks at the default size, squarer as cells shrink on big boards
+    return min(8, cell_size // 6)
+
 def load_highscore():
     if HIGHSCORE_FILE.exists():
         try:
@@ -115,13 +92,45 @@ def draw_text(surface, text, x, y, font, color=TEXT_COLOR, center=False):
         rect.topleft = (x, y)
     surface.blit(img, rect)
 
+# Drag previews and overlays are built once and reused: drawing them allocates nothing
+_GHOST_CACHE = {}
+_SURFACE_POOL = {}
+
+def ghost_surface(cells, cell_size, valid):
+    """Translucent preview of a shape, built on first use per (shape, cell size, valid)."""
+    key = (tuple(cells), cell_size, valid)
+    ghost = _GHOST_CACHE.get(key)
+    if ghost is None:
+        color = GHOST_OK if valid else GHOST_BAD
+        h = max(r for r, _ in cells) + 1
+        w = max(c for _, c in cells) + 1
+        ghost = pygame.Surface((w * cell_size, h * cell_size), pygame.SRCALPHA)
+        ghost.fill((0,0,0,0))
+        cell = pygame.Surface((cell_size-3, cell_size-3), pygame.SRCALPHA)
+        cell.fill(color)
+        for r, c in cells:
+            ghost.blit(cell, (c * cell_size + 1, r * cell_size + 1))
+        _GHOST_CACHE[key] = ghost
+    return ghost
+
+def pooled_surface(size, rgba):
+    # read-only: callers blit it, never draw on it
+    key = (size, rgba)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        _SURFACE_POOL[key] = surf
+    return surf
+
 # --------------------------
 # Piece class for dragging
 # --------------------------
 class Piece:
-    def __init__(self, cells, color, scale=CELL):
-        # cells: list[(r,c)] relative
+    def __init__(self, cells, color, scale=CELL, shape=None):
+        # cells: list[(r,c)] relative; shape: index into SHAPES
         self.cells = cells
+        self.shape = shape
         self.color = color
         self.scale = scale
 
@@ -164,69 +173,78 @@ class Piece:
         for r, c in self.cells:
             rx = self.x + c * self.scale
             ry = self.y + r * self.scale
-            pygame.draw.rect(surf, self.color, (rx+2, ry+2, self.scale-4, self.scale-4), border_radius=8)
+            pygame.draw.rect(surf, self.color, (rx+2, ry+2, self.scale-4, self.scale-4), border_radius=corner_radius(self.scale))
 
     def draw_ghost_on_grid(self, surf, grid_origin, cell_size, valid):
         # draw semi-transparent overlay at nearest snapped grid pos (handled by caller)
-        color = GHOST_OK if valid else GHOST_BAD
-        ghost = pygame.Surface((self.w * cell_size, self.h * cell_size), pygame.SRCALPHA)
-        ghost.fill((0,0,0,0))
-        for r, c in self.cells:
-            rx = c * cell_size
-            ry = r * cell_size
-            cell = pygame.Surface((cell_size-3, cell_size-3), pygame.SRCALPHA)
-            cell.fill(color)
-            ghost.blit(cell, (rx+1, ry+1))
-        surf.blit(ghost, grid_origin)
+        surf.blit(ghost_surface(self.cells, cell_size, valid), grid_origin)
 
 # --------------------------
 # Board
 # --------------------------
 class Board:
-    def __init__(self, rows, cols):
-        self.r = rows
-        self.c = cols
-        self.cells = [[None for _ in range(cols)] for _ in range(rows)]  # store colors
+    def __init__(self, size):
+        self.n = size
+        self.geo = geometry(size)  # line and placement masks for this size
+        self.bits = 0  # occupancy: bit r * n + c set for each filled cell
+        self.colors = [None] * (size * size)  # color of each filled cell, same indexing
+        self.legal = LegalCounts(self.geo)  # legal placements per shape, kept in step with bits
 
         self.flash_timer = 0
         self.flash_coords = []  # list[(r,c)]
+        self.flash_mask = 0     # bits of flash_coords, cleared when the flash ends
+
+        self.version = 0      # bumped whenever cells change
+        self._hover_key = None  # (piece, top_r, left_c, version) of the last hover_valid
+        self._hover_valid = False
 
     def inside(self, rr, cc):
-        return 0 <= rr < self.r and 0 <= cc < self.c
+        return 0 <= rr < self.n and 0 <= cc < self.n
 
     def empty_at(self, rr, cc):
-        return self.inside(rr, cc) and self.cells[rr][cc] is None
+        return self.inside(rr, cc) and not self.bits >> (rr * self.n + cc) & 1
 
     def can_place(self, piece, top_r, left_c):
-        for dr, dc in piece.cells:
-            rr = top_r + dr
-            cc = left_c + dc
-            if not self.inside(rr, cc) or self.cells[rr][cc] is not None:
-                return False
-        return True
+        p = self.geo.placement(piece.shape, top_r, left_c)
+        return p is not None and not self.bits & p.mask
+
+    def hover_valid(self, piece, top_r, left_c):
+        """can_place for the drag preview, re-run only when the hover cell or board changes."""
+        key = self._hover_key
+        if (key is None or key[0] is not piece or key[1] != top_r or key[2] != left_c
+                or key[3] != self.version):
+            self._hover_key = (piece, top_r, left_c, self.version)
+            self._hover_valid = self.can_place(piece, top_r, left_c)
+        return self._hover_valid
 
     def place(self, piece, top_r, left_c):
+        self.bits |= self.geo.placement(piece.shape, top_r, left_c).mask
         for dr, dc in piece.cells:
-            rr = top_r + dr
-            cc = left_c + dc
-            self.cells[rr][cc] = piece.color
+            self.colors[(top_r + dr) * self.n + left_c + dc] = piece.color
+        self.legal.update(self.bits)
+        self.version += 1
 
     def find_full_lines(self):
-        full_rows = [r for r in range(self.r) if all(self.cells[r][c] is not None for c in range(self.c))]
-        full_cols = [c for c in range(self.c) if all(self.cells[r][c] is not None for r in range(self.r))]
+        bits = self.bits
+        full_rows = [r for r, line in enumerate(self.geo.rows) if bits & line == line]
+        full_cols = [c for c, line in enumerate(self.geo.cols) if bits & line == line]
         return full_rows, full_cols
 
     def clear_lines(self, rows, cols):
         coords = []
+        mask = 0
         for r in rows:
-            for c in range(self.c):
+            for c in range(self.n):
                 coords.append((r, c))
+            mask |= self.geo.rows[r]
         for c in cols:
-            for r in range(self.r):
+            for r in range(self.n):
                 coords.append((r, c))
+            mask |= self.geo.cols[c]
 
         # flash then clear
         self.flash_coords = coords
+        self.flash_mask = mask
         self.flash_timer = FLASH_MS
 
         # do the actual clear after flash ends; handled in update()
@@ -239,41 +257,44 @@ class Board:
             if self.flash_timer <= 0:
                 # time to clear
                 for (r, c) in self.flash_coords:
-                    self.cells[r][c] = None
+                    self.colors[r * self.n + c] = None
+                self.bits &= ~self.flash_mask
+                self.legal.update(self.bits)
                 self.flash_coords = []
+                self.flash_mask = 0
+                self.version += 1
+
+    def bitboard(self):
+        """Occupancy as an int (bit r * n + c), with cells waiting to be cleared already gone."""
+        return self.bits & ~self.flash_mask
 
     def any_placement_possible(self, piece):
-        for r in range(self.r):
-            for c in range(self.c):
-                if self.can_place(piece, r, c):
-                    return True
-        return False
+        return self.legal.counts[piece.shape] > 0
 
     def draw(self, surf):
         # grid bg
         pygame.draw.rect(surf, GRID_BG, (GRID_LEFT, GRID_TOP, GRID_W, GRID_H), border_radius=10)
         # grid lines
-        for i in range(self.r + 1):
+        for i in range(self.n + 1):
             y = GRID_TOP + i * CELL
             pygame.draw.line(surf, GRID_LINE, (GRID_LEFT, y), (GRID_LEFT + GRID_W, y), 1)
-        for j in range(self.c + 1):
+        for j in range(self.n + 1):
             x = GRID_LEFT + j * CELL
             pygame.draw.line(surf, GRID_LINE, (x, GRID_TOP), (x, GRID_TOP + GRID_H), 1)
-        # filled cells
-        for r in range(self.r):
-            for c in range(self.c):
-                color = self.cells[r][c]
-                if color:
-                    x = GRID_LEFT + c * CELL
-                    y = GRID_TOP + r * CELL
-                    pygame.draw.rect(surf, color, (x+2, y+2, CELL-4, CELL-4), border_radius=8)
+        # filled cells: walk the set bits only, lowest (top-left) first
+        bits = self.bits
+        radius = corner_radius(CELL)
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            r, c = divmod(low.bit_length() - 1, self.n)
+            x = GRID_LEFT + c * CELL
+            y = GRID_TOP + r * CELL
+            pygame.draw.rect(surf, self.colors[r * self.n + c], (x+2, y+2, CELL-4, CELL-4), border_radius=radius)
 
         # flash overlay
         if self.flash_timer > 0 and self.flash_coords:
-            alpha = 180
-            overlay = pygame.Surface((CELL-3, CELL-3))
-            overlay.fill(FLASH_COLOR)
-            overlay.set_alpha(alpha)
+            overlay = pooled_surface((CELL-3, CELL-3), (*FLASH_COLOR, 180))
             for (r, c) in self.flash_coords:
                 x = GRID_LEFT + c * CELL + 1
                 y = GRID_TOP + r * CELL + 1
@@ -290,9 +311,9 @@ STATE_GAMEOVER = "gameover"
 # Helpers
 # --------------------------
 def random_piece():
-    cells = random.choice(SHAPES)
+    shape = random.randrange(len(SHAPES))
     color = random.choice(PIECE_COLORS)
-    return Piece(cells, color, CELL)
+    return Piece(SHAPES[shape], color, CELL, shape)
 
 def new_tray_set():
     return [random_piece(), random_piece(), random_piece()]
@@ -346,10 +367,15 @@ def any_move_possible(board, tray_pieces):
 # Main Game
 # --------------------------
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False):
+        # headless: draw into an offscreen surface and never touch the highscore file
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
-        pygame.display.set_caption("Block Blast")
+        self.headless = headless
+        if headless:
+            self.screen = pygame.Surface((WINDOW_W, WINDOW_H))
+        else:
+            self.screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
+            pygame.display.set_caption("Block Blast")
         self.clock = pygame.time.Clock()
 
         self.font_title = pygame.font.SysFont("arialblack", 48)
@@ -357,7 +383,7 @@ class Game:
         self.font_big = pygame.font.SysFont("arialblack", 36)
 
         self.state = STATE_MENU
-        self.board = Board(GRID_SIZE, GRID_SIZE)
+        self.board = Board(GRID_SIZE)
         self.tray = []
         self.score = 0
         self.highscore = load_highscore()
@@ -367,6 +393,13 @@ class Game:
         self.pending_clear_points = 0
         self.just_cleared = False
 
+        # tray solver: H shows its plan, A lets it play (and restart) on its own
+        self.geometry = geometry(GRID_SIZE)
+        self.hint = False
+        self.autoplay = False
+        self.autoplay_timer = 0
+        self.plan = []  # [(tray slot, Placement)] in play order
+
         self.buttons = self.make_buttons()
 
     def make_buttons(self):
@@ -383,7 +416,7 @@ class Game:
         return buttons
 
     def reset_play(self):
-        self.board = Board(GRID_SIZE, GRID_SIZE)
+        self.board = Board(GRID_SIZE)
         self.tray = new_tray_set()
         # Lay pieces in tray slots
         for piece, rect in zip(self.tray, tray_layout_rects()):
@@ -401,11 +434,22 @@ class Game:
     def start_game(self):
         self.reset_play()
         self.state = STATE_PLAY
+        self.refresh_plan()
+
+    def refresh_plan(self):
+        """Re-solve the current tray (only while the hint or autoplay is on)."""
+        self.plan = []
+        if not (self.hint or self.autoplay) or self.state != STATE_PLAY:
+            return
+        slots = [i for i, p in enumerate(self.tray) if p is not None]
+        moves, _, _ = solve_tray(self.geometry, self.board.bitboard(), [self.tray[i].shape for i in slots])
+        self.plan = [(slots[i], placement) for i, placement in moves]
 
     def end_game(self):
         if self.score > self.highscore:
             self.highscore = self.score
-            save_highscore(self.highscore)
+            if not self.headless:
+                save_highscore(self.highscore)
         self.state = STATE_GAMEOVER
 
     # ------------- Event Handling -------------
@@ -447,6 +491,13 @@ class Game:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 self.start_game()
+            elif event.key == pygame.K_h:
+                self.hint = not self.hint
+                self.refresh_plan()
+            elif event.key == pygame.K_a:
+                self.autoplay = not self.autoplay
+                self.autoplay_timer = 0
+                self.refresh_plan()
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
@@ -472,40 +523,12 @@ class Game:
                 px, py, top_r, left_c = snapped_grid_origin_for_piece(self.drag_piece, mx, my)
                 placed = False
                 if px is not None:
-                    if self.board.can_place(self.drag_piece, top_r, left_c):
-                        self.board.place(self.drag_piece, top_r, left_c)
-                        placed = True
+                    self.drag_piece.stop_drag()
+                    placed = self.place_from_tray(self.drag_index, top_r, left_c)
 
                 if placed:
-                    # consume piece from tray
-                    self.tray[self.drag_index] = None
-                    self.drag_piece.stop_drag()
                     self.drag_piece = None
                     self.drag_index = -1
-
-                    # line clears
-                    rows, cols = self.board.find_full_lines()
-                    n_lines = len(rows) + len(cols)
-                    if n_lines > 0:
-                        # Start flash and schedule points after flash ends (we still add score immediately for simplicity)
-                        self.board.clear_lines(rows, cols)
-                        base = 100 * n_lines
-                        combo = 50 * max(0, (n_lines - 1))
-                        gain = base + combo
-                        self.score += gain
-                        self.just_cleared = True
-                    else:
-                        self.just_cleared = False
-
-                    # Refill tray when all three used
-                    if all(p is None for p in self.tray):
-                        self.tray = new_tray_set()
-                        for piece, rect in zip(self.tray, tray_layout_rects()):
-                            center_piece_in_rect(piece, rect)
-
-                    # After placement, if no move possible -> game over
-                    if not any_move_possible(self.board, self.tray):
-                        self.end_game()
                 else:
                     # snap back to tray slot
                     if self.drag_index != -1:
@@ -516,10 +539,63 @@ class Game:
                     self.drag_piece = None
                     self.drag_index = -1
 
+    def place_from_tray(self, index, top_r, left_c):
+        """Place tray piece `index` with its top-left at (top_r, left_c); False if it doesn't fit."""
+        piece = self.tray[index]
+        if piece is None or not self.board.can_place(piece, top_r, left_c):
+            return False
+        self.board.place(piece, top_r, left_c)
+        # consume piece from tray
+        self.tray[index] = None
+
+        # line clears
+        rows, cols = self.board.find_full_lines()
+        n_lines = len(rows) + len(cols)
+        if n_lines > 0:
+            # Start flash and schedule points after flash ends (we still add score immediately for simplicity)
+            self.board.clear_lines(rows, cols)
+            base = 100 * n_lines
+            combo = 50 * max(0, (n_lines - 1))
+            gain = base + combo
+            self.score += gain
+            self.just_cleared = True
+        else:
+            self.just_cleared = False
+
+        # Refill tray when all three used
+        if all(p is None for p in self.tray):
+            self.tray = new_tray_set()
+            for piece, rect in zip(self.tray, tray_layout_rects()):
+                center_piece_in_rect(piece, rect)
+
+        # After placement, if no move possible -> game over
+        if not any_move_possible(self.board, self.tray):
+            self.end_game()
+        self.refresh_plan()
+        return True
+
     # ------------- Update -------------
     def update(self, dt):
         if self.state == STATE_PLAY:
             self.board.commit_clears_if_due(dt)
+        if self.autoplay:
+            self.update_autoplay(dt)
+
+    def update_autoplay(self, dt):
+        self.autoplay_timer += dt
+        if self.state == STATE_GAMEOVER:
+            if self.autoplay_timer >= AUTOPLAY_RESTART_MS:
+                self.autoplay_timer = 0
+                self.start_game()
+        elif self.state == STATE_PLAY and self.drag_piece is None and self.board.flash_timer <= 0:
+            if self.autoplay_timer >= AUTOPLAY_MS:
+                self.autoplay_timer = 0
+                if not self.plan:
+                    self.refresh_plan()
+                if self.plan:
+                    slot, placement = self.plan[0]
+                    if not self.place_from_tray(slot, placement.r, placement.c):
+                        self.refresh_plan()
 
     # ------------- Draw -------------
     def draw_button(self, rect, label):
@@ -532,6 +608,25 @@ class Game:
         draw_text(self.screen, f"Best: {self.highscore}", WINDOW_W - 20, 20, self.font_ui, center=False)
         # Title small
         draw_text(self.screen, "BLOCK BLAST", WINDOW_W // 2, 70, self.font_big, center=True)
+        modes = [name for name, on in (("Hint", self.hint), ("Autoplay", self.autoplay)) if on]
+        if modes:
+            draw_text(self.screen, " + ".join(modes), 20, 90, self.font_ui)
+
+    def draw_hint(self, numbers=True):
+        # outline each planned placement in its piece's color, numbered in play order
+        for step, (slot, placement) in enumerate(self.plan, 1):
+            piece = self.tray[slot]
+            if piece is None:
+                continue
+            for dr, dc in piece.cells:
+                x = GRID_LEFT + (placement.c + dc) * CELL
+                y = GRID_TOP + (placement.r + dr) * CELL
+                pygame.draw.rect(self.screen, piece.color, (x+4, y+4, CELL-8, CELL-8), 3, border_radius=corner_radius(CELL))
+            if not numbers:
+                continue
+            dr, dc = piece.cells[0]
+            draw_text(self.screen, str(step), GRID_LEFT + (placement.c + dc) * CELL + CELL // 2,
+                      GRID_TOP + (placement.r + dr) * CELL + CELL // 2, self.font_ui, center=True)
 
     def draw_tray(self):
         # tray background
@@ -561,22 +656,19 @@ class Game:
             mx, my = pygame.mouse.get_pos()
             px, py, top_r, left_c = snapped_grid_origin_for_piece(self.drag_piece, mx, my)
             if px is not None:
-                valid = self.board.can_place(self.drag_piece, top_r, left_c)
+                valid = self.board.hover_valid(self.drag_piece, top_r, left_c)
                 self.drag_piece.draw_ghost_on_grid(self.screen, (px, py), CELL, valid)
 
     def draw_menu(self):
         draw_text(self.screen, "BLOCK BLAST", WINDOW_W // 2, GRID_TOP + 90, self.font_title, center=True)
-        draw_text(self.screen, "Drag pieces onto the 8×8 grid.\nFill lines to clear.\nNo rotations.",
+        draw_text(self.screen, f"Drag pieces onto the {GRID_SIZE}×{GRID_SIZE} grid.\nFill lines to clear.\nNo rotations.",
                   WINDOW_W // 2, GRID_TOP + 150, self.font_ui, center=True)
         self.draw_button(self.buttons["menu_play"], "Play")
         self.draw_button(self.buttons["menu_quit"], "Quit")
 
     def draw_gameover(self):
         # dim
-        dim = pygame.Surface((WINDOW_W, WINDOW_H))
-        dim.set_alpha(160)
-        dim.fill((0, 0, 0))
-        self.screen.blit(dim, (0, 0))
+        self.screen.blit(pooled_surface((WINDOW_W, WINDOW_H), (0, 0, 0, 160)), (0, 0))
 
         # modal
         mw, mh = 360, 260
@@ -592,19 +684,29 @@ class Game:
         self.draw_button(self.buttons["go_restart"], "Restart")
         self.draw_button(self.buttons["go_menu"], "Main Menu")
 
-    def render(self):
+    def draw_frame(self, hud=True):
+        # hud=False skips all text (score line, menus, game-over modal)
         self.screen.fill(BG_COLOR)
         if self.state == STATE_MENU:
-            self.draw_menu()
+            if hud:
+                self.draw_menu()
         elif self.state == STATE_PLAY:
-            self.draw_hud()
+            if hud:
+                self.draw_hud()
             self.board.draw(self.screen)
+            if self.hint:
+                self.draw_hint(numbers=hud)
             self.draw_tray()
         elif self.state == STATE_GAMEOVER:
-            self.draw_hud()
+            if hud:
+                self.draw_hud()
             self.board.draw(self.screen)
             self.draw_tray()
-            self.draw_gameover()
+            if hud:
+                self.draw_gameover()
+
+    def render(self):
+        self.draw_frame()
         pygame.display.flip()
 
     # ------------- Loop -------------
@@ -616,6 +718,9 @@ class Game:
             self.render()
 
 def main():
+    # Optional board size: `python blockBlastGPT5.py 16` (8 up to MAX_GRID_SIZE)
+    if len(sys.argv) > 1:
+        set_grid_size(int(sys.argv[1]))
     Game().run()
 
 if __name__ == "__main__":
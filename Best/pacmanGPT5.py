@@ -532,10 +532,15 @@ def stable_gate_geometry(level):
 # Game
 # -----------------------------
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False):
+        # headless: draw into an offscreen surface instead of opening a window
         pygame.init()
-        pygame.display.set_caption(TITLE)
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.headless = headless
+        if headless:
+            self.screen = pygame.Surface((WIDTH, HEIGHT))
+        else:
+            pygame.display.set_caption(TITLE)
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.SysFont(FONT_NAME, 18)
         self.font = pygame.font.SysFont(FONT_NAME, 24, bold=True)
@@ -639,6 +644,13 @@ class Game:
         self.state = "level_clear"
         self.flash_timer = 1.6
 
+    def restart(self):
+        self.level_num = 1
+        self.level = Level.from_file_or_default()
+        self.gate_row, self.gate_col, self.gate_target_tile = stable_gate_geometry(self.level)
+        self.reset_positions(full_reset=True)
+        self.start_level()
+
     def handle_keydown(self, key):
         if key == pygame.K_ESCAPE:
             pygame.quit(); sys.exit(0)
@@ -648,11 +660,7 @@ class Game:
             elif self.state == "ready":
                 self.begin_play()
             elif self.state == "game_over":
-                self.level_num = 1
-                self.level = Level.from_file_or_default()
-                self.gate_row, self.gate_col, self.gate_target_tile = stable_gate_geometry(self.level)
-                self.reset_positions(full_reset=True)
-                self.start_level()
+                self.restart()
         if key == pygame.K_p and self.state == "playing":
             self.state = "paused"
         elif key == pygame.K_p and self.state == "paused":
@@ -751,8 +759,14 @@ class Game:
         self.high_score = max(self.high_score, self.score)
 
     def draw(self):
+        self.draw_frame()
+        pygame.display.flip()
+
+    def draw_frame(self, hud=True):
+        # hud=False skips the score line, lives and all centered messages
         self.screen.fill(BLACK)
-        self.draw_hud()
+        if hud:
+            self.draw_hud()
 
         if self.state in ("start", "game_over", "paused"):
             self.draw_maze(flash=False)
@@ -770,6 +784,9 @@ class Game:
                 g.draw(self.screen, flashing=flashing)
             self.player.draw(self.screen)
 
+        if not hud:
+            return
+
         if self.state == "start":
             self.draw_center_text("PY-MAN", self.font_big, TEXT_YELLOW, dy=-40)
             self.draw_center_text("Press ENTER to start", self.font, HUD_WHITE, dy=10)
@@ -789,8 +806,6 @@ class Game:
             self.draw_center_text("GAME OVER", self.font_big, GAMEOVER_RED, dy=0)
             self.draw_center_text("Press ENTER to restart", self.font, HUD_WHITE, dy=40)
 
-        pygame.display.flip()
-
     def draw_hud(self):
         s = f"SCORE {self.score:06d}    HIGH {self.high_score:06d}    LVL {self.level_num}"
         txt = self.font.render(s, True, HUD_WHITE)
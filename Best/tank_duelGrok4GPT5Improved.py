@@ -1,16 +1,28 @@
 import pygame
 from pygame.locals import *
 import random
-import queue
 import math
+import sys
+import time
+from collections import deque
+
+import numpy as np
 
 # ---------------- Config ----------------
-CELL_SIZE = 24           # smaller cell so 50x50 fits on most screens (1200x1200)
-ROWS = 24
-COLS = 24
+CELL_SIZE = 24
+ARENA_SIZE = 50          # default cells per side; pass another size on the command line
+MAX_ARENA_SIZE = 256
+ROWS = ARENA_SIZE
+COLS = ARENA_SIZE
 WIDTH = COLS * CELL_SIZE
 HEIGHT = ROWS * CELL_SIZE
 
+# Window: a camera follows the player when the arena is bigger than this
+VIEW_W = 24 * CELL_SIZE
+VIEW_H = 24 * CELL_SIZE
+MINIMAP_SIZE = 120       # px, longest side
+CHUNK_CELLS = 16         # block layer is cached in CHUNK_CELLS x CHUNK_CELLS tiles
+
 # Colors
 GREEN = (0, 255, 0)
 ORANGE = (255, 165, 0)
@@ -34,6 +46,9 @@ ENEMY_SPEED = 120
 AI_STANDOFF_DIST = 180        # enemies close in until this distance
 AI_REPATH_TIME = 0.35
 AI_FIRE_COOLDOWN = 1.0
+AI_FRAME_BUDGET = 20          # think units of LOS/repath work per frame, all enemies (None = no limit)
+AI_REPATH_CELLS = 64          # arena cells per think unit of a repath (bfs visits up to every cell)
+AI_NEAR_DIST = AI_STANDOFF_DIST * 1.5  # enemies this close think first
 PLAYER_FIRE_COOLDOWN = 0.12    # guard for key-repeat fire
 BULLET_SPEED = 540
 
@@ -42,8 +57,22 @@ PLAYER_WEAPON_RADII = [10, 40, 150]  # two weapon options (toggle)
 ENEMY_EXPLOSION_RADIUS = 5
 EXPLOSION_DURATION = 0.45         # seconds, visual effect length
 EXPLOSION_DAMAGE_APPLY_AT = 0.15  # seconds (apply damage early)
+EXPLOSION_FRAMES = 16             # pre-rendered animation frames per explosion
+SPARK_VARIANTS = 3                # pre-baked spark layouts to pick from
+SPARKS = 18
 
 # --------------------------------------------------------
+def set_arena_size(rows, cols=None):
+    """Resize the arena; call before creating an Arena (sizes are clamped to 8..MAX_ARENA_SIZE)."""
+    global ROWS, COLS, WIDTH, HEIGHT
+    ROWS = clamp(int(rows), 8, MAX_ARENA_SIZE)
+    COLS = clamp(int(cols if cols is not None else rows), 8, MAX_ARENA_SIZE)
+    WIDTH = COLS * CELL_SIZE
+    HEIGHT = ROWS * CELL_SIZE
+
+def view_size():
+    return min(WIDTH, VIEW_W), min(HEIGHT, VIEW_H)
+
 def clamp(v, a, b):
     return a if v < a else b if v > b else v
 
@@ -66,6 +95,15 @@ def cell_from_pos(x, y):
 def cell_center(row, col):
     return (col * CELL_SIZE + CELL_SIZE * 0.5, row * CELL_SIZE + CELL_SIZE * 0.5)
 
+def blocks_touching(rect, block_positions):
+    """Rects of the blocks overlapping rect; only the cells under rect are looked up."""
+    c0 = max(rect.left // CELL_SIZE, 0)
+    c1 = min((rect.right - 1) // CELL_SIZE, COLS - 1)
+    r0 = max(rect.top // CELL_SIZE, 0)
+    r1 = min((rect.bottom - 1) // CELL_SIZE, ROWS - 1)
+    return [get_block_rect((r, c)) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)
+            if (r, c) in block_positions]
+
 class Tank:
     def __init__(self, color, pos, facing='right', is_ai=False):
         size = max(16, int(CELL_SIZE * 0.8))   # scale tank to cell size
@@ -79,12 +117,14 @@ class Tank:
         self.speed = ENEMY_SPEED if is_ai else PLAYER_SPEED
         self.path = None
         self.path_timer = 0
+        self.has_los = False  # last LOS result, reused on frames the AI doesn't think
+        self.repathed = False  # whether the last think ran bfs
 
     @property
     def center(self):
         return (self.rect.centerx, self.rect.centery)
 
-    def update(self, dt, keys, block_rects):
+    def update(self, dt, keys, block_positions):
         if not self.alive:
             return None
         self.cooldown -= dt
@@ -112,7 +152,7 @@ class Tank:
         temp = self.rect.copy()
         temp.x += dx
         temp.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-        for br in block_rects:
+        for br in blocks_touching(temp, block_positions):
             if temp.colliderect(br):
                 if dx > 0: temp.right = br.left
                 elif dx < 0: temp.left = br.right
@@ -122,13 +162,21 @@ class Tank:
         temp = self.rect.copy()
         temp.y += dy
         temp.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-        for br in block_rects:
+        for br in blocks_touching(temp, block_positions):
             if temp.colliderect(br):
                 if dy > 0: temp.bottom = br.top
                 elif dy < 0: temp.top = br.bottom
         self.rect.y = temp.y
 
-    def update_ai(self, dt, player, block_positions, block_rects):
+    def needs_think(self, player):
+        """Close to the player, or due a repath with no path to follow."""
+        if dist(self.center, player.center) < AI_NEAR_DIST:
+            return True
+        return self.path_timer <= 0 and not (self.path and len(self.path) > 1)
+
+    def update_ai(self, dt, player, block_positions, think=True):
+        # think=False skips the LOS check and repath (reusing the last results); movement,
+        # facing and firing still run every frame
         if not self.alive:
             return None
         self.cooldown -= dt
@@ -137,7 +185,10 @@ class Tank:
         my = self.center
         target = player.center
         d = dist(my, target)
-        has_los = check_los(my, target, block_positions)
+        if think:
+            self.has_los = check_los(my, target, block_positions)
+            self.repathed = False
+        has_los = self.has_los
 
         # Face toward player
         dx = target[0] - my[0]
@@ -154,11 +205,12 @@ class Tank:
         move_y = 0
 
         if want_advance:
-            if self.path_timer <= 0:
+            if self.path_timer <= 0 and think:
                 start = (self.rect.centery // CELL_SIZE, self.rect.centerx // CELL_SIZE)
                 goal = (player.rect.centery // CELL_SIZE, player.rect.centerx // CELL_SIZE)
                 self.path = bfs(start, goal, block_positions)
                 self.path_timer = AI_REPATH_TIME
+                self.repathed = True
 
             if self.path and len(self.path) > 1:
                 next_cell = self.path[1]
@@ -205,7 +257,7 @@ class Tank:
             temp = self.rect.copy()
             temp.x += move_x
             temp.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-            for br in block_rects:
+            for br in blocks_touching(temp, block_positions):
                 if temp.colliderect(br):
                     if move_x > 0: temp.right = br.left
                     elif move_x < 0: temp.left = br.right
@@ -214,49 +266,152 @@ class Tank:
             temp = self.rect.copy()
             temp.y += move_y
             temp.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-            for br in block_rects:
+            for br in blocks_touching(temp, block_positions):
                 if temp.colliderect(br):
                     if move_y > 0: temp.bottom = br.top
                     elif move_y < 0: temp.top = br.bottom
             self.rect.y = temp.y
 
-        # Fire logic
-        bullet = None
+        # Fire logic: return the direction fired in, if any
         fire_ok = has_los or (random.random() < 0.15 and d < AI_STANDOFF_DIST * 1.2)
         if fire_ok and self.cooldown <= 0:
-            dir_vec = DIRECTIONS[self.facing]
-            bullet = Bullet(self.center, dir_vec, BULLET_SPEED, owner='ai')
             self.cooldown = AI_FIRE_COOLDOWN
-        return bullet
+            return DIRECTIONS[self.facing]
+        return None
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect)
+    def draw(self, screen, offset=(0, 0)):
+        rect = self.rect.move(-offset[0], -offset[1])
+        pygame.draw.rect(screen, self.color, rect)
         # Barrel
-        cx, cy = self.rect.center
+        cx, cy = rect.center
         dir_vec = DIRECTIONS[self.facing]
         end = (cx + dir_vec[0] * int(CELL_SIZE * 0.6), cy + dir_vec[1] * int(CELL_SIZE * 0.6))
         pygame.draw.line(screen, BLACK, (cx, cy), end, max(2, CELL_SIZE // 12))
         if not self.alive:
-            surf = pygame.Surface(self.rect.size, SRCALPHA)
+            surf = pygame.Surface(rect.size, SRCALPHA)
             surf.fill((255, 0, 0, 128))
-            screen.blit(surf, self.rect.topleft)
-
-class Bullet:
-    def __init__(self, pos, dir_vec, speed=BULLET_SPEED, owner='player'):
+            screen.blit(surf, rect.topleft)
+
+OWNER_PLAYER = 0
+OWNER_AI = 1
+
+class BulletPool:
+    """All live bullets as parallel NumPy arrays (structure of arrays).
+
+    Slots [0, n) are live. Bullets move in one vectorized step per update and
+    dead ones are swap-removed: the hole is filled from the tail, so nothing
+    shifts. `seq` is the firing order, used to keep same-frame hits in order.
+    """
+
+    FIELDS = ("x", "y", "dx", "dy", "owner", "alive", "seq")
+
+    def __init__(self, capacity=64):
+        self.n = 0
+        self.fired = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)      # velocity, px/s
+        self.dy = np.zeros(capacity)
+        self.owner = np.zeros(capacity, np.int8)
+        self.alive = np.zeros(capacity, bool)
+        self.seq = np.zeros(capacity, np.int64)
+
+    def __len__(self):
+        return self.n
+
+    def spawn(self, pos, dir_vec, owner, speed=BULLET_SPEED):
+        if self.n == len(self.x):
+            for name in self.FIELDS:
+                a = getattr(self, name)
+                setattr(self, name, np.concatenate([a, np.zeros_like(a)]))
+        i = self.n
         offset = CELL_SIZE * 0.7
-        start_x = pos[0] + dir_vec[0] * offset
-        start_y = pos[1] + dir_vec[1] * offset
-        self.pos = [start_x, start_y]
-        self.dir = dir_vec
-        self.speed = speed
-        self.owner = owner
-
-    def update(self, dt):
-        self.pos[0] += self.dir[0] * self.speed * dt
-        self.pos[1] += self.dir[1] * self.speed * dt
-
-    def draw(self, screen):
-        pygame.draw.circle(screen, BLACK, (int(self.pos[0]), int(self.pos[1])), max(3, CELL_SIZE // 8))
+        self.x[i] = pos[0] + dir_vec[0] * offset
+        self.y[i] = pos[1] + dir_vec[1] * offset
+        self.dx[i] = dir_vec[0] * speed
+        self.dy[i] = dir_vec[1] * speed
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.seq[i] = self.fired
+        self.fired += 1
+        self.n += 1
+
+    def move(self, dt):
+        n = self.n
+        self.x[:n] += self.dx[:n] * dt
+        self.y[:n] += self.dy[:n] * dt
+
+    def compact(self):
+        """Swap-remove every slot whose alive flag was cleared."""
+        n = self.n
+        dead = np.flatnonzero(~self.alive[:n])
+        if not len(dead):
+            return
+        m = n - len(dead)
+        holes = dead[dead < m]
+        donors = np.flatnonzero(self.alive[m:n]) + m
+        for name in self.FIELDS:
+            a = getattr(self, name)
+            a[holes] = a[donors]
+        self.n = m
+
+    def positions(self):
+        return self.x[:self.n], self.y[:self.n]
+
+    def draw(self, screen, offset=(0, 0)):
+        view_w, view_h = screen.get_size()
+        r = max(3, CELL_SIZE // 8)
+        x, y = self.positions()
+        sx = x.astype(np.int64) - offset[0]
+        sy = y.astype(np.int64) - offset[1]
+        for i in np.flatnonzero((sx >= -r) & (sx <= view_w + r) & (sy >= -r) & (sy <= view_h + r)):
+            pygame.draw.circle(screen, BLACK, (int(sx[i]), int(sy[i])), r)
+
+# (radius, variant) -> list of (surface, half_size), one per animation frame
+_explosion_frames = {}
+_spark_angles = [[random.Random(v).uniform(0, math.tau) for _ in range(SPARKS)]
+                 for v in range(SPARK_VARIANTS)]
+
+def render_explosion_frame(radius, t, spark_angles):
+    """One animation frame centered in its own alpha surface (core, rings, sparks)."""
+    R = int(radius * (0.6 + 0.6 * t))
+    alpha = int(220 * (1.0 - t))
+    ring_max = int(radius * (0.35 + 0.25 * 2 + 0.4*t))
+    spark_len = int(radius * (0.3 + 0.7 * t))
+    half = max(R, ring_max, spark_len) + 3
+    surf = pygame.Surface((half*2, half*2), SRCALPHA)
+    c = (half, half)
+    pygame.draw.circle(surf, (255, 200, 60, alpha), c, int(R*0.7))
+    pygame.draw.circle(surf, (255, 120, 20, alpha), c, int(R*0.4))
+    # rings
+    for i in range(3):
+        rr = int(radius * (0.35 + 0.25 * i + 0.4*t))
+        pygame.draw.circle(surf, (255, 180, 40), c, rr, 2)
+    # sparks
+    for ang in spark_angles:
+        x2 = int(half + math.cos(ang) * spark_len)
+        y2 = int(half + math.sin(ang) * spark_len)
+        pygame.draw.line(surf, (255, 230, 120), c, (x2, y2), 2)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.set_alpha(255, RLEACCEL)  # mostly transparent: RLE skips the empty runs
+    return surf, half
+
+def explosion_frames(radius, variant):
+    key = (radius, variant)
+    frames = _explosion_frames.get(key)
+    if frames is None:
+        last = EXPLOSION_FRAMES - 1
+        frames = [render_explosion_frame(radius, k / last, _spark_angles[variant])
+                  for k in range(EXPLOSION_FRAMES)]
+        _explosion_frames[key] = frames
+    return frames
+
+def warm_explosion_frames():
+    # Build every animation up front so the first big blast doesn't hitch
+    for radius in PLAYER_WEAPON_RADII + [ENEMY_EXPLOSION_RADIUS]:
+        for v in range(SPARK_VARIANTS):
+            explosion_frames(radius, v)
 
 class Explosion:
     def __init__(self, pos, radius, duration=EXPLOSION_DURATION):
@@ -265,7 +420,7 @@ class Explosion:
         self.duration = duration
         self.age = 0.0
         self.applied_damage = False
-        self.spark_angles = [random.uniform(0, math.tau) for _ in range(18)]
+        self.variant = random.randrange(SPARK_VARIANTS)
 
     def update(self, dt):
         self.age += dt
@@ -277,55 +432,47 @@ class Explosion:
     def should_apply_damage(self):
         return (not self.applied_damage) and (self.age >= EXPLOSION_DAMAGE_APPLY_AT)
 
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
         t = clamp(self.age / self.duration, 0.0, 1.0)
-        R = int(self.radius * (0.6 + 0.6 * t))
-        alpha = int(220 * (1.0 - t))
-        surf = pygame.Surface((R*2+4, R*2+4), SRCALPHA)
-        pygame.draw.circle(surf, (255, 200, 60, alpha), (R+2, R+2), int(R*0.7))
-        pygame.draw.circle(surf, (255, 120, 20, alpha), (R+2, R+2), int(R*0.4))
-        screen.blit(surf, (self.pos[0]-R-2, self.pos[1]-R-2))
-        # rings
-        for i in range(3):
-            rr = int(self.radius * (0.35 + 0.25 * i + 0.4*t))
-            pygame.draw.circle(screen, (255, 180, 40), (int(self.pos[0]), int(self.pos[1])), rr, 2)
-        # sparks
-        for ang in self.spark_angles:
-            L = int(self.radius * (0.3 + 0.7 * t))
-            x2 = int(self.pos[0] + math.cos(ang) * L)
-            y2 = int(self.pos[1] + math.sin(ang) * L)
-            pygame.draw.line(screen, (255, 230, 120), (int(self.pos[0]), int(self.pos[1])), (x2, y2), 2)
+        frames = explosion_frames(self.radius, self.variant)
+        surf, half = frames[round(t * (EXPLOSION_FRAMES - 1))]
+        screen.blit(surf, (int(self.pos[0]) - half - offset[0], int(self.pos[1]) - half - offset[1]))
 
 def bfs(start, goal, block_positions):
-    grid = [[True] * COLS for _ in range(ROWS)]
-    for r, c in block_positions:
-        grid[r][c] = False
-    q = queue.Queue()
-    q.put([start])
-    visited = set([start])
-    while not q.empty():
-        path = q.get()
-        cur = path[-1]
+    # Same visiting order as a queue of paths, but paths are rebuilt from parent links
+    prev = {start: None}
+    q = deque([start])
+    while q:
+        cur = q.popleft()
         if cur == goal:
+            path = []
+            while cur is not None:
+                path.append(cur)
+                cur = prev[cur]
+            path.reverse()
             return path
         for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
             nr, nc = cur[0] + dr, cur[1] + dc
-            if 0 <= nr < ROWS and 0 <= nc < COLS and grid[nr][nc] and (nr, nc) not in visited:
-                visited.add((nr, nc))
-                q.put(path + [(nr, nc)])
+            nxt = (nr, nc)
+            if 0 <= nr < ROWS and 0 <= nc < COLS and nxt not in prev and nxt not in block_positions:
+                prev[nxt] = cur
+                q.append(nxt)
     return None
 
 def check_los(p1, p2, block_positions):
     x0, y0 = p1
     x1, y1 = p2
-    cells = get_line_cells(x0, y0, x1, y1)
-    for row, col in cells:
-        if (row, col) in block_positions:
+    for cell in line_cells(x0, y0, x1, y1):
+        if cell in block_positions:
             return False
     return True
 
 def get_line_cells(x0, y0, x1, y1):
-    cells = set()
+    return set(line_cells(x0, y0, x1, y1))
+
+def line_cells(x0, y0, x1, y1):
+    """Yield the in-bounds cells along the pixel line, each cell once per run."""
+    last = None
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
@@ -334,8 +481,9 @@ def get_line_cells(x0, y0, x1, y1):
     while True:
         col = int(x0 // CELL_SIZE)
         row = int(y0 // CELL_SIZE)
-        if 0 <= row < ROWS and 0 <= col < COLS:
-            cells.add((row, col))
+        if 0 <= row < ROWS and 0 <= col < COLS and (row, col) != last:
+            last = (row, col)
+            yield last
         if int(x0) == int(x1) and int(y0) == int(y1):
             break
         e2 = 2 * err
@@ -345,7 +493,6 @@ def get_line_cells(x0, y0, x1, y1):
         if e2 < dx:
             err += dx
             y0 += sy
-    return cells
 
 def generate_blocks():
     block_positions = set()
@@ -360,70 +507,448 @@ def generate_blocks():
         block_positions.discard(rc)
     return block_positions
 
+def blocks_in_radius(cx, cy, radius, block_positions):
+    r0 = max(int((cy - radius) // CELL_SIZE) - 1, 0)
+    r1 = min(int((cy + radius) // CELL_SIZE) + 1, ROWS - 1)
+    c0 = max(int((cx - radius) // CELL_SIZE) - 1, 0)
+    c1 = min(int((cx + radius) // CELL_SIZE) + 1, COLS - 1)
+    return [(r, c) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)
+            if (r, c) in block_positions
+            and circle_rect_overlap(cx, cy, radius, get_block_rect((r, c)))]
+
 def get_block_rect(bl):
     r, c = bl
     return pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE)
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Tank Duel — 50x50 + Click-to-Build")
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 44)
-    small_font = pygame.font.SysFont(None, 22)
-
-    level = 1
-    player = None
-    enemies = []
-    block_positions = None
-    bullets = []
-    explosions = []
-    game_over = False
-    winner = None
-    last_player_fire = 0.0
-    player_weapon_idx = 0  # 0 => 88px, 1 => 188px
-
-    def new_game(advance=False):
-        nonlocal level, player, enemies, block_positions, bullets, explosions, game_over, winner, last_player_fire
+class BlockLayer:
+    """Arena background with every block painted in, cached as CHUNK_CELLS-square tiles.
+
+    Tiles are rendered when they first come into view and patched per cell as blocks
+    change; tiles that scroll out of view are dropped once more than max_chunks exist.
+    """
+
+    def __init__(self, block_positions, max_chunks=36):
+        self.block_positions = block_positions
+        self.max_chunks = max_chunks
+        self.chunks = {}  # (chunk_row, chunk_col) -> Surface
+
+    def rebuild(self, block_positions):
+        self.block_positions = block_positions
+        self.chunks.clear()
+
+    def _render_chunk(self, cr, cc):
+        r0, c0 = cr * CHUNK_CELLS, cc * CHUNK_CELLS
+        rows = min(CHUNK_CELLS, ROWS - r0)
+        cols = min(CHUNK_CELLS, COLS - c0)
+        surf = pygame.Surface((cols * CELL_SIZE, rows * CELL_SIZE))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        ox, oy = c0 * CELL_SIZE, r0 * CELL_SIZE
+        surf.fill(GRAY)
+        pygame.draw.rect(surf, BLACK, (-ox, -oy, WIDTH, HEIGHT), 2)
+        for r in range(r0, r0 + rows):
+            for c in range(c0, c0 + cols):
+                if (r, c) in self.block_positions:
+                    surf.fill(DARK_GRAY, ((c - c0) * CELL_SIZE, (r - r0) * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        return surf
+
+    def set_cell(self, r, c, present):
+        cr, cc = r // CHUNK_CELLS, c // CHUNK_CELLS
+        surf = self.chunks.get((cr, cc))
+        if surf is None:
+            return  # rendered fresh when it comes into view
+        ox, oy = cc * CHUNK_CELLS * CELL_SIZE, cr * CHUNK_CELLS * CELL_SIZE
+        rect = pygame.Rect(c * CELL_SIZE - ox, r * CELL_SIZE - oy, CELL_SIZE, CELL_SIZE)
+        if present:
+            surf.fill(DARK_GRAY, rect)
+        else:
+            surf.fill(GRAY, rect)
+            # restore the arena border where it crosses this cell
+            surf.set_clip(rect)
+            pygame.draw.rect(surf, BLACK, (-ox, -oy, WIDTH, HEIGHT), 2)
+            surf.set_clip(None)
+
+    def blit(self, screen, camera):
+        cam_x, cam_y = camera
+        view_w, view_h = screen.get_size()
+        span = CHUNK_CELLS * CELL_SIZE
+        visible = [(cr, cc)
+                   for cr in range(max(cam_y // span, 0), min((cam_y + view_h - 1) // span, (ROWS - 1) // CHUNK_CELLS) + 1)
+                   for cc in range(max(cam_x // span, 0), min((cam_x + view_w - 1) // span, (COLS - 1) // CHUNK_CELLS) + 1)]
+        for key in visible:
+            surf = self.chunks.get(key)
+            if surf is None:
+                surf = self.chunks[key] = self._render_chunk(*key)
+            screen.blit(surf, (key[1] * span - cam_x, key[0] * span - cam_y))
+        if len(self.chunks) > self.max_chunks:
+            keep = set(visible)
+            for key in [k for k in self.chunks if k not in keep]:
+                del self.chunks[key]
+
+def repath_units():
+    """Think units charged for one bfs: it can visit every cell of the arena."""
+    return max(1, ROWS * COLS // AI_REPATH_CELLS)
+
+class AIScheduler:
+    """Spreads enemy LOS checks and repaths over frames within a per-frame work budget.
+
+    Every enemy moves every frame; only the first ones in line also think (check_los and,
+    when due, bfs) until `budget` think units are used. A think costs one unit and a repath
+    adds repath_units(), so the budget tracks work rather than wall time and a seeded run
+    plays out the same on any machine. The line starts with the tank at the round-robin
+    cursor, then tanks near the player or without a path, then the rest in ring order. The
+    cursor moves to the first tank in the ring that did not think, so it advances every
+    frame and every enemy thinks at least once every len(enemies) frames, however many
+    are urgent. With budget None every enemy thinks every frame, in list order.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.cursor = 0
+
+    def run(self, enemies, dt, player, block_positions, fire):
+        if self.budget is None:
+            for enemy in enemies:
+                fired = enemy.update_ai(dt, player, block_positions)
+                if fired:
+                    fire(enemy, fired)
+            return
+        alive = [e for e in enemies if e.alive]
+        if not alive:
+            return
+        start = self.cursor % len(alive)
+        ring = alive[start:] + alive[:start]
+        urgent, rest = [], []
+        for k in range(1, len(ring)):
+            if ring[k].needs_think(player):
+                urgent.append(k)
+            else:
+                rest.append(k)
+        used = 0
+        thinking = True
+        unthought = len(ring)  # first ring position left without a think this frame
+        for i, k in enumerate([0] + urgent + rest):
+            # the tank at the cursor always thinks, so the line keeps moving on a tiny budget
+            if thinking and i and used >= self.budget:
+                thinking = False
+            enemy = ring[k]
+            fired = enemy.update_ai(dt, player, block_positions, thinking)
+            if fired:
+                fire(enemy, fired)
+            if thinking:
+                used += 1 + (repath_units() if enemy.repathed else 0)
+            elif k < unthought:
+                unthought = k
+        self.cursor = start + unthought
+
+class Arena:
+    """One match: tanks, blocks, bullets and explosions, stepped without any drawing."""
+
+    def __init__(self):
+        self.level = 1
+        self.player_weapon_idx = 0  # 0 => 10px, 1 => 40px, 2 => 150px
+        self.time = 0.0             # simulated seconds, drives the player fire guard
+        self.block_layer = None     # BlockLayer, created by draw_arena on first draw
+        self.block_version = 0      # bumped on every block change (minimap cache key)
+        self.ai_time = 0.0          # wall seconds spent in enemy AI, for profiling
+        self.ai = AIScheduler(AI_FRAME_BUDGET)
+        self.new_game()
+
+    def add_block(self, bl):
+        self.block_positions.add(bl)
+        self.occupancy[bl[0] * COLS + bl[1]] = 1
+        self.block_version += 1
+        if self.block_layer is not None:
+            self.block_layer.set_cell(bl[0], bl[1], True)
+
+    def remove_block(self, bl):
+        self.block_positions.remove(bl)
+        self.occupancy[bl[0] * COLS + bl[1]] = 0
+        self.block_version += 1
+        if self.block_layer is not None:
+            self.block_layer.set_cell(bl[0], bl[1], False)
+
+    def new_game(self, advance=False):
         if advance:
-            level += 1
-        block_positions = generate_blocks()
+            self.level += 1
+        self.block_positions = generate_blocks()
+        # Row-major occupancy grid (1 = block), mirrors block_positions
+        self.occupancy = bytearray(ROWS * COLS)
+        for r, c in self.block_positions:
+            self.occupancy[r * COLS + c] = 1
+        self.block_version += 1
+        if self.block_layer is not None:
+            self.block_layer.rebuild(self.block_positions)
         # spawn player bottom-left corner cell center
         player_pos = cell_center(ROWS - 1, 0)
-        player = Tank(GREEN, player_pos, 'right')
-        enemies = []
-        num_enemies = 2 ** (level - 1)
-        # cap enemies a bit for giant map sanity
-        num_enemies = num_enemies = 2 ** (level - 1)
+        self.player = Tank(GREEN, player_pos, 'right')
+        self.enemies = []
+        num_enemies = 2 ** (self.level - 1)
         for _ in range(num_enemies):
             while True:
                 er = random.randint(0, ROWS // 2)
                 ec = random.randint(COLS // 2, COLS - 1)
                 ex, ey = cell_center(er, ec)
-                erect = pygame.Rect(0, 0, int(CELL_SIZE*0.8), int(CELL_SIZE*0.8))
-                erect.center = (ex, ey)
-                collides = False
-                for bl in block_positions:
-                    if erect.colliderect(get_block_rect(bl)):
-                        collides = True
-                        break
-                if not collides:
+                # a tank-sized rect centered in the cell can only touch that cell's block
+                if (er, ec) not in self.block_positions:
                     break
             t = Tank(ORANGE, (ex, ey), 'left', is_ai=True)
             t.speed = ENEMY_SPEED
-            enemies.append(t)
-        bullets = []
-        explosions = []
-        game_over = False
-        winner = None
-        last_player_fire = -999.0
-        return player, enemies, block_positions, bullets, explosions, game_over, winner
+            self.enemies.append(t)
+        self.bullets = BulletPool()
+        self.explosions = []
+        self.game_over = False
+        self.winner = None
+        self.last_player_fire = -999.0
+
+    def fire_player(self):
+        # Fire (guard repeat)
+        if self.game_over or not self.player.alive:
+            return False
+        if self.time - self.last_player_fire < PLAYER_FIRE_COOLDOWN:
+            return False
+        dir_vec = DIRECTIONS[self.player.facing]
+        self.bullets.spawn(self.player.center, dir_vec, OWNER_PLAYER)
+        self.last_player_fire = self.time
+        return True
+
+    def build_block(self, r, c):
+        # Only if space empty (no block) and no tank occupies that cell
+        if (r, c) in self.block_positions:
+            return False
+        cell_rect = get_block_rect((r, c))
+        if self.player.rect.colliderect(cell_rect):
+            return False
+        for e in self.enemies:
+            if e.rect.colliderect(cell_rect):
+                return False
+        self.add_block((r, c))
+        return True
+
+    def explosion_radius(self, owner):
+        return PLAYER_WEAPON_RADII[self.player_weapon_idx] if owner == 'player' else ENEMY_EXPLOSION_RADIUS
+
+    def update_bullets(self, dt):
+        """Move every bullet at once, then explode the ones that hit a block, tank or the edge."""
+        pool = self.bullets
+        pool.move(dt)
+        n = pool.n
+        if not n:
+            return
+        x, y = pool.positions()
+        owner = pool.owner[:n]
+        # Rect.collidepoint truncates toward zero, as int() does
+        ix = x.astype(np.int64)
+        iy = y.astype(np.int64)
+        out = ~((x > 0) & (x < WIDTH) & (y > 0) & (y < HEIGHT))
+
+        # Blocks: one lookup in the occupancy grid per bullet
+        r, c = iy // CELL_SIZE, ix // CELL_SIZE
+        in_grid = (r >= 0) & (r < ROWS) & (c >= 0) & (c < COLS)
+        grid = np.frombuffer(self.occupancy, np.uint8)
+        hit = in_grid & (grid[np.where(in_grid, r * COLS + c, 0)] == 1)
+
+        # Player AABB vs enemy bullets
+        player = self.player
+        if player.alive:
+            pr = player.rect
+            hit |= ((owner == OWNER_AI) & (ix >= pr.left) & (ix < pr.right)
+                    & (iy >= pr.top) & (iy < pr.bottom))
+
+        # Enemy AABBs vs player bullets, through a cell -> enemies index
+        shots = np.flatnonzero((owner == OWNER_PLAYER) & ~hit)
+        if len(shots):
+            by_cell = {}
+            for enemy in self.enemies:
+                if enemy.alive:
+                    er = enemy.rect
+                    for cr in range(er.top // CELL_SIZE, (er.bottom - 1) // CELL_SIZE + 1):
+                        for cc in range(er.left // CELL_SIZE, (er.right - 1) // CELL_SIZE + 1):
+                            by_cell.setdefault((cr, cc), []).append(er)
+            for i in shots:
+                for er in by_cell.get((int(r[i]), int(c[i])), ()):
+                    if er.collidepoint(int(ix[i]), int(iy[i])):
+                        hit[i] = True
+                        break
 
-    player, enemies, block_positions, bullets, explosions, game_over, winner = new_game()
+        hit |= out
+        gone = np.flatnonzero(hit)
+        if not len(gone):
+            return
+        # Explode in firing order, like the old per-bullet loop
+        for i in gone[np.argsort(pool.seq[gone])]:
+            self.explosions.append(Explosion((float(x[i]), float(y[i])),
+                                             self.explosion_radius('player' if owner[i] == OWNER_PLAYER else 'ai')))
+        pool.alive[gone] = False
+        pool.compact()
+
+    def update(self, dt, keys):
+        if self.game_over:
+            return
+        self.time += dt
+        player = self.player
+        block_positions = self.block_positions
+
+        # Player movement
+        player.update(dt, keys, block_positions)
+
+        # Enemy AI
+        ai_start = time.perf_counter()
+        self.ai.run(self.enemies, dt, player, block_positions,
+                    lambda enemy, fired: self.bullets.spawn(enemy.center, fired, OWNER_AI))
+        self.ai_time += time.perf_counter() - ai_start
+
+        # Bullets -> explosions
+        self.update_bullets(dt)
+
+        # Explosions effects
+        for ex in self.explosions[:]:
+            ex.update(dt)
+            if ex.should_apply_damage():
+                # destroy blocks in radius (only cells under the blast's bounding box)
+                for bl in blocks_in_radius(ex.pos[0], ex.pos[1], ex.radius, block_positions):
+                    self.remove_block(bl)
+                # damage player
+                if player.alive and circle_rect_overlap(ex.pos[0], ex.pos[1], ex.radius, player.rect):
+                    player.alive = False
+                    self.game_over = True
+                    self.winner = 'ai'
+                # damage enemies
+                for enemy in self.enemies:
+                    if enemy.alive and circle_rect_overlap(ex.pos[0], ex.pos[1], ex.radius, enemy.rect):
+                        enemy.alive = False
+                # win check
+                if not self.game_over and all(not e.alive for e in self.enemies):
+                    self.game_over = True
+                    self.winner = 'player'
+                ex.applied_damage = True
+            if ex.done:
+                self.explosions.remove(ex)
+
+def follow_camera(arena, view):
+    """Top-left world pixel of a view centered on the player, kept inside the arena."""
+    view_w, view_h = view
+    cx, cy = arena.player.center
+    return (int(clamp(cx - view_w // 2, 0, max(WIDTH - view_w, 0))),
+            int(clamp(cy - view_h // 2, 0, max(HEIGHT - view_h, 0))))
+
+def draw_arena(screen, arena, camera=None):
+    """Playfield only: background, blocks, tanks, bullets, explosions (no text).
+
+    Only what intersects the view (screen-sized, at world pixel `camera`) is drawn;
+    the camera follows the player by default.
+    """
+    if camera is None:
+        camera = follow_camera(arena, screen.get_size())
+    cam_x, cam_y = camera
+    view = pygame.Rect(cam_x, cam_y, *screen.get_size())
+
+    # Background and blocks: visible tiles of the incrementally patched layer
+    if arena.block_layer is None:
+        arena.block_layer = BlockLayer(arena.block_positions)
+    arena.block_layer.blit(screen, camera)
+
+    # Tanks
+    for t in [arena.player] + arena.enemies:
+        if view.colliderect(t.rect):
+            t.draw(screen, camera)
+
+    # Bullets
+    arena.bullets.draw(screen, camera)
+
+    # Explosions (frames reach ~1.25x the blast radius)
+    for ex in arena.explosions:
+        reach = ex.radius * 1.25 + 4
+        x, y = ex.pos
+        if view.left - reach <= x <= view.right + reach and view.top - reach <= y <= view.bottom + reach:
+            ex.draw(screen, camera)
+
+_minimap_cache = {}
+
+def draw_minimap(screen, arena, camera):
+    """Occupancy-grid minimap in the bottom-right corner, with tanks and the view outline."""
+    scale = MINIMAP_SIZE / max(ROWS, COLS)
+    size = (max(1, int(COLS * scale)), max(1, int(ROWS * scale)))
+    key = (id(arena), arena.block_version, size)
+    if _minimap_cache.get("key") != key:
+        grid = pygame.image.frombuffer(arena.occupancy, (COLS, ROWS), "P")
+        grid.set_palette([GRAY, DARK_GRAY] + [BLACK] * 254)
+        _minimap_cache["key"] = key
+        _minimap_cache["surface"] = pygame.transform.scale(grid, size)
+    view_w, view_h = screen.get_size()
+    pos = (view_w - size[0] - 8, view_h - size[1] - 8)
+    screen.blit(_minimap_cache["surface"], pos)
+    pygame.draw.rect(screen, BLACK, (pos[0] - 1, pos[1] - 1, size[0] + 2, size[1] + 2), 1)
+
+    def to_map(x, y):
+        return (pos[0] + int(x / CELL_SIZE * scale), pos[1] + int(y / CELL_SIZE * scale))
+    for enemy in arena.enemies:
+        if enemy.alive:
+            pygame.draw.rect(screen, ORANGE, (*to_map(*enemy.center), 2, 2))
+    if arena.player.alive:
+        pygame.draw.rect(screen, GREEN, (*to_map(*arena.player.center), 3, 3))
+    x0, y0 = to_map(*camera)
+    x1, y1 = to_map(camera[0] + view_w, camera[1] + view_h)
+    pygame.draw.rect(screen, WHITE, (x0, y0, max(x1 - x0, 1), max(y1 - y0, 1)), 1)
+
+def draw_hud(screen, arena, font, small_font, restart_rect):
+    """Buttons and game-over modal; returns the (new game, weapon, restart) click rects."""
+    # HUD: New Game
+    new_game_text = small_font.render("New Game", True, BLACK)
+    view_w, view_h = screen.get_size()
+    new_game_rect = new_game_text.get_rect(center=(view_w / 2, 14))
+    pygame.draw.rect(screen, WHITE, new_game_rect.inflate(16, 6))
+    pygame.draw.rect(screen, BLACK, new_game_rect.inflate(16, 6), 2)
+    screen.blit(new_game_text, new_game_rect)
+
+    # HUD: Weapon toggle
+    weapon_label = f"Weapon: {PLAYER_WEAPON_RADII[arena.player_weapon_idx]}px (T)"
+    weapon_text = small_font.render(weapon_label, True, BLACK)
+    weapon_rect = weapon_text.get_rect(midleft=(new_game_rect.right + 60, 14))
+    bg = weapon_rect.inflate(16, 6)
+    pygame.draw.rect(screen, WHITE, bg)
+    pygame.draw.rect(screen, BLACK, bg, 2)
+    screen.blit(weapon_text, weapon_rect)
+
+    if arena.game_over:
+        modal_w, modal_h = 420, 220
+        modal_surf = pygame.Surface((modal_w, modal_h), SRCALPHA)
+        modal_surf.fill((255, 255, 255, 220))
+        title_text = font.render("GAME OVER", True, BLACK)
+        modal_surf.blit(title_text, (110, 20))
+        outcome = "You Win!" if arena.winner == 'player' else "You Were Hit!"
+        outcome_text = pygame.font.SysFont(None, 32).render(outcome, True, BLACK)
+        modal_surf.blit(outcome_text, (110, 80))
+        hint_text = small_font.render("Press N or click below to continue", True, BLACK)
+        modal_surf.blit(hint_text, (70, 120))
+        restart_text = small_font.render("Restart", True, BLACK)
+        restart_rect_modal = restart_text.get_rect(center=(modal_w // 2, 170))
+        modal_surf.blit(restart_text, restart_rect_modal)
+        modal_pos = ((view_w - modal_w) / 2, (view_h - modal_h) / 2)
+        screen.blit(modal_surf, modal_pos)
+        # Global restart rect for click
+        restart_rect = restart_rect_modal.copy()
+        restart_rect.topleft = (modal_pos[0] + restart_rect_modal.left, modal_pos[1] + restart_rect_modal.top)
+    return new_game_rect, weapon_rect, restart_rect
+
+def main():
+    # Optional arena size: `python tank_duelGrok4GPT5Improved.py 128` (up to MAX_ARENA_SIZE)
+    if len(sys.argv) > 1:
+        set_arena_size(int(sys.argv[1]))
+    pygame.init()
+    screen = pygame.display.set_mode(view_size())
+    view_w, view_h = screen.get_size()
+    pygame.display.set_caption(f"Tank Duel — {COLS}x{ROWS} + Click-to-Build")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 44)
+    small_font = pygame.font.SysFont(None, 22)
+    warm_explosion_frames()
+
+    arena = Arena()
 
     # Pre-created HUD rects
-    new_game_rect = pygame.Rect(WIDTH // 2 - 60, 6, 120, 24)
-    weapon_rect = pygame.Rect(WIDTH // 2 + 120, 6, 180, 24)
+    new_game_rect = pygame.Rect(view_w // 2 - 60, 6, 120, 24)
+    weapon_rect = pygame.Rect(view_w // 2 + 120, 6, 180, 24)
     restart_rect = pygame.Rect(0, 0, 1, 1)
 
     running = True
@@ -436,185 +961,43 @@ def main():
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     running = False
-                if event.key == K_SPACE and not game_over and player.alive:
-                    # Fire (guard repeat)
-                    now = pygame.time.get_ticks() / 1000.0
-                    if now - last_player_fire >= PLAYER_FIRE_COOLDOWN:
-                        dir_vec = DIRECTIONS[player.facing]
-                        bullets.append(Bullet(player.center, dir_vec, BULLET_SPEED, owner='player'))
-                        last_player_fire = now
+                if event.key == K_SPACE:
+                    arena.fire_player()
                 if event.key == K_t:
-                    player_weapon_idx = (player_weapon_idx + 1) % len(PLAYER_WEAPON_RADII)
-                if game_over and event.key == K_n:
-                    player, enemies, block_positions, bullets, explosions, game_over, winner = new_game(advance=(winner == 'player'))
+                    arena.player_weapon_idx = (arena.player_weapon_idx + 1) % len(PLAYER_WEAPON_RADII)
+                if arena.game_over and event.key == K_n:
+                    arena.new_game(advance=(arena.winner == 'player'))
 
             if event.type == MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = event.pos
                 # HUD clicks
                 if new_game_rect.collidepoint(event.pos):
-                    level = 1
-                    player, enemies, block_positions, bullets, explosions, game_over, winner = new_game()
+                    arena.level = 1
+                    arena.new_game()
                     continue
                 if weapon_rect.collidepoint(event.pos):
-                    player_weapon_idx = 1 - player_weapon_idx
+                    arena.player_weapon_idx = 1 - arena.player_weapon_idx
                     continue
-                if game_over and restart_rect.collidepoint(event.pos):
-                    player, enemies, block_positions, bullets, explosions, game_over, winner = new_game(advance=(winner == 'player'))
+                if arena.game_over and restart_rect.collidepoint(event.pos):
+                    arena.new_game(advance=(arena.winner == 'player'))
                     continue
 
                 # --- NEW: click-to-build block ---
-                cell = cell_from_pos(mx, my)
+                cam_x, cam_y = follow_camera(arena, (view_w, view_h))
+                cell = cell_from_pos(mx + cam_x, my + cam_y)
                 if cell:
-                    r, c = cell
-                    # Only if space empty (no block) and no tank occupies that cell
-                    if (r, c) not in block_positions:
-                        cell_rect = get_block_rect((r, c))
-                        occupied = False
-                        if player.rect.colliderect(cell_rect):
-                            occupied = True
-                        else:
-                            for e in enemies:
-                                if e.rect.colliderect(cell_rect):
-                                    occupied = True
-                                    break
-                        if not occupied:
-                            block_positions.add((r, c))
+                    arena.build_block(*cell)
                 # ----------------------------------
 
         keys = pygame.key.get_pressed()
-
-        if not game_over:
-            block_rects = [get_block_rect(bl) for bl in block_positions]
-
-            # Player movement
-            player.update(dt, keys, block_rects)
-
-            # Enemy AI
-            e_bullets = []
-            for enemy in enemies:
-                e_bullet = enemy.update_ai(dt, player, block_positions, block_rects)
-                if e_bullet:
-                    e_bullets.append(e_bullet)
-            bullets.extend(e_bullets)
-
-            # Bullets -> explosions
-            for bullet in bullets[:]:
-                bullet.update(dt)
-                x, y = bullet.pos
-                out = not (0 < x < WIDTH and 0 < y < HEIGHT)
-
-                exploded = False
-                # Hit block?
-                if not exploded:
-                    for bl in list(block_positions):
-                        if get_block_rect(bl).collidepoint(bullet.pos):
-                            radius = PLAYER_WEAPON_RADII[player_weapon_idx] if bullet.owner == 'player' else ENEMY_EXPLOSION_RADIUS
-                            explosions.append(Explosion((x, y), radius))
-                            exploded = True
-                            break
-                # Hit player?
-                if not exploded and player.alive and player.rect.collidepoint(bullet.pos) and bullet.owner == 'ai':
-                    explosions.append(Explosion((x, y), ENEMY_EXPLOSION_RADIUS))
-                    exploded = True
-
-                # Hit enemy?
-                if not exploded and bullet.owner == 'player':
-                    for enemy in enemies:
-                        if enemy.alive and enemy.rect.collidepoint(bullet.pos):
-                            explosions.append(Explosion((x, y), PLAYER_WEAPON_RADII[player_weapon_idx]))
-                            exploded = True
-                            break
-
-                # Out of bounds -> explode
-                if out and not exploded:
-                    radius = PLAYER_WEAPON_RADII[player_weapon_idx] if bullet.owner == 'player' else ENEMY_EXPLOSION_RADIUS
-                    explosions.append(Explosion((x, y), radius))
-                    exploded = True
-
-                if exploded:
-                    bullets.remove(bullet)
-
-            # Explosions effects
-            for ex in explosions[:]:
-                ex.update(dt)
-                if ex.should_apply_damage():
-                    # destroy blocks in radius
-                    for bl in list(block_positions):
-                        if circle_rect_overlap(ex.pos[0], ex.pos[1], ex.radius, get_block_rect(bl)):
-                            block_positions.remove(bl)
-                    # damage player
-                    if player.alive and circle_rect_overlap(ex.pos[0], ex.pos[1], ex.radius, player.rect):
-                        player.alive = False
-                        game_over = True
-                        winner = 'ai'
-                    # damage enemies
-                    for enemy in enemies:
-                        if enemy.alive and circle_rect_overlap(ex.pos[0], ex.pos[1], ex.radius, enemy.rect):
-                            enemy.alive = False
-                    # win check
-                    if not game_over and all(not e.alive for e in enemies):
-                        game_over = True
-                        winner = 'player'
-                    ex.applied_damage = True
-                if ex.done:
-                    explosions.remove(ex)
+        arena.update(dt, keys)
 
         # ---------------- Draw ----------------
-        screen.fill(GRAY)
-        pygame.draw.rect(screen, BLACK, (0, 0, WIDTH, HEIGHT), 2)
-
-        # Blocks
-        for bl in block_positions:
-            pygame.draw.rect(screen, DARK_GRAY, get_block_rect(bl))
-
-        # Tanks
-        player.draw(screen)
-        for enemy in enemies:
-            enemy.draw(screen)
-
-        # Bullets
-        for bullet in bullets:
-            bullet.draw(screen)
-
-        # Explosions
-        for ex in explosions:
-            ex.draw(screen)
-
-        # HUD: New Game
-        new_game_text = small_font.render("New Game", True, BLACK)
-        new_game_rect = new_game_text.get_rect(center=(WIDTH / 2, 14))
-        pygame.draw.rect(screen, WHITE, new_game_rect.inflate(16, 6))
-        pygame.draw.rect(screen, BLACK, new_game_rect.inflate(16, 6), 2)
-        screen.blit(new_game_text, new_game_rect)
-
-        # HUD: Weapon toggle
-        weapon_label = f"Weapon: {PLAYER_WEAPON_RADII[player_weapon_idx]}px (T)"
-        weapon_text = small_font.render(weapon_label, True, BLACK)
-        weapon_rect = weapon_text.get_rect(midleft=(new_game_rect.right + 60, 14))
-        bg = weapon_rect.inflate(16, 6)
-        pygame.draw.rect(screen, WHITE, bg)
-        pygame.draw.rect(screen, BLACK, bg, 2)
-        screen.blit(weapon_text, weapon_rect)
-
-        if game_over:
-            modal_w, modal_h = 420, 220
-            modal_surf = pygame.Surface((modal_w, modal_h), SRCALPHA)
-            modal_surf.fill((255, 255, 255, 220))
-            title_text = font.render("GAME OVER", True, BLACK)
-            modal_surf.blit(title_text, (110, 20))
-            outcome = "You Win!" if winner == 'player' else "You Were Hit!"
-            outcome_text = pygame.font.SysFont(None, 32).render(outcome, True, BLACK)
-            modal_surf.blit(outcome_text, (110, 80))
-            hint_text = small_font.render("Press N or click below to continue", True, BLACK)
-            modal_surf.blit(hint_text, (70, 120))
-            restart_text = small_font.render("Restart", True, BLACK)
-            restart_rect_modal = restart_text.get_rect(center=(modal_w // 2, 170))
-            modal_surf.blit(restart_text, restart_rect_modal)
-            modal_pos = ((WIDTH - modal_w) / 2, (HEIGHT - modal_h) / 2)
-            screen.blit(modal_surf, modal_pos)
-            # Global restart rect for click
-            restart_rect = restart_rect_modal.copy()
-            restart_rect.topleft = (modal_pos[0] + restart_rect_modal.left, modal_pos[1] + restart_rect_modal.top)
+        camera = follow_camera(arena, (view_w, view_h))
+        draw_arena(screen, arena, camera)
+        if (WIDTH, HEIGHT) != (view_w, view_h):
+            draw_minimap(screen, arena, camera)
+        new_game_rect, weapon_rect, restart_rect = draw_hud(screen, arena, font, small_font, restart_rect)
 
         pygame.display.flip()
 
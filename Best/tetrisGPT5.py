@@ -27,6 +27,7 @@ VANISH_ROWS = 20               # Extra hidden rows above the visible field
 ROWS = VISIBLE_ROWS + VANISH_ROWS  # 40 high logical matrix
 SCREEN_W = 640                 # Playfield + sidebars
 SCREEN_H = CELL * VISIBLE_ROWS + 80
+WELL_X, WELL_Y = 40, 40         # Top-left of the visible playfield
 FPS = 60
 
 # DAS/ARR handling (in milliseconds)
@@ -145,6 +146,36 @@ def new_matrix():
 def copy_matrix(mat):
     return [row[:] for row in mat]
 
+class BackgroundCache:
+    # Well, grid lines and panel frames only change with the window size or colors,
+    # so they are painted once into a screen-format surface and blitted each frame
+    def __init__(self, render):
+        self.render = render   # render(surf) paints the static layer
+        self.key = None
+        self.surface = None
+
+    def blit(self, target, theme=None):
+        key = (target.get_size(), theme)
+        if key != self.key:
+            bg = pygame.Surface(target.get_size())
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert()
+            self.render(bg)
+            self.surface, self.key = bg, key
+        target.blit(self.surface, (0, 0))
+
+# Translucent overlays (pause / game over dim), filled once per size and color
+_SURFACE_POOL = {}
+
+def pooled_surface(size, rgba):
+    key = (size, rgba)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        _SURFACE_POOL[key] = surf
+    return surf
+
 def bag7():
     items = list("IJLOSTZ")
     random.shuffle(items)
@@ -188,6 +219,17 @@ class Game:
 
     def reset(self):
         self.board = new_matrix()
+        # Derived board state, maintained on lock/clear instead of rescanning the matrix:
+        # topmost filled row and fill count per column (ROWS/0 if empty), fill count per
+        # row, and hole/bumpiness totals. The version bumps so ghost lookups can be cached.
+        self.col_top = [ROWS] * COLS
+        self.col_fill = [0] * COLS
+        self.row_fill = [0] * ROWS
+        self._holes = 0
+        self._bumpiness = 0
+        self.board_version = 0
+        self._ghost_key = None
+        self._ghost_y = 0
         self.score = 0
         self.lines = 0
         self.level = 0
@@ -249,6 +291,7 @@ class Game:
                 for _ in range(2):
                     self.board.pop(0)
                     self.board.append([None for _ in range(COLS)])
+                self.rebuild_stats()
                 if not self.valid(p):
                     self.game_over = True
         self.active = p
@@ -286,9 +329,11 @@ class Game:
 
     def harddrop(self):
         if self.game_over or self.paused: return
-        dist = 0
-        while self.move(0, 1):
-            dist += 1
+        dist = self.ghost_drop_y() - self.active.y
+        if dist > 0:
+            p = self.active.clone()
+            p.y += dist
+            self.active = p
         self.score += 2 * dist
         self.lock_down(force=True)
 
@@ -356,13 +401,21 @@ class Game:
         # If force is False and piece isn't grounded, ignore
         if not force and not self.is_grounded(p):
             return
-        for (x, y) in p.cells():
-            if 0 <= y < ROWS:
-                self.board[y][x] = p.kind
+        cells = [(x, y) for (x, y) in p.cells() if 0 <= y < ROWS]
+        cols = {x for (x, _) in cells}
+        self.adjust_column_stats(cols, -1)
+        for (x, y) in cells:
+            self.board[y][x] = p.kind
+            if y < self.col_top[x]:
+                self.col_top[x] = y
+            self.col_fill[x] += 1
+            self.row_fill[y] += 1
+        self.adjust_column_stats(cols, +1)
+        self.board_version += 1
         self.pieces_placed += 1
 
-        # Check lines cleared
-        full_rows = [y for y in range(ROWS) if all(self.board[y][x] is not None for x in range(COLS))]
+        # Check lines cleared (only rows the piece touched can have become full)
+        full_rows = sorted({y for (_, y) in cells if self.row_fill[y] == COLS})
         # T-Spin detection (simplified, "3-corner" rule)
         tspin_type = self.detect_tspin(p, full_rows)
 
@@ -410,7 +463,60 @@ class Game:
         for idx in rows:
             del self.board[idx]
             self.board.insert(0, [None for _ in range(COLS)])
+            del self.row_fill[idx]
+            self.row_fill.insert(0, 0)
         self.lines += len(rows)
+        # Cells only move down or vanish, so each new top is at or below the old one
+        for x in range(COLS):
+            self.col_top[x] = self.scan_col_top(x, self.col_top[x])
+            self.col_fill[x] -= len(rows)
+        self.recount_surface()
+        self.board_version += 1
+
+    def scan_col_top(self, x, start=0):
+        for y in range(start, ROWS):
+            if self.board[y][x] is not None:
+                return y
+        return ROWS
+
+    def rebuild_stats(self):
+        # Full rescan; only needed when rows are shifted outside lock/clear (Zen top-out)
+        self.col_top = [self.scan_col_top(x) for x in range(COLS)]
+        self.col_fill = [sum(1 for y in range(ROWS) if self.board[y][x] is not None) for x in range(COLS)]
+        self.row_fill = [sum(1 for k in row if k is not None) for row in self.board]
+        self.recount_surface()
+        self.board_version += 1
+
+    def column_holes(self, x):
+        # Empty cells below the column's top block
+        return ROWS - self.col_top[x] - self.col_fill[x]
+
+    def adjust_column_stats(self, cols, sign):
+        # Add/remove the hole and bumpiness contributions of the given columns
+        pairs = {i for x in cols for i in (x - 1, x) if 0 <= i < COLS - 1}
+        self._holes += sign * sum(self.column_holes(x) for x in cols)
+        self._bumpiness += sign * sum(abs(self.col_top[i] - self.col_top[i + 1]) for i in pairs)
+
+    def recount_surface(self):
+        self._holes = 0
+        self._bumpiness = 0
+        self.adjust_column_stats(range(COLS), +1)
+
+    @property
+    def column_heights(self):
+        return tuple(ROWS - t for t in self.col_top)
+
+    @property
+    def row_fill_counts(self):
+        return tuple(self.row_fill)
+
+    @property
+    def holes(self):
+        return self._holes
+
+    @property
+    def bumpiness(self):
+        return self._bumpiness
 
     def apply_scoring(self, cleared, tspin_type):
         difficult = False
@@ -528,22 +634,13 @@ class Game:
 
     # ----------------------------- Render -------------------------------
 
-    def draw(self, surf, font_small, font_big):
-        surf.fill(BG)
-        # Playfield rect
-        well_x = 40
-        well_y = 40
+    def draw(self, surf, font_small, font_big, hud=True):
+        # hud=False skips all text (fonts may then be None); used for agent pixel observations
+        # Background, well and grid lines come from the cached static layer
+        WELL_BACKGROUND.blit(surf, (BG, GRID, WELL_BG))
+        well_x = WELL_X
+        well_y = WELL_Y
         well_w = COLS * CELL
-        well_h = VISIBLE_ROWS * CELL
-        pygame.draw.rect(surf, WELL_BG, (well_x-2, well_y-2, well_w+4, well_h+4), border_radius=8)
-
-        # Grid lines
-        for r in range(VISIBLE_ROWS + 1):
-            y = well_y + r * CELL
-            pygame.draw.line(surf, GRID, (well_x, y), (well_x + well_w, y))
-        for c in range(COLS + 1):
-            x = well_x + c * CELL
-            pygame.draw.line(surf, GRID, (x, well_y), (x, well_y + well_h))
 
         # Draw locked blocks (only visible rows)
         for y in range(VANISH_ROWS, ROWS):
@@ -567,33 +664,38 @@ class Game:
 
         # HUD (right sidebar)
         sidebar_x = well_x + well_w + 30
-        self.text(surf, font_big, f"{self.mode}", sidebar_x, 30)
-        self.text(surf, font_small, f"Score: {self.score}", sidebar_x, 80)
-        self.text(surf, font_small, f"Level: {self.level}", sidebar_x, 110)
-        self.text(surf, font_small, f"Lines: {self.lines}", sidebar_x, 140)
-        self.text(surf, font_small, f"PPS: {self.pps():.2f}", sidebar_x, 170)
-
-        time_y = 200
-        if self.mode == self.MODE_SPRINT:
-            self.text(surf, font_small, f"Target: {self.sprint_target}L", sidebar_x, time_y)
-            self.text(surf, font_small, f"Time: {self.elapsed:.2f}s", sidebar_x, time_y + 30)
-        elif self.mode == self.MODE_ULTRA:
-            remain = max(0, self.ultra_secs - self.elapsed)
-            self.text(surf, font_small, f"Time Left: {remain:.2f}s", sidebar_x, time_y)
-        else:
-            self.text(surf, font_small, f"Time: {self.elapsed:.2f}s", sidebar_x, time_y)
+        if hud:
+            self.text(surf, font_big, f"{self.mode}", sidebar_x, 30)
+            self.text(surf, font_small, f"Score: {self.score}", sidebar_x, 80)
+            self.text(surf, font_small, f"Level: {self.level}", sidebar_x, 110)
+            self.text(surf, font_small, f"Lines: {self.lines}", sidebar_x, 140)
+            self.text(surf, font_small, f"PPS: {self.pps():.2f}", sidebar_x, 170)
+
+            time_y = 200
+            if self.mode == self.MODE_SPRINT:
+                self.text(surf, font_small, f"Target: {self.sprint_target}L", sidebar_x, time_y)
+                self.text(surf, font_small, f"Time: {self.elapsed:.2f}s", sidebar_x, time_y + 30)
+            elif self.mode == self.MODE_ULTRA:
+                remain = max(0, self.ultra_secs - self.elapsed)
+                self.text(surf, font_small, f"Time Left: {remain:.2f}s", sidebar_x, time_y)
+            else:
+                self.text(surf, font_small, f"Time: {self.elapsed:.2f}s", sidebar_x, time_y)
 
         # --- RELOCATED UI: Hold & Next (only 1 next) ---
         box_w = CELL * 4 + 8
         hold_y = 260
-        self.text(surf, font_small, "HOLD", sidebar_x, hold_y - 24)
+        if hud:
+            self.text(surf, font_small, "HOLD", sidebar_x, hold_y - 24)
         self.draw_preview_box(surf, sidebar_x, hold_y, self.held)
 
         next_y = hold_y + box_w + 20  # stack below hold box
         next_kind = (list(self.nextq)[0] if len(self.nextq) > 0 else None)
-        self.text(surf, font_small, "NEXT", sidebar_x, next_y - 24)
+        if hud:
+            self.text(surf, font_small, "NEXT", sidebar_x, next_y - 24)
         self.draw_preview_box(surf, sidebar_x, next_y, next_kind)
 
+        if not hud:
+            return
         if self.paused:
             self.overlay(surf, "PAUSED (P to resume)", font_big)
         if self.game_over:
@@ -610,9 +712,7 @@ class Game:
         return self.pieces_placed / self.elapsed
 
     def overlay(self, surf, msg, font_big):
-        s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 150))
-        surf.blit(s, (0, 0))
+        surf.blit(pooled_surface((SCREEN_W, SCREEN_H), (0, 0, 0, 150)), (0, 0))
         lines = msg.split("\n")
         y = SCREEN_H // 2 - 40
         for line in lines:
@@ -654,10 +754,46 @@ class Game:
         surf.blit(font.render(s, True, TEXT), (x, y))
 
     def ghost_drop_y(self):
-        test = self.active.clone()
-        while self.valid(test):
-            test.y += 1
-        return test.y - 1
+        # Cached until the active piece moves/rotates or the board changes
+        p = self.active
+        key = (p.kind, p.x, p.y, p.rot, self.board_version)
+        if key != self._ghost_key:
+            self._ghost_key = key
+            self._ghost_y = self.surface_drop_y(p)
+        return self._ghost_y
+
+    def surface_drop_y(self, piece):
+        # Lowest piece cell per column vs. that column's surface height
+        bottoms = {}
+        for (x, y) in piece.cells():
+            if y > bottoms.get(x, -1):
+                bottoms[x] = y
+        for x, y in bottoms.items():
+            if y >= self.col_top[x]:
+                # Tucked under an overhang: the surface says nothing, step down instead
+                test = piece.clone()
+                while self.valid(test):
+                    test.y += 1
+                return test.y - 1
+        drop = min(self.col_top[x] - 1 - y for x, y in bottoms.items())
+        return piece.y + drop
+
+def draw_well_background(surf):
+    surf.fill(BG)
+    # Playfield rect
+    well_w = COLS * CELL
+    well_h = VISIBLE_ROWS * CELL
+    pygame.draw.rect(surf, WELL_BG, (WELL_X-2, WELL_Y-2, well_w+4, well_h+4), border_radius=8)
+
+    # Grid lines
+    for r in range(VISIBLE_ROWS + 1):
+        y = WELL_Y + r * CELL
+        pygame.draw.line(surf, GRID, (WELL_X, y), (WELL_X + well_w, y))
+    for c in range(COLS + 1):
+        x = WELL_X + c * CELL
+        pygame.draw.line(surf, GRID, (x, WELL_Y), (x, WELL_Y + well_h))
+
+WELL_BACKGROUND = BackgroundCache(draw_well_background)
 
 # ---------------------------- Menu & Main ------------------------------
 
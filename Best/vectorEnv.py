@@ -0,0 +1,489 @@
+# vectorEnv.py
+# Batched, window-less environments over the Best/ games for training and evaluating agents.
+#
+# VectorEnv hosts N independent copies of one game in this process and steps them all with
+# a single step(actions) call. Observations are small integer grids built from the game
+# state (Game.board, Board.bits, Level.grid, block_positions), never rendered pixels.
+# Finished episodes are reset automatically; the returned observation is then the first
+# one of the new episode and the finished score is reported in `infos`.
+#
+#   env = VectorEnv("tetris", 64, seed=0)
+#   obs = env.reset()                      # (64, 20, 10) int8
+#   obs, rewards, dones, infos = env.step(actions)
+#
+# For agents that need pixels, observation="pixels" renders every instance into its own
+# offscreen pygame.Surface and returns one pygame.surfarray.pixels3d view per instance
+# (shape (W, H, 3), no copy; a view kept across step() stays a snapshot of its frame, see
+# PixelFrame), and observation="gray" writes a grayscale frame downsampled
+# by `gray_step` straight into a stacked (N, H', W') uint8 buffer. hud=False (the default
+# for pixels) skips all text rendering, the most expensive part of each frame.
+#
+# Games and actions:
+#   tetris     8 actions: noop, left, right, rotate CW, rotate CCW, soft drop, hard drop, hold
+#   blockblast 3*n*n actions: slot * n*n + row * n + col (top-left of the piece; n = board size)
+#   pacman     5 actions: noop, left, right, up, down
+#   tank       6 actions: noop, up, down, left, right, fire
+#
+# Requires: pygame, numpy (pip install pygame numpy)
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import blockBlastGPT5 as blockblast
+import pacmanGPT5 as pacman
+import tank_duelGrok4GPT5Improved as tank
+import tetrisGPT5 as tetris
+
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed(): indexable by key constant."""
+
+    def __init__(self, *pressed):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+NO_KEYS = KeyState()
+
+
+class PixelFrame:
+    """Offscreen render target whose pixels are exposed to NumPy without copying.
+
+    `view` is pygame.surfarray.pixels3d(surface), shape (W, H, 3). A pixels3d view locks
+    the surface and pygame refuses to blit onto a locked surface, so the view is dropped
+    before each redraw and taken again afterwards. If the surface is still locked then,
+    someone else kept a view of the last frame (a replay buffer, a frame stack): render()
+    leaves that surface to them and draws into a fresh one of the same size and format,
+    so a kept view never changes and no frame is copied.
+    """
+
+    def __init__(self, surface, gray_step=0, gray_out=None):
+        self.surface = surface
+        self.view = None
+        self.gray_step = gray_step
+        self.gray = gray_out
+        if gray_out is not None:
+            # Scratch accumulators for the weighted sum, allocated once
+            self._acc = np.zeros(gray_out.shape, dtype=np.uint16)
+            self._tmp = np.zeros(gray_out.shape, dtype=np.uint16)
+
+    @staticmethod
+    def gray_shape(size, step):
+        w, h = size
+        return (-(-h // step), -(-w // step))
+
+    def render(self, draw, hud):
+        self.view = None
+        if self.surface.get_locked():
+            self.surface = pygame.Surface(self.surface.get_size(), self.surface.get_flags(), self.surface)
+        draw(self.surface, hud)
+        self.view = pygame.surfarray.pixels3d(self.surface)
+        if self.gray is not None:
+            self._to_gray()
+        return self.view
+
+    def _to_gray(self):
+        # ITU-R 601 luma with 8-bit fixed-point weights (77 + 150 + 29 = 256)
+        k = self.gray_step
+        small = self.view.transpose(1, 0, 2)[::k, ::k]
+        acc, tmp = self._acc, self._tmp
+        np.multiply(small[..., 0], 77, out=acc, dtype=np.uint16)
+        np.multiply(small[..., 1], 150, out=tmp, dtype=np.uint16)
+        acc += tmp
+        np.multiply(small[..., 2], 29, out=tmp, dtype=np.uint16)
+        acc += tmp
+        np.right_shift(acc, 8, out=self.gray, casting="unsafe")
+
+
+# ----------------------------- Tetris ---------------------------------
+
+class TetrisEnv:
+    # 0 empty, 1 locked block, 2 active piece (visible rows only)
+    obs_shape = (tetris.VISIBLE_ROWS, tetris.COLS)
+    num_actions = 8
+    frame_ms = 1000 // tetris.FPS
+
+    frame_size = (tetris.SCREEN_W, tetris.SCREEN_H)
+
+    def __init__(self, frame_skip=1):
+        self.frame_skip = frame_skip
+        self.game = None
+        self.fonts = None
+
+    def reset(self):
+        self.game = tetris.Game(tetris.Game.MODE_MARATHON)
+        return self.game
+
+    def make_surface(self):
+        return pygame.Surface(self.frame_size)
+
+    def draw(self, surface, hud):
+        if hud and self.fonts is None:
+            self.fonts = (pygame.font.SysFont("consolas", 20), pygame.font.SysFont("consolas", 28, bold=True))
+        font_small, font_big = self.fonts if hud else (None, None)
+        self.game.draw(surface, font_small, font_big, hud=hud)
+
+    def score(self):
+        return self.game.score
+
+    def step(self, action):
+        g = self.game
+        keys = NO_KEYS
+        if action == 1:
+            g.move(-1, 0)
+        elif action == 2:
+            g.move(+1, 0)
+        elif action == 3:
+            g.rotate(+1)
+        elif action == 4:
+            g.rotate(-1)
+        elif action == 5:
+            keys = KeyState(pygame.K_DOWN)
+        elif action == 6:
+            g.harddrop()
+        elif action == 7:
+            g.hold()
+        for _ in range(self.frame_skip):
+            if g.game_over:
+                break
+            g.update(self.frame_ms, keys)
+        return g.game_over
+
+    def observe(self, out):
+        g = self.game
+        out.fill(0)
+        for y in range(tetris.VANISH_ROWS, tetris.ROWS):
+            row = g.board[y]
+            for x in range(tetris.COLS):
+                if row[x] is not None:
+                    out[y - tetris.VANISH_ROWS, x] = 1
+        if not g.game_over:
+            for (x, y) in g.active.cells():
+                if y >= tetris.VANISH_ROWS:
+                    out[y - tetris.VANISH_ROWS, x] = 2
+
+
+# ---------------------------- Block Blast -----------------------------
+
+class BlockBlastEnv:
+    # channel 0: board occupancy; channels 1-3: tray piece masks anchored at (0, 0)
+    frame_size = (blockblast.WINDOW_W, blockblast.WINDOW_H)
+
+    def __init__(self, frame_skip=1):
+        self.game = blockblast.Game(headless=True)
+
+    # Sized from the board, which follows blockblast.set_grid_size() when the game is created
+    @property
+    def obs_shape(self):
+        n = self.game.board.n
+        return (4, n, n)
+
+    @property
+    def num_actions(self):
+        return 3 * self.game.board.n * self.game.board.n
+
+    def make_surface(self):
+        return self.game.screen
+
+    def draw(self, surface, hud):
+        self.game.screen = surface  # PixelFrame may hand over a fresh surface
+        self.game.draw_frame(hud=hud)
+
+    def reset(self):
+        self.game.start_game()
+        return self.game
+
+    def score(self):
+        return self.game.score
+
+    def step(self, action):
+        g = self.game
+        n = g.board.n
+        slot, cell = divmod(int(action), n * n)
+        top_r, left_c = divmod(cell, n)
+        if g.place_from_tray(slot, top_r, left_c):
+            # No flash animation between agent steps: apply pending clears now
+            g.board.commit_clears_if_due(blockblast.FLASH_MS)
+        return g.state == blockblast.STATE_GAMEOVER
+
+    def observe(self, out):
+        g = self.game
+        out.fill(0)
+        bits = g.board.bits
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            out[0].flat[low.bit_length() - 1] = 1
+        for i, piece in enumerate(g.tray):
+            if piece is not None:
+                for r, c in piece.cells:
+                    out[i + 1, r, c] = 1
+
+
+# ------------------------------ Pac-Man -------------------------------
+
+PACMAN_TILE_CODES = {'#': 1, '.': 2, 'o': 3, '-': 4}
+PACMAN_KEYS = [None, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]
+
+
+class PacManEnv:
+    # 0 floor, 1 wall, 2 pellet, 3 power pellet, 4 gate,
+    # 5 player, 6 ghost, 7 frightened ghost, 8 ghost eyes
+    obs_shape = (pacman.GRID_H, pacman.GRID_W)
+    num_actions = 5
+    frame_dt = 1.0 / pacman.FPS
+
+    frame_size = (pacman.WIDTH, pacman.HEIGHT)
+
+    def __init__(self, frame_skip=4):
+        self.frame_skip = frame_skip
+        self.game = pacman.Game(headless=True)
+
+    def make_surface(self):
+        return self.game.screen
+
+    def draw(self, surface, hud):
+        self.game.screen = surface  # PixelFrame may hand over a fresh surface
+        self.game.draw_frame(hud=hud)
+
+    def reset(self):
+        g = self.game
+        g.restart()
+        g.begin_play()  # skip the READY! countdown
+        return g
+
+    def score(self):
+        return self.game.score
+
+    def step(self, action):
+        g = self.game
+        key = PACMAN_KEYS[action]
+        keys = KeyState(key) if key is not None else NO_KEYS
+        for _ in range(self.frame_skip):
+            if g.state == "game_over":
+                break
+            g.update(self.frame_dt, keys)
+        return g.state == "game_over"
+
+    def observe(self, out):
+        g = self.game
+        out.fill(0)
+        level = g.level
+        for r in range(min(level.h, out.shape[0])):
+            row = level.grid[r]
+            for c in range(min(level.w, out.shape[1])):
+                code = PACMAN_TILE_CODES.get(row[c])
+                if code:
+                    out[r, c] = code
+        for ghost in g.ghosts:
+            if ghost.state == "frightened":
+                code = 7
+            elif ghost.state in ("eyes", "eyes_wait"):
+                code = 8
+            else:
+                code = 6
+            self._mark(out, ghost.pos_grid(), code)
+        self._mark(out, g.player.pos_grid(), 5)
+
+    @staticmethod
+    def _mark(out, tile, code):
+        c, r = tile
+        if 0 <= r < out.shape[0] and 0 <= c < out.shape[1]:
+            out[r, c] = code
+
+
+# ----------------------------- Tank Duel ------------------------------
+
+TANK_KEYS = [None, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+
+class TankDuelEnv:
+    # 0 empty, 1 block, 2 player, 3 enemy, 4 bullet
+    num_actions = 6
+    frame_dt = 1.0 / 60
+
+    def __init__(self, frame_skip=2):
+        # Sized from the arena as set_arena_size() left it when this env was made
+        self.obs_shape = (tank.ROWS, tank.COLS)
+        self.frame_size = tank.view_size()
+        self.frame_skip = frame_skip
+        self.arena = None
+        self.kills = 0
+        self.fonts = None
+
+    def make_surface(self):
+        return pygame.Surface(self.frame_size)
+
+    def draw(self, surface, hud):
+        tank.draw_arena(surface, self.arena)
+        if hud:
+            if self.fonts is None:
+                self.fonts = (pygame.font.SysFont(None, 44), pygame.font.SysFont(None, 22))
+            tank.draw_hud(surface, self.arena, *self.fonts, pygame.Rect(0, 0, 1, 1))
+
+    def reset(self):
+        self.arena = tank.Arena()
+        self.kills = 0
+        return self.arena
+
+    def score(self):
+        # Enemies destroyed, minus one if the player was hit
+        return self.kills - (1 if self.arena.winner == 'ai' else 0)
+
+    def step(self, action):
+        a = self.arena
+        keys = NO_KEYS
+        if action == 5:
+            a.fire_player()
+        elif action:
+            keys = KeyState(TANK_KEYS[action])
+        for _ in range(self.frame_skip):
+            if a.game_over:
+                break
+            a.update(self.frame_dt, keys)
+        self.kills = sum(1 for e in a.enemies if not e.alive)
+        return a.game_over
+
+    def observe(self, out):
+        a = self.arena
+        out.fill(0)
+        for r, c in a.block_positions:
+            out[r, c] = 1
+        for enemy in a.enemies:
+            if enemy.alive:
+                self._mark(out, enemy.center, 3)
+        if a.player.alive:
+            self._mark(out, a.player.center, 2)
+        for pos in zip(*a.bullets.positions()):
+            self._mark(out, pos, 4)
+
+    @staticmethod
+    def _mark(out, pos, code):
+        cell = tank.cell_from_pos(pos[0], pos[1])
+        if cell:
+            out[cell] = code
+
+
+GAMES = {
+    "tetris": TetrisEnv,
+    "blockblast": BlockBlastEnv,
+    "pacman": PacManEnv,
+    "tank": TankDuelEnv,
+}
+
+
+# ----------------------------- VectorEnv ------------------------------
+
+OBSERVATIONS = ("grid", "pixels", "gray")
+
+
+class VectorEnv:
+    """N independent instances of one game, stepped together with stacked NumPy results."""
+
+    def __init__(self, game, num_envs, seed=None, observation="grid", gray_step=4, hud=False,
+                 **env_kwargs):
+        if game not in GAMES:
+            raise ValueError(f"unknown game {game!r}; choose from {sorted(GAMES)}")
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"unknown observation {observation!r}; choose from {OBSERVATIONS}")
+        if seed is not None:
+            random.seed(seed)
+        self.rng = np.random.default_rng(seed)  # for sample_actions; the games use `random`
+        pygame.init()
+        cls = GAMES[game]
+        self.game = game
+        self.num_envs = num_envs
+        self.envs = [cls(**env_kwargs) for _ in range(num_envs)]
+        self.observation = observation
+        self.hud = hud
+        # Shapes come from an instance: some games size them from the current board or arena
+        env = self.envs[0]
+        self.num_actions = env.num_actions
+        # Grid and gray buffers are reused every step; copy them if you keep observations
+        # around. Pixel views are not reused once kept (see PixelFrame).
+        self.frames = []
+        if observation == "grid":
+            self.observation_shape = env.obs_shape
+            self.obs = np.zeros((num_envs,) + self.observation_shape, dtype=np.int8)
+        elif observation == "gray":
+            self.observation_shape = PixelFrame.gray_shape(env.frame_size, gray_step)
+            self.obs = np.zeros((num_envs,) + self.observation_shape, dtype=np.uint8)
+            self.frames = [PixelFrame(env.make_surface(), gray_step, self.obs[i])
+                           for i, env in enumerate(self.envs)]
+        else:
+            self.observation_shape = env.frame_size + (3,)
+            self.obs = [None] * num_envs
+            self.frames = [PixelFrame(env.make_surface()) for env in self.envs]
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.last_scores = [0] * num_envs
+
+    def reset(self):
+        for i, env in enumerate(self.envs):
+            env.reset()
+            self.last_scores[i] = env.score()
+            self._observe(i)
+        return self.obs
+
+    def _observe(self, i):
+        env = self.envs[i]
+        if self.observation == "grid":
+            env.observe(self.obs[i])
+        elif self.observation == "gray":
+            self.frames[i].render(env.draw, self.hud)
+        else:
+            # Drop our reference to the old view first so the surface unlocks for drawing
+            self.obs[i] = None
+            self.obs[i] = self.frames[i].render(env.draw, self.hud)
+
+    def step(self, actions):
+        infos = []
+        for i, env in enumerate(self.envs):
+            done = env.step(int(actions[i]))
+            score = env.score()
+            self.rewards[i] = score - self.last_scores[i]
+            self.dones[i] = done
+            info = {}
+            if done:
+                info["episode_score"] = score
+                env.reset()
+                score = env.score()
+            self.last_scores[i] = score
+            self._observe(i)
+            infos.append(info)
+        return self.obs, self.rewards, self.dones, infos
+
+    def sample_actions(self):
+        return self.rng.integers(0, self.num_actions, size=self.num_envs)
+
+
+def main():
+    # Quick throughput check with random actions
+    import sys
+    import time
+    game = sys.argv[1] if len(sys.argv) > 1 else "tetris"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    observation = sys.argv[3] if len(sys.argv) > 3 else "grid"
+    env = VectorEnv(game, n, seed=0, observation=observation)
+    env.reset()
+    steps = 0
+    episodes = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 5.0:
+        _, _, dones, _ = env.step(env.sample_actions())
+        steps += n
+        episodes += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    print(f"{game} x{n} ({observation}): {steps / elapsed:,.0f} env steps/s, {episodes} episodes finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,25 +62,53 @@ SHAPES = [
     [[[1, 0], [0, 1], [1, 1], [2, 1], [1, 2]]],
 ]
 
+# Every shape variant, flattened; Block.kind indexes this list
+VARIANTS = [variant for group in SHAPES for variant in group]
+
+# --- Placement Index ---
+# Every in-bounds placement of every variant as (kind, cells), and for each cell the
+# placements covering it, so the game can count legal placements incrementally.
+PLACEMENTS = []
+COVERING = [[[] for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+for kind, variant in enumerate(VARIANTS):
+    for row in range(GRID_SIZE - max(r for r, _ in variant)):
+        for col in range(GRID_SIZE - max(c for _, c in variant)):
+            cells = [(row + r, col + c) for r, c in variant]
+            for r, c in cells:
+                COVERING[r][c].append(len(PLACEMENTS))
+            PLACEMENTS.append((kind, cells))
+
 # High score file
 HIGH_SCORE_FILE = "highscore.txt"
 
+# --- Surface Pool ---
+# Translucent fills are built once per (size, color) and reused every frame.
+_SURFACE_POOL = {}
+
+def pooled_surface(size, rgba):
+    key = (size, rgba)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        _SURFACE_POOL[key] = surf
+    return surf
+
 # --- Game Classes ---
 
 class Block:
     """Represents a single block piece with its shape, color, and position."""
     def __init__(self, shape, color_index):
         self.shape = shape
+        self.kind = VARIANTS.index(shape)
         self.color_index = color_index
         self.color = BLOCK_COLORS[color_index]
         self.screen_pos = [0, 0]
 
     def draw(self, screen, pos, cell_size, alpha=255):
         """Draws the block on the screen."""
+        surface = pooled_surface((cell_size, cell_size), (*self.color, alpha))
         for r_off, c_off in self.shape:
-            # Create a surface for transparency
-            surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            surface.fill((*self.color, alpha))
             screen.blit(surface, (pos[0] + c_off * cell_size, pos[1] + r_off * cell_size))
 
 class Game:
@@ -100,6 +128,11 @@ class Game:
     def reset_game(self):
         """Initializes or resets the game state."""
         self.grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        # Filled cells under each placement, and how many placements of each kind have none
+        self.blocked = [0] * len(PLACEMENTS)
+        self.legal_counts = [0] * len(VARIANTS)
+        for kind, _ in PLACEMENTS:
+            self.legal_counts[kind] += 1
         self.score = 0
         self.available_blocks = []
         self.generate_new_blocks()
@@ -203,7 +236,7 @@ class Game:
         if self.is_valid_placement(self.dragging_block, grid_row, grid_col):
             # Place the block
             for r_off, c_off in self.dragging_block.shape:
-                self.grid[grid_row + r_off][grid_col + c_off] = self.dragging_block.color_index + 1
+                self.set_cell(grid_row + r_off, grid_col + c_off, self.dragging_block.color_index + 1)
 
             # Score for placing block (e.g., 1 point per square)
             self.score += len(self.dragging_block.shape)
@@ -222,6 +255,22 @@ class Game:
                     self.high_score = self.score
                     self.save_high_score()
 
+    def set_cell(self, r, c, value):
+        """Sets a grid cell (0 = empty) and updates the legal placement counts over it."""
+        if bool(self.grid[r][c]) == bool(value):
+            self.grid[r][c] = value
+            return
+        self.grid[r][c] = value
+        for p in COVERING[r][c]:
+            if value:
+                if not self.blocked[p]:
+                    self.legal_counts[PLACEMENTS[p][0]] -= 1
+                self.blocked[p] += 1
+            else:
+                self.blocked[p] -= 1
+                if not self.blocked[p]:
+                    self.legal_counts[PLACEMENTS[p][0]] += 1
+
     def is_valid_placement(self, block, grid_row, grid_col):
         """Checks if a block can be placed at a specific grid location."""
         for r_off, c_off in block.shape:
@@ -246,12 +295,12 @@ class Game:
         # Clear rows
         for r in full_rows:
             for c in range(GRID_SIZE):
-                self.grid[r][c] = 0
+                self.set_cell(r, c, 0)
 
         # Clear columns
         for c in full_cols:
             for r in range(GRID_SIZE):
-                self.grid[r][c] = 0
+                self.set_cell(r, c, 0)
 
         # After clearing, make blocks fall
         if full_rows or full_cols:
@@ -263,12 +312,8 @@ class Game:
 
     def check_game_over(self):
         """Checks if any of the available blocks can be placed on the grid."""
-        for block in self.available_blocks:
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    if self.is_valid_placement(block, r, c):
-                        return False # Found a valid move
-        return True # No valid moves for any available block
+        # legal_counts is kept current by set_cell, so this reads one counter per block
+        return not any(self.legal_counts[block.kind] for block in self.available_blocks)
 
     def draw(self):
         """Draws all game elements to the screen."""
@@ -294,9 +339,8 @@ class Game:
             ghost_pos = (GRID_X + grid_col * CELL_SIZE, GRID_Y + grid_row * CELL_SIZE)
 
             # Draw individual cells for transparency
+            surface = pooled_surface((CELL_SIZE, CELL_SIZE), ghost_color)
             for r_off, c_off in self.dragging_block.shape:
-                surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-                surface.fill(ghost_color)
                 self.screen.blit(surface, (ghost_pos[0] + c_off * CELL_SIZE, ghost_pos[1] + r_off * CELL_SIZE))
 
             # Draw the actual block being dragged on top
@@ -338,9 +382,7 @@ class Game:
     def show_game_over_screen(self):
         """Displays the game over modal and waits for player action."""
         # Create a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(pooled_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 180)), (0, 0))
 
         # Game Over text
         game_over_text = self.font_large.render("GAME OVER", True, WHITE)
@@ -53,6 +53,18 @@ SHAPES = [
     # More complex if needed, but keep simple
 ]
 
+# Every in-bounds placement of every shape as (shape index, cells), and for each cell the
+# placements covering it, so legal placements per shape can be counted incrementally
+PLACEMENTS = []
+COVERING = {(x, y): [] for x in range(GRID_SIZE) for y in range(GRID_SIZE)}
+for kind, shape in enumerate(SHAPES):
+    for y in range(GRID_SIZE - max(dy for dx, dy in shape)):
+        for x in range(GRID_SIZE - max(dx for dx, dy in shape)):
+            cells = [(x + dx, y + dy) for dx, dy in shape]
+            for cell in cells:
+                COVERING[cell].append(len(PLACEMENTS))
+            PLACEMENTS.append((kind, cells))
+
 HIGH_SCORE_FILE = "high_score.txt"
 
 def load_high_score():
@@ -68,6 +80,7 @@ def save_high_score(score):
 class Block:
     def __init__(self, shape, color):
         self.shape = shape
+        self.kind = SHAPES.index(shape)
         self.color = color
         self.x = 0
         self.y = 0
@@ -86,6 +99,11 @@ class Block:
 class Game:
     def __init__(self):
         self.grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        # filled cells under each placement, and placements with none per shape
+        self.blocked = [0] * len(PLACEMENTS)
+        self.legal = [0] * len(SHAPES)
+        for kind, cells in PLACEMENTS:
+            self.legal[kind] += 1
         self.score = 0
         self.high_score = load_high_score()
         self.blocks = self.generate_blocks()
@@ -141,11 +159,25 @@ class Game:
                 return False
         return True
 
+    def fill_cell(self, x, y, color):
+        self.grid[y][x] = color
+        for p in COVERING[(x, y)]:
+            if not self.blocked[p]:
+                self.legal[PLACEMENTS[p][0]] -= 1
+            self.blocked[p] += 1
+
+    def empty_cell(self, x, y):
+        self.grid[y][x] = None
+        for p in COVERING[(x, y)]:
+            self.blocked[p] -= 1
+            if not self.blocked[p]:
+                self.legal[PLACEMENTS[p][0]] += 1
+
     def place_block(self, block, grid_x, grid_y):
         for dx, dy in block.shape:
             x = grid_x + dx
             y = grid_y + dy
-            self.grid[y][x] = block.color
+            self.fill_cell(x, y, block.color)
         lines_cleared = self.clear_lines()
         self.score += lines_cleared * 10
         if lines_cleared > 1:
@@ -160,23 +192,19 @@ class Game:
         for i in range(GRID_SIZE):
             if all(self.grid[i][j] for j in range(GRID_SIZE)):
                 for j in range(GRID_SIZE):
-                    self.grid[i][j] = None
+                    self.empty_cell(j, i)
                 lines_cleared += 1
         # Clear columns
         for j in range(GRID_SIZE):
             if all(self.grid[i][j] for i in range(GRID_SIZE)):
                 for i in range(GRID_SIZE):
-                    self.grid[i][j] = None
+                    self.empty_cell(j, i)
                 lines_cleared += 1
         return lines_cleared
 
     def check_game_over(self):
-        for block in self.blocks:
-            for i in range(GRID_SIZE):
-                for j in range(GRID_SIZE):
-                    if self.can_place(block, j, i):
-                        return False
-        return True
+        # self.legal is kept up to date by fill_cell/empty_cell, so no board scan
+        return not any(self.legal[block.kind] for block in self.blocks)
 
 def main():
     pygame.init()
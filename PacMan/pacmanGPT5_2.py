@@ -109,10 +109,10 @@ MAZE_LAYOUT = [
 # Helpers
 # ------------------------------------------------
 DIRS = {
-    "left":  pygame.Vector2(-1, 0),
-    "right": pygame.Vector2(1, 0),
-    "up":    pygame.Vector2(0, -1),
-    "down":  pygame.Vector2(0, 1),
+    "left":  (-1, 0),
+    "right": (1, 0),
+    "up":    (0, -1),
+    "down":  (0, 1),
 }
 ORDERED_DIRS = ["up", "left", "down", "right"]
 OPPOSITE = {"left": "right", "right": "left", "up": "down", "down": "up"}
@@ -120,6 +120,13 @@ OPPOSITE = {"left": "right", "right": "left", "up": "down", "down": "up"}
 def in_bounds(c, r):
     return 0 <= c < GRID_W and 0 <= r < GRID_H
 
+def wrap_tile(c, r):
+    # the tunnel row joins the left and right edges
+    if r == TUNNEL_ROW and not in_bounds(c, r):
+        if c < 0: c = GRID_W - 1
+        if c >= GRID_W: c = 0
+    return c, r
+
 def tile_center_px(c, r):
     return (
         MAZE_OFFSET_X + c * TILE + TILE // 2,
@@ -169,6 +176,31 @@ class Maze:
                 elif ch == "P":
                     self.pac_start = (c, r)
                     self.raw[r][c] = " "
+        # exits[r][c][dir] -> the tile a step that way leads to (tunnel wrapped),
+        # present only for the directions that mover may take
+        self.pac_exits = self._build_exits(self.passable_for_pac)
+        self.ghost_exits = self._build_exits(self.passable_for_ghost)
+        self.gate_exits = self._build_exits(lambda c, r: self.passable_for_ghost(c, r, can_use_gate=True))
+
+    def _build_exits(self, passable):
+        exits = []
+        for r in range(GRID_H):
+            row = []
+            for c in range(GRID_W):
+                tile_exits = {}
+                for d in ORDERED_DIRS:
+                    dc, dr = DIRS[d]
+                    nc, nr = wrap_tile(c + dc, r + dr)
+                    if passable(nc, nr):
+                        tile_exits[d] = (nc, nr)
+                row.append(tile_exits)
+            exits.append(row)
+        return exits
+
+    def exits_for(self, for_ghost=False, can_use_gate=False):
+        if not for_ghost:
+            return self.pac_exits
+        return self.gate_exits if can_use_gate else self.ghost_exits
 
     def passable_for_pac(self, c, r):
         if not in_bounds(c, r):
@@ -229,55 +261,40 @@ class TileStepper:
     def set_buffer(self, dir_name):
         self.next_buffer = dir_name
 
-    def can_enter(self, c, r, for_ghost=False, can_use_gate=False):
-        if for_ghost:
-            return self.maze.passable_for_ghost(c, r, can_use_gate=can_use_gate)
-        return self.maze.passable_for_pac(c, r)
-
     def at_center(self):
         cx, cy = tile_center_px(self.c, self.r)
         return abs(self.pos.x - cx) < 0.5 and abs(self.pos.y - cy) < 0.5
 
-    def _try_commit_turn_at_center(self, for_ghost=False, can_use_gate=False):
+    def _try_commit_turn_at_center(self, exits):
         if not self.next_buffer:
             return False
-        dc, dr = int(DIRS[self.next_buffer].x), int(DIRS[self.next_buffer].y)
-        nc, nr = self.c + dc, self.r + dr
-        # tunnel wrap preview
-        if nr == TUNNEL_ROW and not in_bounds(nc, nr):
-            if nc < 0: nc = GRID_W - 1
-            if nc >= GRID_W: nc = 0
-        if self.can_enter(nc, nr, for_ghost=for_ghost, can_use_gate=can_use_gate):
+        if self.next_buffer in exits[self.r][self.c]:
             self.dir_name = self.next_buffer
             self.next_buffer = None
             return True
         return False
 
-    def _forward_target_tile(self):
+    def _forward_target_tile(self, exits):
+        # next tile straight ahead (tunnel wrap applied), None if stopped or blocked
         if not self.dir_name:
-            return self.c, self.r
-        dc, dr = int(DIRS[self.dir_name].x), int(DIRS[self.dir_name].y)
-        nc, nr = self.c + dc, self.r + dr
-        # tunnel wrap
-        if nr == TUNNEL_ROW and not in_bounds(nc, nr):
-            if nc < 0: nc = GRID_W - 1
-            if nc >= GRID_W: nc = 0
-        return nc, nr
+            return None
+        return exits[self.r][self.c].get(self.dir_name)
 
     def tick(self, dt, for_ghost=False, can_use_gate=False):
+        exits = self.maze.exits_for(for_ghost, can_use_gate)
         # If sitting at center, first try to take buffered turn.
         if self.at_center():
             cx, cy = tile_center_px(self.c, self.r)
             self.pos.update(cx, cy)
-            if self._try_commit_turn_at_center(for_ghost=for_ghost, can_use_gate=can_use_gate):
+            if self._try_commit_turn_at_center(exits):
                 pass  # committed the turn
             # If no current dir, try to set from buffer straight ahead
             if not self.dir_name and self.next_buffer:
-                self._try_commit_turn_at_center(for_ghost=for_ghost, can_use_gate=can_use_gate)
+                self._try_commit_turn_at_center(exits)
 
         # Decide forward tile and whether movement is possible
-        target_c, target_r = self._forward_target_tile()
-        can_go = self.dir_name and self.can_enter(target_c, target_r, for_ghost=for_ghost, can_use_gate=can_use_gate)
+        target = self._forward_target_tile(exits)
+        can_go = target is not None
 
         # Move along the center-to-center line
         if can_go:
@@ -286,12 +303,12 @@ class TileStepper:
             # advance whole tiles if accumulated
             while self.progress_px >= TILE:
                 # arrive exactly at next tile center
-                self.c, self.r = target_c, target_r
+                self.c, self.r = target
                 self.pos.update(*tile_center_px(self.c, self.r))
                 self.progress_px -= TILE
-                # tunnel wrap already applied in _forward_target_tile
-                target_c, target_r = self._forward_target_tile()
-                can_go = self.dir_name and self.can_enter(target_c, target_r, for_ghost=for_ghost, can_use_gate=can_use_gate)
+                # tunnel wrap already applied in the exit tables
+                target = self._forward_target_tile(exits)
+                can_go = target is not None
                 if not can_go:
                     self.progress_px = 0.0
                     break
@@ -300,7 +317,7 @@ class TileStepper:
             if can_go and self.progress_px > 0:
                 # set position between centers along dir
                 cx, cy = tile_center_px(self.c, self.r)
-                dx, dy = DIRS[self.dir_name].x, DIRS[self.dir_name].y
+                dx, dy = DIRS[self.dir_name]
                 self.pos.x = cx + dx * self.progress_px
                 self.pos.y = cy + dy * self.progress_px
         else:
@@ -361,7 +378,7 @@ class Pacman:
 
     @property
     def pos(self):
-        return pygame.Vector2(*tile_center_px(self.stepper.c, self.stepper.r)) if self.stepper.at_center() else self.stepper.pos
+        return tile_center_px(self.stepper.c, self.stepper.r) if self.stepper.at_center() else (self.stepper.pos.x, self.stepper.pos.y)
 
     def draw(self, surf):
         x, y = int(self.stepper.pos.x), int(self.stepper.pos.y)
@@ -448,19 +465,12 @@ class Ghost:
         cx, cy = tile_center_px(self.stepper.c, self.stepper.r)
         self.stepper.pos.update(cx, cy)
 
+        exits = self.maze.exits_for(for_ghost=True, can_use_gate=self.can_use_gate())[self.stepper.r][self.stepper.c]
+        reverse = OPPOSITE[self.stepper.dir_name] if self.stepper.dir_name else None
+
         # frightened => random valid (no reverse bias)
         if self.state == "frightened":
-            moves = []
-            for d in ORDERED_DIRS:
-                if self.stepper.dir_name and d == OPPOSITE[self.stepper.dir_name]:
-                    continue
-                dc, dr = int(DIRS[d].x), int(DIRS[d].y)
-                nc, nr = self.stepper.c + dc, self.stepper.r + dr
-                if nr == TUNNEL_ROW and not in_bounds(nc, nr):
-                    if nc < 0: nc = GRID_W - 1
-                    if nc >= GRID_W: nc = 0
-                if self.maze.passable_for_ghost(nc, nr, can_use_gate=self.can_use_gate()):
-                    moves.append(d)
+            moves = [d for d in ORDERED_DIRS if d != reverse and d in exits]
             if not moves and self.stepper.dir_name:
                 moves = [OPPOSITE[self.stepper.dir_name]]
             if moves:
@@ -470,16 +480,9 @@ class Ghost:
         # chase/scatter
         best_d, best_h = None, 10**9
         for d in ORDERED_DIRS:
-            if self.stepper.dir_name and d == OPPOSITE[self.stepper.dir_name]:
-                continue
-            dc, dr = int(DIRS[d].x), int(DIRS[d].y)
-            nc, nr = self.stepper.c + dc, self.stepper.r + dr
-            if nr == TUNNEL_ROW and not in_bounds(nc, nr):
-                if nc < 0: nc = GRID_W - 1
-                if nc >= GRID_W: nc = 0
-            if not self.maze.passable_for_ghost(nc, nr, can_use_gate=self.can_use_gate()):
+            if d == reverse or d not in exits:
                 continue
-            h = manhattan((nc, nr), target_tile)
+            h = manhattan(exits[d], target_tile)
             if h < best_h:
                 best_h, best_d = h, d
         if best_d is None and self.stepper.dir_name:
@@ -684,10 +687,9 @@ class Game:
             elif g.state == "in_house":
                 # pace left/right inside house
                 if g.at_center():
+                    exits = self.maze.gate_exits[g.tile[1]][g.tile[0]]
                     for d in ("left", "right"):
-                        dc, dr = int(DIRS[d].x), int(DIRS[d].y)
-                        nc, nr = g.tile[0] + dc, g.tile[1] + dr
-                        if (nc, nr) in self.house_tiles and self.maze.passable_for_ghost(nc, nr, can_use_gate=True):
+                        if exits.get(d) in self.house_tiles:
                             g.stepper.dir_name = d
                             break
                 target = g.tile
@@ -707,10 +709,11 @@ class Game:
                     self.release_queue.append(g)
 
         # collisions
-        ppos = self.player.pos
+        px, py = self.player.pos
         for g in self.ghosts:
             gpos = g.stepper.pos
-            if (ppos - gpos).length_squared() <= (self.player.radius + g.radius) ** 2:
+            dx, dy = px - gpos.x, py - gpos.y
+            if dx * dx + dy * dy <= (self.player.radius + g.radius) ** 2:
                 if g.state == "frightened":
                     points = GHOST_EAT_SCORES[min(self.chain, len(GHOST_EAT_SCORES)-1)]
                     self.score += points
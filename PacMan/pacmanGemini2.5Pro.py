@@ -8,6 +8,8 @@
 import pygame
 import random
 import math
+import heapq
+import itertools
 from collections import deque
 
 # --- Game Constants ---
@@ -15,6 +17,8 @@ SCREEN_WIDTH = 672  # 28 tiles * 24 px
 SCREEN_HEIGHT = 768  # 32 tiles * 24 px
 TILE_SIZE = 24
 FPS = 60
+SIM_STEP_MS = 1000 / FPS  # the simulation always advances in steps of this much simulated time
+MAX_STEPS_PER_FRAME = 5  # a slow frame catches up by at most this many steps
 
 # --- Colors ---
 BLACK = (0, 0, 0)
@@ -37,8 +41,21 @@ FRIGHTEN_DURATION = 6000  # 6 seconds
 FRIGHTEN_FLASH_DURATION = 2000
 GHOST_POINTS = [200, 400, 800, 1600]
 
-# --- Ghost Mode Timers (in frames) ---
-MODE_SWITCH_TIMES = [7 * FPS, 20 * FPS, 7 * FPS, 20 * FPS, 5 * FPS, 20 * FPS, 5 * FPS, -1]
+# --- Render Layers ---
+# Walls and pellets are baked into one background surface; everything else is a sprite in
+# a LayeredDirty group, drawn above it in this order.
+SPRITE_LAYER, HUD_LAYER = 0, 1
+
+# --- Maze Tile Codes ---
+TILE_OPEN, TILE_WALL, TILE_DOOR = 0, 1, 2
+
+# --- Timers (ms of simulated time) ---
+MODE_SWITCH_TIMES = [7000, 20000, 7000, 20000, 5000, 20000, 5000, -1]
+FIRST_RELEASE_DELAY = 2000  # first ghost leaves the pen this long into a level
+RESPAWN_RELEASE_DELAY = 3000  # ... or into the restart after losing a life
+GHOST_RELEASE_INTERVAL = 4000
+LEVEL_START_DELAY = 3000
+PLAYER_DYING_DELAY = 2000
 
 # --- Maze Layout ---
 # FIX #1: Replaced the entire maze with a classic, arcade-accurate layout.
@@ -99,9 +116,44 @@ def distance(pos1, pos2):
 
 
 # --- Game Classes ---
-class Player(pygame.sprite.Sprite):
+class EventScheduler:
+    """Callbacks due at deadlines on a simulated clock (in ms), kept in a min-heap.
+
+    The clock only moves when advance() is called, so its owner decides when time passes:
+    a paused game just stops advancing it, and a headless run can advance it as fast as
+    it likes.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.queue = []  # [deadline, sequence, callback]
+        self.sequence = itertools.count()  # events due at the same time fire in scheduling order
+
+    def schedule(self, delay, callback):
+        event = [self.now + delay, next(self.sequence), callback]
+        heapq.heappush(self.queue, event)
+        return event
+
+    def cancel(self, event):
+        if event is not None:
+            event[2] = None  # dropped when it comes due
+
+    def clear(self):
+        self.queue.clear()
+
+    def advance(self, dt):
+        self.now += dt
+        # within a microsecond counts as due: steps of 1000/60 ms do not add up exactly
+        while self.queue and self.queue[0][0] <= self.now + 1e-3:
+            callback = heapq.heappop(self.queue)[2]
+            if callback is not None:
+                callback()
+
+
+class Player(pygame.sprite.DirtySprite):
     def __init__(self, game, pos):
         super().__init__()
+        self.dirty = 2  # animated: redrawn every frame by the dirty-rect renderer
         self.game = game
         self.start_pos = pos
         self.image = pygame.Surface((TILE_SIZE - 2, TILE_SIZE - 2), pygame.SRCALPHA)
@@ -176,8 +228,11 @@ class Player(pygame.sprite.Sprite):
             pygame.draw.polygon(self.image, BLACK, [mouth_center, p_left, p_right])
 
     def check_collisions(self):
-        if pygame.sprite.spritecollide(self, self.game.pellets_group, True, pygame.sprite.collide_circle):
+        eaten = pygame.sprite.spritecollide(self, self.game.pellets_group, True, pygame.sprite.collide_circle)
+        if eaten:
             self.game.score += 10
+            for pellet in eaten:
+                self.game.erase_pellet(pellet)
         if pygame.sprite.spritecollide(self, self.game.power_pellets_group, True, pygame.sprite.collide_circle):
             self.game.score += 50
             self.game.start_frighten_mode()
@@ -203,9 +258,10 @@ class Player(pygame.sprite.Sprite):
         self.buffered_direction = pygame.Vector2(0, 0)
 
 
-class Ghost(pygame.sprite.Sprite):
+class Ghost(pygame.sprite.DirtySprite):
     def __init__(self, game, pos, color, scatter_target, start_state="IN_PEN"):
         super().__init__()
+        self.dirty = 2
         self.game, self.start_pos, self.color = game, pos, color
         self.image = pygame.Surface((TILE_SIZE - 2, TILE_SIZE - 2), pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=tile_to_pos(pos))
@@ -221,8 +277,9 @@ class Ghost(pygame.sprite.Sprite):
         self.image.fill((0, 0, 0, 0))
         body_color = self.color
         if self.state == "FRIGHTENED":
-            is_flashing = self.frightened_timer - pygame.time.get_ticks() < FRIGHTEN_FLASH_DURATION
-            if is_flashing and (pygame.time.get_ticks() // 250) % 2 == 0:
+            now = self.game.play_events.now
+            is_flashing = self.frightened_timer - now < FRIGHTEN_FLASH_DURATION
+            if is_flashing and (now // 250) % 2 == 0:
                 body_color = FRIGHTENED_WHITE
             else:
                 body_color = FRIGHTENED_BLUE
@@ -243,8 +300,6 @@ class Ghost(pygame.sprite.Sprite):
     def update(self):
         if self.state == "FRIGHTENED":
             self.speed = FRIGHTEN_SPEED
-            if pygame.time.get_ticks() > self.frightened_timer:
-                self.game.end_frighten_mode_for_ghost(self)
         elif self.state == "EATEN":
             self.speed = GHOST_SPEED * 2
         else:
@@ -314,7 +369,7 @@ class Ghost(pygame.sprite.Sprite):
             self.state = "FRIGHTENED"
             if self.state not in ["IN_PEN", "LEAVING_PEN"]:
                 self.direction *= -1
-            self.frightened_timer = pygame.time.get_ticks() + FRIGHTEN_DURATION
+            self.frightened_timer = self.game.play_events.now + FRIGHTEN_DURATION
 
     def reset(self):
         self.rect.center = tile_to_pos(self.start_pos)
@@ -374,17 +429,64 @@ class Pellet(pygame.sprite.Sprite):
         self.radius = 3
 
 
-class PowerPellet(pygame.sprite.Sprite):
+class PowerPellet(pygame.sprite.DirtySprite):
     def __init__(self, x, y):
         super().__init__();
         self.image = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
         self.radius = TILE_SIZE // 3;
         self.rect = self.image.get_rect(topleft=(x, y))
+        self.lit = None
 
-    def update(self):
-        self.image.fill((0, 0, 0, 0))
-        if (pygame.time.get_ticks() // 250) % 2 != 0:
-            pygame.draw.circle(self.image, WHITE, (TILE_SIZE // 2, TILE_SIZE // 2), self.radius)
+    def update(self, now):
+        # only redrawn (and marked dirty) when the flash toggles
+        lit = (now // 250) % 2 != 0
+        if lit != self.lit:
+            self.lit = lit
+            self.image.fill((0, 0, 0, 0))
+            if lit:
+                pygame.draw.circle(self.image, WHITE, (TILE_SIZE // 2, TILE_SIZE // 2), self.radius)
+            self.dirty = 1
+
+
+class HudText(pygame.sprite.DirtySprite):
+    """Text drawn by the dirty-rect renderer; rendered again only when the text changes."""
+
+    def __init__(self, size, color, midtop, visible=1):
+        super().__init__()
+        self.font = pygame.font.Font(pygame.font.get_default_font(), size)
+        self.color, self.midtop, self.text = color, midtop, None
+        self._layer = HUD_LAYER
+        self.visible = visible
+        self.set_text("")
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.image = self.font.render(text, True, self.color)
+            self.rect = self.image.get_rect(midtop=self.midtop)
+            self.dirty = 1
+
+
+class LivesIcons(pygame.sprite.DirtySprite):
+    """Spare-life icons in the bottom-left corner."""
+
+    def __init__(self):
+        super().__init__()
+        self._layer = HUD_LAYER
+        self.icon = pygame.Surface((TILE_SIZE - 2, TILE_SIZE - 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.icon, YELLOW, (self.icon.get_width() / 2, self.icon.get_height() / 2),
+                           TILE_SIZE / 2 - 1)
+        self.count = None
+        self.set_count(0)
+
+    def set_count(self, count):
+        if count != self.count:
+            self.count = count
+            self.image = pygame.Surface((max(count, 1) * (TILE_SIZE + 5), TILE_SIZE - 2), pygame.SRCALPHA)
+            for i in range(count):
+                self.image.blit(self.icon, (i * (TILE_SIZE + 5), 0))
+            self.rect = self.image.get_rect(topleft=(10, SCREEN_HEIGHT - TILE_SIZE - 5))
+            self.dirty = 1
 
 
 class Maze:
@@ -393,6 +495,7 @@ class Maze:
         self.pellets = pygame.sprite.Group()
         self.power_pellets = pygame.sprite.Group();
         self.grid = []
+        self.tiles = {}  # (x, y) -> TILE_OPEN / TILE_WALL / TILE_DOOR for every tile in the layout
         self.ghost_door = []
         # FIX #2: Added specific spawn locations for each ghost inside the pen
         self.ghost_spawns = {}
@@ -403,6 +506,7 @@ class Maze:
             for x, char in enumerate(row):
                 is_wall = (char == '#')
                 grid_row.append(1 if is_wall else 0)
+                self.tiles[(x, y)] = TILE_DOOR if char == '-' else TILE_WALL if is_wall else TILE_OPEN
                 if is_wall:
                     self.walls.add(Wall(x * TILE_SIZE, y * TILE_SIZE))
                 elif char == '.':
@@ -424,15 +528,15 @@ class Maze:
         self.ghost_exit_pos = (13, 11)
 
     def is_wall(self, tile_pos, sprite=None):
+        # one dict lookup per query; only tiles off the layout need the tunnel rule
         x, y = int(tile_pos[0]), int(tile_pos[1])
-        if (x, y) in self.ghost_door:
+        tile = self.tiles.get((x, y))
+        if tile is None:
+            # Updated tunnel check for the new maze
+            return not (y == 14 and (x <= -1 or x >= 28))
+        if tile == TILE_DOOR:
             return not isinstance(sprite, Ghost)
-        # Updated tunnel check for the new maze
-        if y == 14 and (x <= -1 or x >= 28):
-            return False
-        if not (0 <= y < len(self.grid) and 0 <= x < len(self.grid[y])):
-            return True
-        return self.grid[y][x] == 1
+        return tile == TILE_WALL
 
 
 class Game:
@@ -445,8 +549,38 @@ class Game:
         self.score, self.high_score, self.level = 0, self.load_high_score(), 1
         self.player_lives = PLAYER_LIVES
 
+        # HUD sprites, shared by every level's render group
+        self.score_text = HudText(22, WHITE, (100, 5))
+        self.high_score_text = HudText(22, WHITE, (SCREEN_WIDTH - 120, 5))
+        self.lives_icons = LivesIcons()
+        self.ready_text = HudText(40, YELLOW, (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 48), visible=0)
+        self.paused_text = HudText(50, WHITE, (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 48), visible=0)
+        self.ready_text.set_text("READY!")
+        self.paused_text.set_text("PAUSED")
+        self.hud_sprites = [self.score_text, self.high_score_text, self.lives_icons, self.ready_text,
+                            self.paused_text]
+        self.full_redraw = True
+
+        # gameplay timers (ghost release, mode switches, frightened) and state transitions
+        # (level start, dying) run on separate clocks: each only advances in its states
+        self.play_events = EventScheduler()
+        self.state_events = EventScheduler()
+        self.mode_switch_event = self.frighten_end_event = None
+
     def run(self):
-        while self.running: self.events(); self.update(); self.draw()
+        # fixed simulation steps, as many as the real time since the last frame calls for
+        lag = 0.0
+        while self.running:
+            lag += self.clock.tick(FPS)
+            self.events()
+            steps = 0
+            while lag >= SIM_STEP_MS and steps < MAX_STEPS_PER_FRAME:
+                self.update()
+                lag -= SIM_STEP_MS
+                steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                lag = 0.0  # too far behind: drop the backlog rather than spiral
+            self.draw()
 
     def events(self):
         for event in pygame.event.get():
@@ -464,50 +598,30 @@ class Game:
                     self.reset_game()
 
     def update(self):
+        """Advances the game by one step of SIM_STEP_MS simulated time."""
         if self.state == "GAMEPLAY":
             self.all_sprites.update()
-            self.power_pellets_group.update()
-            self.check_ghost_mode_switch()
-
-            # FIX #3: Improved ghost release logic
-            if self.ghost_release_timer > 0:
-                self.ghost_release_timer -= 1
-            elif self.ghosts_in_pen:
-                ghost_to_release = self.ghosts_in_pen.pop(0)
-                ghost_to_release.state = "LEAVING_PEN"
-                self.ghost_release_timer = 4 * FPS  # Timer for next ghost
-
-        elif self.state == "LEVEL_START":
-            self.level_start_timer -= 1
-            if self.level_start_timer <= 0: self.state = "GAMEPLAY"
-        elif self.state == "PLAYER_DYING":
-            self.player_dying_timer -= 1
-            if self.player_dying_timer <= 0:
-                self.player.die()
-                if self.player.lives > 0:
-                    self.reset_level_after_death()
-                    self.state = "LEVEL_START"
-                else:
-                    self.game_over()
+            self.power_pellets_group.update(self.play_events.now)
+            self.play_events.advance(SIM_STEP_MS)
+        elif self.state in ("LEVEL_START", "PLAYER_DYING"):
+            self.state_events.advance(SIM_STEP_MS)
 
     def draw(self):
-        self.screen.fill(BLACK)
-        if self.state == "START_SCREEN":
-            self.draw_start_screen()
-        elif self.state == "GAME_OVER":
-            self.draw_game_over_screen()
+        if self.state in ("START_SCREEN", "GAME_OVER"):
+            self.screen.fill(BLACK)
+            if self.state == "START_SCREEN":
+                self.draw_start_screen()
+            else:
+                self.draw_game_over_screen()
+            pygame.display.flip()
+            self.full_redraw = True  # the maze has to be repainted when play resumes
         else:
-            self.maze.walls.draw(self.screen);
-            self.pellets_group.draw(self.screen)
-            self.power_pellets_group.draw(self.screen);
-            self.all_sprites.draw(self.screen)
+            # Only the rects of sprites that moved or changed are redrawn and presented
             self.draw_hud()
-            if self.state == "LEVEL_START":
-                draw_text(self.screen, "READY!", 40, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 48, YELLOW)
-            elif self.state == "PAUSED":
-                draw_text(self.screen, "PAUSED", 50, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 48, WHITE)
-        pygame.display.flip()
-        self.clock.tick(FPS)
+            if self.full_redraw:
+                self.render_group.repaint_rect(self.screen.get_rect())
+                self.full_redraw = False
+            pygame.display.update(self.render_group.draw(self.screen))
 
     def new_level(self):
         self.all_sprites = pygame.sprite.Group();
@@ -532,12 +646,36 @@ class Game:
 
         # FIX #3: Set up the release queue correctly for ghosts starting in the pen
         self.ghosts_in_pen = [pinky, inky, clyde]
-        self.ghost_release_timer = 2 * FPS
 
-        self.ghost_points_multiplier, self.mode_change_timer, self.mode_index = 0, 0, 0
+        self.ghost_points_multiplier, self.mode_index = 0, 0
         self.previous_ghost_mode = "SCATTER"
         self.set_ghost_mode("SCATTER");
-        self.level_start_timer = 3 * FPS
+        self.schedule_level_timers(FIRST_RELEASE_DELAY)
+        self.build_render_layers()
+
+    def schedule_level_timers(self, release_delay):
+        """Drops every pending timer and starts the ones a fresh (re)start of the level needs."""
+        self.play_events.clear()
+        self.state_events.clear()
+        self.frighten_end_event = None
+        self.play_events.schedule(release_delay, self.release_next_ghost)
+        self.schedule_mode_switch()
+        self.state_events.schedule(LEVEL_START_DELAY, self.start_gameplay)
+
+    def build_render_layers(self):
+        """Bakes walls and pellets into the maze layer and sets up the dirty-rect renderer."""
+        self.maze_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.maze_layer.fill(BLACK)
+        self.maze.walls.draw(self.maze_layer)
+        self.pellets_group.draw(self.maze_layer)
+        self.render_group = pygame.sprite.LayeredDirty(self.power_pellets_group.sprites(), self.player,
+                                                       self.ghosts, self.hud_sprites)
+        self.render_group.clear(self.screen, self.maze_layer)
+        self.full_redraw = True
+
+    def erase_pellet(self, pellet):
+        self.maze_layer.fill(BLACK, pellet.rect)
+        self.render_group.repaint_rect(pellet.rect)
 
     def reset_level_after_death(self):
         self.player.reset();
@@ -545,10 +683,9 @@ class Game:
         self.ghosts_in_pen = [g for g in self.ghosts if g.state == "IN_PEN"]
         self.ghosts_in_pen.sort(
             key=lambda g: isinstance(g, Pinky) and -1 or isinstance(g, Inky) and 0 or 1)  # Pinky, Inky, Clyde order
-        self.ghost_release_timer = 3 * FPS
-        self.mode_change_timer, self.mode_index = 0, 0;
+        self.mode_index = 0
         self.set_ghost_mode("SCATTER")
-        self.level_start_timer = 3 * FPS
+        self.schedule_level_timers(RESPAWN_RELEASE_DELAY)
 
     def reset_game(self):
         self.score, self.level, self.player_lives = 0, 1, PLAYER_LIVES
@@ -568,13 +705,13 @@ class Game:
         draw_text(self.screen, "Press ENTER to Play Again", 22, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 3 / 4, WHITE)
 
     def draw_hud(self):
-        draw_text(self.screen, f"Score: {self.score}", 22, 100, 5, WHITE)
-        draw_text(self.screen, f"High Score: {self.high_score}", 22, SCREEN_WIDTH - 120, 5, WHITE)
-        for i in range(self.player.lives - 1):
-            life_surf = pygame.Surface((TILE_SIZE - 2, TILE_SIZE - 2), pygame.SRCALPHA)
-            pygame.draw.circle(life_surf, YELLOW, (life_surf.get_width() / 2, life_surf.get_height() / 2),
-                               TILE_SIZE / 2 - 1)
-            self.screen.blit(life_surf, (10 + i * (TILE_SIZE + 5), SCREEN_HEIGHT - TILE_SIZE - 5))
+        # HUD sprites re-render and mark themselves dirty only when their value changes
+        self.score_text.set_text(f"Score: {self.score}")
+        self.high_score_text.set_text(f"High Score: {self.high_score}")
+        self.lives_icons.set_count(self.player.lives - 1)
+        for text, state in ((self.ready_text, "LEVEL_START"), (self.paused_text, "PAUSED")):
+            if text.visible != (self.state == state):
+                text.visible = self.state == state  # setting visible marks the sprite dirty
 
     def level_cleared(self):
         self.level += 1;
@@ -582,9 +719,22 @@ class Game:
         self.new_level();
         self.state = "LEVEL_START"
 
+    def start_gameplay(self):
+        if self.state == "LEVEL_START":
+            self.state = "GAMEPLAY"
+
     def player_dies(self):
-        self.state = "PLAYER_DYING";
-        self.player_dying_timer = 2 * FPS
+        if self.state != "PLAYER_DYING":  # one death even if two ghosts touch at once
+            self.state = "PLAYER_DYING"
+            self.state_events.schedule(PLAYER_DYING_DELAY, self.finish_dying)
+
+    def finish_dying(self):
+        self.player.die()
+        if self.player.lives > 0:
+            self.reset_level_after_death()
+            self.state = "LEVEL_START"
+        else:
+            self.game_over()
 
     def game_over(self):
         self.state = "GAME_OVER"
@@ -596,7 +746,18 @@ class Game:
         self.current_ghost_mode = "FRIGHTENED";
         [g.frighten() for g in self.ghosts]
         self.ghost_points_multiplier = 0
-        self.mode_change_timer = 0
+        # scatter/chase is on hold while frightened, and its phase starts over afterwards
+        self.play_events.cancel(self.mode_switch_event)
+        self.play_events.cancel(self.frighten_end_event)
+        self.mode_switch_event = None
+        self.frighten_end_event = self.play_events.schedule(FRIGHTEN_DURATION, self.end_frighten_mode)
+
+    def end_frighten_mode(self):
+        self.frighten_end_event = None
+        self.current_ghost_mode = self.previous_ghost_mode
+        for ghost in self.ghosts:
+            self.end_frighten_mode_for_ghost(ghost)
+        self.schedule_mode_switch()
 
     def end_frighten_mode_for_ghost(self, ghost):
         if ghost.state == "FRIGHTENED":
@@ -616,14 +777,23 @@ class Game:
                 if ghost.is_at_intersection():
                     ghost.direction *= -1
 
-    def check_ghost_mode_switch(self):
-        if self.current_ghost_mode != "FRIGHTENED":
-            self.mode_change_timer += 1
-            if self.mode_index < len(MODE_SWITCH_TIMES) and MODE_SWITCH_TIMES[self.mode_index] != -1:
-                if self.mode_change_timer >= MODE_SWITCH_TIMES[self.mode_index]:
-                    self.mode_index += 1;
-                    self.mode_change_timer = 0
-                    self.set_ghost_mode("CHASE" if self.mode_index % 2 != 0 else "SCATTER")
+    def schedule_mode_switch(self):
+        self.mode_switch_event = None
+        if self.mode_index < len(MODE_SWITCH_TIMES) and MODE_SWITCH_TIMES[self.mode_index] != -1:
+            self.mode_switch_event = self.play_events.schedule(MODE_SWITCH_TIMES[self.mode_index],
+                                                               self.switch_ghost_mode)
+
+    def switch_ghost_mode(self):
+        self.mode_index += 1;
+        self.set_ghost_mode("CHASE" if self.mode_index % 2 != 0 else "SCATTER")
+        self.schedule_mode_switch()
+
+    def release_next_ghost(self):
+        # FIX #3: Improved ghost release logic
+        if self.ghosts_in_pen:
+            ghost_to_release = self.ghosts_in_pen.pop(0)
+            ghost_to_release.state = "LEAVING_PEN"
+            self.play_events.schedule(GHOST_RELEASE_INTERVAL, self.release_next_ghost)  # next ghost
 
     def load_high_score(self):
         try:
@@ -63,6 +63,25 @@ LEVEL = [
 
 
 # --- Classes ---
+class WallGrid:
+    """Wall occupancy per tile; a rect only checks the few tiles it overlaps."""
+
+    def __init__(self, level):
+        self.solid = [[char == '1' for char in row] for row in level]
+
+    def collides(self, rect):
+        # same answer as colliderect against a TILE_SIZE wall sprite on every '1' tile
+        top = max(rect.top // TILE_SIZE, 0)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, len(self.solid) - 1)
+        left = max(rect.left // TILE_SIZE, 0)
+        for y in range(top, bottom + 1):
+            row = self.solid[y]
+            for x in range(left, min((rect.right - 1) // TILE_SIZE, len(row) - 1) + 1):
+                if row[x]:
+                    return True
+        return False
+
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, walls):
         super().__init__()
@@ -101,7 +120,7 @@ class Player(pygame.sprite.Sprite):
                 # Check if the new path is clear
                 test_rect = self.rect.copy()
                 test_rect.center += self.next_direction * self.speed
-                if not any(wall.rect.colliderect(test_rect) for wall in self.walls):
+                if not self.walls.collides(test_rect):
                     self.direction = self.next_direction
                     self.next_direction = pygame.Vector2(0, 0)
 
@@ -109,8 +128,7 @@ class Player(pygame.sprite.Sprite):
         self.rect.center += self.direction * self.speed
 
         # Wall collision
-        hit_walls = pygame.sprite.spritecollide(self, self.walls, False)
-        if hit_walls and self.direction != (0, 0):
+        if self.direction != (0, 0) and self.walls.collides(self.rect):
             self.rect.center -= self.direction * self.speed
             self.direction = pygame.Vector2(0, 0)
 
@@ -228,7 +246,7 @@ class Ghost(pygame.sprite.Sprite):
             for d in valid_turns:
                 test_rect = self.rect.copy()
                 test_rect.center += d * self.speed
-                if not any(wall.rect.colliderect(test_rect) for wall in self.walls):
+                if not self.walls.collides(test_rect):
                     possible_directions.append(d)
 
             if possible_directions:
@@ -326,8 +344,11 @@ class Game:
                 elif char == '4':
                     ghost_positions.append((x + TILE_SIZE // 2, y + TILE_SIZE // 2))
 
+        # Sprites collide against the tile grid; the wall sprites are only drawn
+        self.wall_grid = WallGrid(LEVEL)
+
         # Player
-        self.player = Player(player_pos[0], player_pos[1], self.walls)
+        self.player = Player(player_pos[0], player_pos[1], self.wall_grid)
         self.all_sprites.add(self.player)
 
         # Ghosts
@@ -336,7 +357,7 @@ class Game:
         unique_ghost_positions = list(dict.fromkeys(ghost_positions))
         for i, pos in enumerate(unique_ghost_positions):
             if i < len(ghost_colors):
-                ghost = Ghost(pos[0], pos[1], ghost_colors[i], self.walls)
+                ghost = Ghost(pos[0], pos[1], ghost_colors[i], self.wall_grid)
                 self.ghosts.add(ghost)
                 self.all_sprites.add(ghost)
 
@@ -73,81 +73,115 @@ for y in range(10, 19):
             maze[y][x] = ' '
 
 class Vector2:
+    """A sprite position. Moved in place each frame; tiles and directions are int tuples."""
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = float(x)
         self.y = float(y)
 
-    def __add__(self, other):
-        return Vector2(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Vector2(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, scalar):
-        return Vector2(self.x * scalar, self.y * scalar)
-
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y
 
     def __str__(self):
         return f"({self.x}, {self.y})"
 
-    def clone(self):
-        return Vector2(self.x, self.y)
+LEFT, RIGHT, UP, DOWN = (-1, 0), (1, 0), (0, -1), (0, 1)
 
 directions = {
-    'left': Vector2(-1, 0),
-    'right': Vector2(1, 0),
-    'up': Vector2(0, -1),
-    'down': Vector2(0, 1)
+    'left': LEFT,
+    'right': RIGHT,
+    'up': UP,
+    'down': DOWN
 }
 
+REVERSE = {LEFT: RIGHT, RIGHT: LEFT, UP: DOWN, DOWN: UP}
+
+# ghosts break distance ties in this order
 priority = {
-    'up': 0,
-    'left': 1,
-    'down': 2,
-    'right': 3
+    UP: 0,
+    LEFT: 1,
+    DOWN: 2,
+    RIGHT: 3
 }
 
-def get_dir_name(d):
-    for name, dd in directions.items():
-        if dd.x == d.x and dd.y == d.y:
-            return name
+# Per-tile lookups, rebuilt by reset_maze (the walls never change after it):
+# WALL[y][x], INTERSECTION[y][x] and EXITS[y][x][current_dir][is_eaten], the
+# directions a ghost on that tile may turn into.
+WALL = INTERSECTION = EXITS = None
+pellets_left = 0
 
 def get_tile(pos):
-    return Vector2(int(pos.x // TILE_SIZE), int(pos.y // TILE_SIZE))
+    return int(pos.x // TILE_SIZE), int(pos.y // TILE_SIZE)
 
 def get_pos(tile):
-    return Vector2(tile.x * TILE_SIZE + TILE_SIZE // 2, tile.y * TILE_SIZE + TILE_SIZE // 2)
+    return Vector2(tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2)
 
-def is_intersection(tile):
+def snap_to_tile(pos):
+    pos.x = float(int(pos.x // TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2)
+    pos.y = float(int(pos.y // TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2)
+
+def count_exits(x, y):
     count = 0
-    for d in directions.values():
-        nt = tile + d
-        if 0 <= nt.x < MAZE_WIDTH and 0 <= nt.y < MAZE_HEIGHT and maze[int(nt.y)][int(nt.x)] != '#':
+    for dx, dy in directions.values():
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT and maze[ny][nx] != '#':
             count += 1
-    return count > 2
+    return count
 
-def get_possible_dirs(tile, current_dir, is_eaten=False):
+def open_exits(x, y, current_dir, is_eaten):
+    reverse = REVERSE[current_dir]
     possible = []
-    reverse = current_dir * -1
     for d in directions.values():
         if d == reverse:
             continue
-        nt = tile + d
-        if 0 <= nt.x < MAZE_WIDTH and 0 <= nt.y < MAZE_HEIGHT and maze[int(nt.y)][int(nt.x)] != '#' and not (not is_eaten and tile.y == 10 and tile.x in (13,14) and d.y > 0):
+        nx, ny = x + d[0], y + d[1]
+        if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT and maze[ny][nx] != '#' and not (not is_eaten and y == 10 and x in (13,14) and d[1] > 0):
             possible.append(d)
-    return possible
+    return tuple(possible)
+
+def build_tables():
+    global WALL, INTERSECTION, EXITS
+    WALL = [[cell == '#' for cell in row] for row in maze]
+    INTERSECTION = [[count_exits(x, y) > 2 for x in range(MAZE_WIDTH)] for y in range(MAZE_HEIGHT)]
+    EXITS = [[{d: (open_exits(x, y, d, False), open_exits(x, y, d, True)) for d in directions.values()}
+              for x in range(MAZE_WIDTH)] for y in range(MAZE_HEIGHT)]
+
+def is_intersection(tile):
+    return INTERSECTION[tile[1]][tile[0]]
+
+def get_possible_dirs(tile, current_dir, is_eaten=False):
+    return EXITS[tile[1]][tile[0]][current_dir][is_eaten]
+
+def closest_dir(tile, possible, target):
+    # the exit whose next tile is nearest the target, ties broken by priority
+    best = None
+    for d in possible:
+        dx = tile[0] + d[0] - target[0]
+        dy = tile[1] + d[1] - target[1]
+        dist = dx * dx + dy * dy
+        if best is None or dist < best_dist or (dist == best_dist and priority[d] < priority[best]):
+            best, best_dist = d, dist
+    return best
+
+def blocks_player(x, y):
+    # the tunnel row wraps, so columns are taken modulo the maze width
+    return WALL[y][x % MAZE_WIDTH] or (y == 10 and x in (13,14))
 
 def distance(a, b):
     dx = a.x - b.x
     dy = a.y - b.y
     return (dx * dx + dy * dy) ** 0.5
 
+def distance_to_tile(pos, tile):
+    dx = pos.x - (tile[0] * TILE_SIZE + TILE_SIZE // 2)
+    dy = pos.y - (tile[1] * TILE_SIZE + TILE_SIZE // 2)
+    return (dx * dx + dy * dy) ** 0.5
+
 class Player:
     def __init__(self):
-        self.pos = get_pos(Vector2(14, 23))
-        self.dir = Vector2(-1, 0)  # left
+        self.pos = get_pos((14, 23))
+        self.dir = LEFT
         self.next_dir = None
         self.speed = 3
         self.score = 0
@@ -155,25 +189,28 @@ class Player:
         self.power_timer = 0
 
     def update(self):
+        pos = self.pos
         if self.next_dir:
-            tile = get_tile(self.pos)
-            nt = tile + self.next_dir
-            if maze[int(nt.y)][int(nt.x)] != '#' and not (int(nt.y) == 10 and int(nt.x) in (13,14)):
+            tx, ty = get_tile(pos)
+            if not blocks_player(tx + self.next_dir[0], ty + self.next_dir[1]):
                 self.dir = self.next_dir
                 self.next_dir = None
-        next_pos = self.pos + self.dir * self.speed
-        next_tile = get_tile(next_pos)
-        if maze[int(next_tile.y)][int(next_tile.x)] == '#' or (int(next_tile.y) == 10 and int(next_tile.x) in (13,14)):
-            self.pos = get_pos(get_tile(self.pos))
+        next_x = pos.x + self.dir[0] * self.speed
+        next_y = pos.y + self.dir[1] * self.speed
+        if blocks_player(int(next_x // TILE_SIZE), int(next_y // TILE_SIZE)):
+            snap_to_tile(pos)
         else:
-            self.pos = next_pos
-        if self.pos.x < 0:
-            self.pos.x = SCREEN_WIDTH
-        if self.pos.x > SCREEN_WIDTH:
-            self.pos.x = 0
-        tile = get_tile(self.pos)
-        if maze[int(tile.y)][int(tile.x)] in ('.', 'O'):
-            if maze[int(tile.y)][int(tile.x)] == 'O':
+            pos.x = next_x
+            pos.y = next_y
+        if pos.x < 0:
+            pos.x = SCREEN_WIDTH
+        if pos.x > SCREEN_WIDTH:
+            pos.x = 0
+        tx, ty = get_tile(pos)
+        row = maze[ty]
+        tx %= MAZE_WIDTH
+        if row[tx] in ('.', 'O'):
+            if row[tx] == 'O':
                 self.score += 50
                 self.power = True
                 self.power_timer = 300
@@ -186,12 +223,10 @@ class Player:
                         ghost.speed = 1.5
             else:
                 self.score += 10
-            maze[int(tile.y)][int(tile.x)] = ' '
-            all_eaten = True
-            for row in maze:
-                if '.' in row or 'O' in row:
-                    all_eaten = False
-            if all_eaten:
+            row[tx] = ' '
+            global pellets_left
+            pellets_left -= 1
+            if pellets_left == 0:
                 global state
                 state = 'cleared'
         if self.power:
@@ -207,16 +242,16 @@ class Player:
         radius = TILE_SIZE // 2
         mouth_open = (pygame.time.get_ticks() % 400) < 200
         angle = 60 if mouth_open else 20
-        if self.dir.x == 1:  # right
+        if self.dir[0] == 1:  # right
             start_angle = -angle / 2
             end_angle = angle / 2 + 360
-        elif self.dir.x == -1:  # left
+        elif self.dir[0] == -1:  # left
             start_angle = 180 - angle / 2
             end_angle = 180 + angle / 2
-        elif self.dir.y == -1:  # up
+        elif self.dir[1] == -1:  # up
             start_angle = 90 - angle / 2
             end_angle = 90 + angle / 2
-        elif self.dir.y == 1:  # down
+        elif self.dir[1] == 1:  # down
             start_angle = 270 - angle / 2
             end_angle = 270 + angle / 2
         center = (int(self.pos.x) - radius, int(self.pos.y) - radius, radius * 2, radius * 2)
@@ -226,92 +261,94 @@ class Ghost:
     def __init__(self, name, scatter_target):
         self.name = name
         self.color = COLOR_GHOST[name]
-        self.pos = get_pos(Vector2(14, 11) if name == 'blinky' else Vector2(12, 14) if name == 'pinky' else Vector2(14, 14) if name == 'inky' else Vector2(16, 14))
-        self.dir = Vector2(-1, 0) if name == 'blinky' else Vector2(0, -1)
+        self.pos = get_pos((14, 11) if name == 'blinky' else (12, 14) if name == 'pinky' else (14, 14) if name == 'inky' else (16, 14))
+        self.dir = LEFT if name == 'blinky' else UP
         self.speed = 2
         self.mode = 'scatter' if name == 'blinky' else 'pen'
         self.previous_mode = None
         self.scatter_target = scatter_target
-        self.target = Vector2(0, 0)
+        self.target = (0, 0)
         self.release_timer = 0 if name == 'blinky' else 90 if name == 'pinky' else 180 if name == 'inky' else 270 if name == 'clyde' else 360
 
     def update(self):
+        pos = self.pos
         if self.mode == 'eaten':
-            pen = Vector2(14, 10)
-            if distance(self.pos, get_pos(pen)) < self.speed:
-                self.pos = get_pos(Vector2(14, 14))
+            if distance_to_tile(pos, (14, 10)) < self.speed:
+                self.pos = get_pos((14, 14))
                 self.mode = 'pen'
                 self.release_timer = 0
-                self.dir = Vector2(0, -1)
+                self.dir = UP
             else:
-                direction = get_pos(pen) - self.pos
-                length = distance(Vector2(0, 0), direction)
+                dx = (14 * TILE_SIZE + TILE_SIZE // 2) - pos.x
+                dy = (10 * TILE_SIZE + TILE_SIZE // 2) - pos.y
+                length = (dx * dx + dy * dy) ** 0.5
                 if length > 0:
-                    direction = direction * (1 / length)
-                self.pos += direction * self.speed * 2
+                    dx = dx * (1 / length)
+                    dy = dy * (1 / length)
+                pos.x += dx * self.speed * 2
+                pos.y += dy * self.speed * 2
             return
         if self.mode == 'pen':
             self.release_timer -= 1
             if self.release_timer <= 0:
-                self.target = Vector2(14, 11)
-                if int(self.pos.x) % TILE_SIZE == TILE_SIZE // 2 and int(self.pos.y) % TILE_SIZE == TILE_SIZE // 2:
-                    tile = get_tile(self.pos)
+                self.target = (14, 11)
+                if int(pos.x) % TILE_SIZE == TILE_SIZE // 2 and int(pos.y) % TILE_SIZE == TILE_SIZE // 2:
+                    tile = get_tile(pos)
                     possible = get_possible_dirs(tile, self.dir, False)
                     if possible:
-                        sorted_dirs = sorted(possible, key=lambda d: (distance(tile + d, self.target), priority[get_dir_name(d)]))
-                        self.dir = sorted_dirs[0]
+                        self.dir = closest_dir(tile, possible, self.target)
             else:
-                next_pos = self.pos + self.dir * self.speed
-                next_tile = get_tile(next_pos)
-                if not (0 <= next_tile.x < MAZE_WIDTH and 0 <= next_tile.y < MAZE_HEIGHT) or maze[int(next_tile.y)][int(next_tile.x)] == '#' or (next_tile.y == 10 and next_tile.x in (13,14) and self.dir.y < 0):
-                    self.dir = self.dir * -1
-                    self.pos = get_pos(get_tile(self.pos))
+                next_x = pos.x + self.dir[0] * self.speed
+                next_y = pos.y + self.dir[1] * self.speed
+                tx, ty = int(next_x // TILE_SIZE), int(next_y // TILE_SIZE)
+                if not (0 <= tx < MAZE_WIDTH and 0 <= ty < MAZE_HEIGHT) or WALL[ty][tx] or (ty == 10 and tx in (13,14) and self.dir[1] < 0):
+                    self.dir = REVERSE[self.dir]
+                    snap_to_tile(pos)
                 else:
-                    self.pos = next_pos
-            if distance(self.pos, get_pos(self.target)) < self.speed:
+                    pos.x = next_x
+                    pos.y = next_y
+            if distance_to_tile(self.pos, self.target) < self.speed:
                 self.mode = global_current_mode
-                self.dir = Vector2(-1, 0)
+                self.dir = LEFT
             return
-        p_tile = get_tile(player.pos)
+        px, py = get_tile(player.pos)
         if self.mode == 'scatter':
             self.target = self.scatter_target
         elif self.mode == 'chase':
             if self.name == 'blinky':
-                self.target = p_tile
+                self.target = (px, py)
             elif self.name == 'pinky':
-                p_dir = player.dir
-                self.target = p_tile + p_dir * 4
+                self.target = (px + player.dir[0] * 4, py + player.dir[1] * 4)
             elif self.name == 'inky':
-                p_ahead = p_tile + player.dir * 2
-                b_pos = get_tile(ghosts[0].pos)
-                vect = p_ahead - b_pos
-                self.target = b_pos + vect * 2
+                bx, by = get_tile(ghosts[0].pos)
+                self.target = (bx + (px + player.dir[0] * 2 - bx) * 2, by + (py + player.dir[1] * 2 - by) * 2)
             elif self.name == 'clyde':
-                dist = distance(get_tile(self.pos), p_tile)
-                if dist < 8:
+                tx, ty = get_tile(pos)
+                if (tx - px) ** 2 + (ty - py) ** 2 < 8 * 8:
                     self.target = self.scatter_target
                 else:
-                    self.target = p_tile
-        if int(self.pos.x) % TILE_SIZE == TILE_SIZE // 2 and int(self.pos.y) % TILE_SIZE == TILE_SIZE // 2:
-            tile = get_tile(self.pos)
+                    self.target = (px, py)
+        if int(pos.x) % TILE_SIZE == TILE_SIZE // 2 and int(pos.y) % TILE_SIZE == TILE_SIZE // 2:
+            tile = get_tile(pos)
             if is_intersection(tile) or self.mode == 'frightened':
                 possible = get_possible_dirs(tile, self.dir, self.mode == 'eaten')
                 if possible:
                     if self.mode == 'frightened':
                         self.dir = random.choice(possible)
                     else:
-                        sorted_dirs = sorted(possible, key=lambda d: (distance(tile + d, self.target), priority[get_dir_name(d)]))
-                        self.dir = sorted_dirs[0]
-        next_pos = self.pos + self.dir * self.speed
-        next_tile = get_tile(next_pos)
-        if maze[int(next_tile.y)][int(next_tile.x)] == '#' or (int(next_tile.y) == 10 and int(next_tile.x) in (13,14) and self.dir.y > 0 and self.mode != 'eaten'):
-            self.pos = get_pos(get_tile(self.pos))
+                        self.dir = closest_dir(tile, possible, self.target)
+        next_x = pos.x + self.dir[0] * self.speed
+        next_y = pos.y + self.dir[1] * self.speed
+        tx, ty = int(next_x // TILE_SIZE), int(next_y // TILE_SIZE)
+        if WALL[ty][tx % MAZE_WIDTH] or (ty == 10 and tx in (13,14) and self.dir[1] > 0 and self.mode != 'eaten'):
+            snap_to_tile(pos)
         else:
-            self.pos = next_pos
-        if self.pos.x < 0:
-            self.pos.x = SCREEN_WIDTH
-        if self.pos.x > SCREEN_WIDTH:
-            self.pos.x = 0
+            pos.x = next_x
+            pos.y = next_y
+        if pos.x < 0:
+            pos.x = SCREEN_WIDTH
+        if pos.x > SCREEN_WIDTH:
+            pos.x = 0
 
     def draw(self, screen):
         if self.mode == 'frightened':
@@ -328,17 +365,25 @@ class Ghost:
             pygame.draw.circle(screen, color, (int(self.pos.x), int(self.pos.y)), radius)
         eye_radius = TILE_SIZE // 8
         pupil_radius = eye_radius // 2
-        eye_offset = Vector2(TILE_SIZE // 4, TILE_SIZE // 4)
-        left_eye = (int(self.pos.x) - eye_offset.x, int(self.pos.y) - eye_offset.y)
-        right_eye = (int(self.pos.x) + eye_offset.x, int(self.pos.y) - eye_offset.y)
+        eye_offset = TILE_SIZE // 4
+        left_eye = (int(self.pos.x) - eye_offset, int(self.pos.y) - eye_offset)
+        right_eye = (int(self.pos.x) + eye_offset, int(self.pos.y) - eye_offset)
         pygame.draw.circle(screen, COLOR_EYES, left_eye, eye_radius)
         pygame.draw.circle(screen, COLOR_EYES, right_eye, eye_radius)
-        pupil_offset = self.dir * (eye_radius - pupil_radius)
-        left_pupil = (left_eye[0] + pupil_offset.x, left_eye[1] + pupil_offset.y)
-        right_pupil = (right_eye[0] + pupil_offset.x, right_eye[1] + pupil_offset.y)
+        pupil_x = self.dir[0] * (eye_radius - pupil_radius)
+        pupil_y = self.dir[1] * (eye_radius - pupil_radius)
+        left_pupil = (left_eye[0] + pupil_x, left_eye[1] + pupil_y)
+        right_pupil = (right_eye[0] + pupil_x, right_eye[1] + pupil_y)
         pygame.draw.circle(screen, (0, 0, 0), left_pupil, pupil_radius)
         pygame.draw.circle(screen, (0, 0, 0), right_pupil, pupil_radius)
 
+fonts = {}
+
+def get_font(size):
+    if size not in fonts:
+        fonts[size] = pygame.font.Font(None, size)
+    return fonts[size]
+
 def draw_maze(screen):
     for y in range(MAZE_HEIGHT):
         for x in range(MAZE_WIDTH):
@@ -352,7 +397,7 @@ def draw_maze(screen):
     pygame.draw.line(screen, COLOR_GATE, (13 * TILE_SIZE, 10 * TILE_SIZE), (15 * TILE_SIZE, 10 * TILE_SIZE), 3)
 
 def draw_hud(screen, score, high_score, lives, level):
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     text = font.render(f"Score: {score}", True, (255, 255, 255))
     screen.blit(text, (10, 10))
     text = font.render(f"High: {high_score}", True, (255, 255, 255))
@@ -378,27 +423,30 @@ def reset_maze():
     # Make sides of gate walls to prevent invalid exits
     maze[10][12] = '#'
     maze[10][15] = '#'
+    global pellets_left
+    pellets_left = sum(row.count('.') + row.count('O') for row in maze)
+    build_tables()
 
 def reset_positions():
-    player.pos = get_pos(Vector2(14, 23))
-    player.dir = Vector2(-1, 0)
+    player.pos = get_pos((14, 23))
+    player.dir = LEFT
     player.next_dir = None
     player.power = False
     player.power_timer = 0
-    ghosts[0].pos = get_pos(Vector2(14, 11))
-    ghosts[0].dir = Vector2(-1, 0)
+    ghosts[0].pos = get_pos((14, 11))
+    ghosts[0].dir = LEFT
     ghosts[0].mode = 'scatter'
     ghosts[0].release_timer = 0
-    ghosts[1].pos = get_pos(Vector2(12, 14))
-    ghosts[1].dir = Vector2(0, -1)
+    ghosts[1].pos = get_pos((12, 14))
+    ghosts[1].dir = UP
     ghosts[1].mode = 'pen'
     ghosts[1].release_timer = 90
-    ghosts[2].pos = get_pos(Vector2(14, 14))
-    ghosts[2].dir = Vector2(0, -1)
+    ghosts[2].pos = get_pos((14, 14))
+    ghosts[2].dir = UP
     ghosts[2].mode = 'pen'
     ghosts[2].release_timer = 180
-    ghosts[3].pos = get_pos(Vector2(16, 14))
-    ghosts[3].dir = Vector2(0, -1)
+    ghosts[3].pos = get_pos((16, 14))
+    ghosts[3].dir = UP
     ghosts[3].mode = 'pen'
     ghosts[3].release_timer = 270
     for g in ghosts:
@@ -417,10 +465,10 @@ def main():
     global player, ghosts, state, eaten_multiplier, global_current_mode
     player = Player()
     ghosts = [
-        Ghost('blinky', Vector2(27, 0)),
-        Ghost('pinky', Vector2(0, 0)),
-        Ghost('inky', Vector2(27, 30)),
-        Ghost('clyde', Vector2(0, 30))
+        Ghost('blinky', (27, 0)),
+        Ghost('pinky', (0, 0)),
+        Ghost('inky', (27, 30)),
+        Ghost('clyde', (0, 30))
     ]
     global_current_mode = 'scatter'
     reset_maze()
@@ -475,7 +523,7 @@ def main():
             pygame.display.flip()
             continue
         if state == 'start_screen':
-            font = pygame.font.Font(None, 50)
+            font = get_font(50)
             text = font.render("Py-Man", True, (255, 255, 0))
             screen.blit(text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 100))
             text = font.render("Press Enter to Start", True, (255, 255, 255))
@@ -484,7 +532,7 @@ def main():
             timer -= 1
             if timer <= 0:
                 state = 'gameplay'
-            font = pygame.font.Font(None, 50)
+            font = get_font(50)
             text = font.render("READY!", True, (255, 255, 0))
             screen.blit(text, (SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2))
             draw_maze(screen)
@@ -559,7 +607,7 @@ def main():
                 timer = 120
             draw_hud(screen, score, high_score, lives, level)
         elif state == 'game_over':
-            font = pygame.font.Font(None, 50)
+            font = get_font(50)
             text = font.render("GAME OVER", True, (255, 0, 0))
             screen.blit(text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 50))
             text = font.render("Press Enter to Restart", True, (255, 255, 255))
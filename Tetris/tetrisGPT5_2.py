@@ -30,6 +30,7 @@ WIN_H = BORDER + GRID_H + BORDER
 BG = (16, 18, 24)
 GRID_BG = (24, 26, 34)
 GRID_LINE = (38, 42, 55)
+PANEL_BG = (28, 30, 40)
 WHITE = (240, 240, 245)
 MUTED = (170, 170, 180)
 ACCENT = (90, 200, 250)
@@ -196,6 +197,17 @@ class Piece:
 class Board:
     def __init__(self):
         self.grid = [[None for _ in range(COLS)] for _ in range(MATRIX_H)]
+        # Derived stats kept in step with the grid: topmost filled row and fill count per
+        # column (MATRIX_H/0 if empty), fill count per row, hole and bumpiness totals.
+        # The version bumps on any grid change.
+        self.col_top = [MATRIX_H] * COLS
+        self.col_fill = [0] * COLS
+        self.row_fill = [0] * MATRIX_H
+        self._holes = 0
+        self._bumpiness = 0
+        self.version = 0
+        self._ghost_key = None
+        self._ghost_y = 0
         self.bag = Bag7()
         self.active = Piece(self.bag.pop())
         self.hold = None
@@ -289,9 +301,8 @@ class Board:
             self.lock_timer_ms = None
 
     def hard_drop(self):
-        rows = 0
-        while self.try_move(0, 1):
-            rows += 1
+        rows = self.ghost_y() - self.active.y
+        self.active.y += rows
         # score hard drop rows * 2
         self.score += rows * 2
         # lock immediately
@@ -305,12 +316,22 @@ class Board:
 
     def lock_piece(self):
         p = self.active
+        cols = {x for x, _ in p.blocks()}
+        self.adjust_column_stats(cols, -1)
         for x, y in p.blocks():
             if y < 0:
                 self.game_over = True
-                return
+                break
             self.grid[y][x] = COLORS[p.kind]
-        cleared = self.clear_lines()
+            if y < self.col_top[x]:
+                self.col_top[x] = y
+            self.col_fill[x] += 1
+            self.row_fill[y] += 1
+        self.adjust_column_stats(cols, +1)
+        self.version += 1
+        if self.game_over:
+            return
+        cleared = self.clear_lines({y for _, y in p.blocks()})
         # scoring
         if cleared:
             if cleared == 4:
@@ -333,16 +354,63 @@ class Board:
         self.lock_timer_ms = None
         self.can_hold = True
 
-    def clear_lines(self):
-        full_rows = [y for y in range(MATRIX_H) if all(self.grid[y][x] is not None for x in range(COLS))]
+    def clear_lines(self, rows=None):
+        # rows: candidate rows to check (e.g. those the locked piece touched); default all
+        candidates = range(MATRIX_H) if rows is None else rows
+        full_rows = sorted(y for y in candidates if 0 <= y < MATRIX_H and self.row_fill[y] == COLS)
         # Only visible rows count toward scoring/level; but clearing hidden is rare—keep simple
         cleared = 0
-        for y in reversed(full_rows):
+        # Top row first: deleting row y and inserting at 0 leaves every row below y where it
+        # was, so the remaining (larger) indices still name the rows found full
+        for y in full_rows:
             del self.grid[y]
             self.grid.insert(0, [None for _ in range(COLS)])
+            del self.row_fill[y]
+            self.row_fill.insert(0, 0)
             cleared += 1
+        if cleared:
+            # Cells only move down or vanish, so rescan each column from its old top
+            for x in range(COLS):
+                self.col_top[x] = self.scan_col_top(x, self.col_top[x])
+                self.col_fill[x] -= cleared
+            self._holes = 0
+            self._bumpiness = 0
+            self.adjust_column_stats(range(COLS), +1)
+            self.version += 1
         return cleared
 
+    def scan_col_top(self, x, start=0):
+        for y in range(start, MATRIX_H):
+            if self.grid[y][x] is not None:
+                return y
+        return MATRIX_H
+
+    def column_holes(self, x):
+        # Empty cells below the column's top block
+        return MATRIX_H - self.col_top[x] - self.col_fill[x]
+
+    def adjust_column_stats(self, cols, sign):
+        # Add/remove the hole and bumpiness contributions of the given columns
+        pairs = {i for x in cols for i in (x - 1, x) if 0 <= i < COLS - 1}
+        self._holes += sign * sum(self.column_holes(x) for x in cols)
+        self._bumpiness += sign * sum(abs(self.col_top[i] - self.col_top[i + 1]) for i in pairs)
+
+    @property
+    def column_heights(self):
+        return tuple(MATRIX_H - t for t in self.col_top)
+
+    @property
+    def row_fill_counts(self):
+        return tuple(self.row_fill)
+
+    @property
+    def holes(self):
+        return self._holes
+
+    @property
+    def bumpiness(self):
+        return self._bumpiness
+
     def spawn_next(self):
         kind = self.queue.popleft()
         self.queue.append(self.bag.pop())
@@ -368,11 +436,29 @@ class Board:
 
     # ---- Ghost ----
     def ghost_y(self):
+        # Cached until the active piece moves/rotates or the grid changes
         p = self.active
-        gy = p.y
-        while self.can_place(p, p.x, gy + 1, p.rot):
-            gy += 1
-        return gy
+        key = (p.kind, p.x, p.y, p.rot, self.version)
+        if key != self._ghost_key:
+            self._ghost_key = key
+            self._ghost_y = self.surface_drop_y(p)
+        return self._ghost_y
+
+    def surface_drop_y(self, p):
+        # Lowest piece cell per column vs. that column's surface height
+        bottoms = {}
+        for x, y in p.blocks():
+            if x not in bottoms or y > bottoms[x]:
+                bottoms[x] = y
+        for x, y in bottoms.items():
+            if y >= self.col_top[x]:
+                # Tucked under an overhang: fall back to stepping down
+                gy = p.y
+                while self.can_place(p, p.x, gy + 1, p.rot):
+                    gy += 1
+                return gy
+        drop = min(self.col_top[x] - 1 - y for x, y in bottoms.items())
+        return p.y + drop
 
 # ------------------------------
 # Drawing
@@ -384,8 +470,46 @@ def draw_text(surf, text, size, x, y, color=WHITE, align="topleft"):
     setattr(r, align, (x, y))
     surf.blit(img, r)
 
-def draw_board(surf, board: Board):
-    # Panels rects
+class BackgroundCache:
+    # Board backdrop painted once per (window size, palette), then blitted each frame
+    def __init__(self, render):
+        self.render = render  # render(surf) paints the static layer
+        self.key = None
+        self.surface = None
+
+    def blit(self, target, theme=None):
+        key = (target.get_size(), theme)
+        if key != self.key:
+            bg = pygame.Surface(target.get_size())
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert()
+            self.render(bg)
+            self.surface, self.key = bg, key
+        target.blit(self.surface, (0, 0))
+
+_SURFACE_POOL = {}  # translucent fills and ghost outlines, reused every frame
+
+def pooled_surface(size, rgba):
+    key = (size, rgba)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        _SURFACE_POOL[key] = surf
+    return surf
+
+def ghost_cell_surface(alpha):
+    # One CELL-sized ghost outline, blitted per ghost block
+    key = ("ghost", CELL, alpha)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (*COLORS['GHOST'], alpha), (1, 1, CELL-2, CELL-2), border_radius=4, width=2)
+        _SURFACE_POOL[key] = surf
+    return surf
+
+def draw_board_background(surf):
+    # Everything in draw_board that doesn't depend on game state
     left_x = BORDER
     grid_x = LEFT_PANEL_W + BORDER
     right_x = LEFT_PANEL_W + BORDER + GRID_W + BORDER
@@ -403,6 +527,28 @@ def draw_board(surf, board: Board):
         y = BORDER + r * CELL
         pygame.draw.line(surf, GRID_LINE, (grid_x, y), (grid_x + GRID_W, y))
 
+    # Side panels and their labels
+    panel = pygame.Rect(left_x, BORDER, LEFT_PANEL_W, GRID_H)
+    pygame.draw.rect(surf, PANEL_BG, panel, border_radius=10)
+    draw_text(surf, "HOLD", 20, panel.centerx, panel.y + 12, MUTED, align="midtop")
+    rpanel = pygame.Rect(right_x, BORDER, RIGHT_PANEL_W, GRID_H)
+    pygame.draw.rect(surf, PANEL_BG, rpanel, border_radius=10)
+    draw_text(surf, "NEXT", 20, rpanel.centerx, rpanel.y + 12, MUTED, align="midtop")
+    draw_text(surf, f"SCORE", 18, rpanel.centerx, rpanel.y + 140, MUTED, "midtop")
+    draw_text(surf, f"LEVEL", 18, rpanel.centerx, rpanel.y + 210, MUTED, "midtop")
+    draw_text(surf, f"LINES", 18, rpanel.centerx, rpanel.y + 280, MUTED, "midtop")
+
+BOARD_BACKGROUND = BackgroundCache(draw_board_background)
+
+def draw_board(surf, board: Board):
+    # Panels rects
+    left_x = BORDER
+    grid_x = LEFT_PANEL_W + BORDER
+    right_x = LEFT_PANEL_W + BORDER + GRID_W + BORDER
+
+    # Backgrounds, grid lines and panels from the cached static layer
+    BOARD_BACKGROUND.blit(surf, (BG, GRID_BG, GRID_LINE, PANEL_BG, MUTED))
+
     # Locked blocks
     for y in range(ROWS):  # only visible rows
         gy = y + HIDDEN_ROWS
@@ -417,14 +563,12 @@ def draw_board(surf, board: Board):
     gy = board.ghost_y()
     p = board.active
     ghost_alpha = 80
-    ghost_surf = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
+    ghost_cell = ghost_cell_surface(ghost_alpha)
     for x, y in p.blocks(oy=gy):
         if y >= HIDDEN_ROWS:
             rx = grid_x + x * CELL
             ry = BORDER + (y - HIDDEN_ROWS) * CELL
-            pygame.draw.rect(ghost_surf, (*COLORS['GHOST'], ghost_alpha),
-                             (rx+1, ry+1, CELL-2, CELL-2), border_radius=4, width=2)
-    surf.blit(ghost_surf, (0,0))
+            surf.blit(ghost_cell, (rx, ry))
 
     # Active piece
     for x, y in p.blocks():
@@ -435,23 +579,16 @@ def draw_board(surf, board: Board):
 
     # Left Panel (HOLD)
     panel = pygame.Rect(left_x, BORDER, LEFT_PANEL_W, GRID_H)
-    pygame.draw.rect(surf, (28, 30, 40), panel, border_radius=10)
-    draw_text(surf, "HOLD", 20, panel.centerx, panel.y + 12, MUTED, align="midtop")
     draw_mini_piece(surf, board.hold, panel, offset_y=40)
 
     # Right Panel (NEXT + stats)
     rpanel = pygame.Rect(right_x, BORDER, RIGHT_PANEL_W, GRID_H)
-    pygame.draw.rect(surf, (28, 30, 40), rpanel, border_radius=10)
-    draw_text(surf, "NEXT", 20, rpanel.centerx, rpanel.y + 12, MUTED, align="midtop")
     next_kind = board.queue[0]
     draw_mini_piece(surf, next_kind, rpanel, offset_y=40)
 
     # Stats
-    draw_text(surf, f"SCORE", 18, rpanel.centerx, rpanel.y + 140, MUTED, "midtop")
     draw_text(surf, f"{board.score}", 28, rpanel.centerx, rpanel.y + 162, WHITE, "midtop")
-    draw_text(surf, f"LEVEL", 18, rpanel.centerx, rpanel.y + 210, MUTED, "midtop")
     draw_text(surf, f"{board.level}", 28, rpanel.centerx, rpanel.y + 232, WHITE, "midtop")
-    draw_text(surf, f"LINES", 18, rpanel.centerx, rpanel.y + 280, MUTED, "midtop")
     draw_text(surf, f"{board.lines}", 28, rpanel.centerx, rpanel.y + 302, WHITE, "midtop")
 
 def draw_mini_piece(surf, kind, panel_rect, offset_y=40):
@@ -482,9 +619,7 @@ def draw_mini_piece(surf, kind, panel_rect, offset_y=40):
         pygame.draw.rect(surf, COLORS[kind], (rx+1, ry+1, size-2, size-2), border_radius=4)
 
 def draw_pause_overlay(surf):
-    overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-    overlay.fill((0,0,0,140))
-    surf.blit(overlay, (0,0))
+    surf.blit(pooled_surface((WIN_W, WIN_H), (0,0,0,140)), (0,0))
     draw_text(surf, "PAUSED", 48, WIN_W//2, WIN_H//2 - 24, ACCENT, "center")
     draw_text(surf, "Press P to resume", 20, WIN_W//2, WIN_H//2 + 20, WHITE, "center")
 
@@ -499,9 +634,7 @@ def draw_menu(surf, selected=0):
     draw_text(surf, "Use ↑/↓ and Enter", 18, WIN_W//2, WIN_H-56, MUTED, "center")
 
 def draw_gameover(surf, score, selected=0, entering_name=False, name=""):
-    overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-    overlay.fill((0,0,0,140))
-    surf.blit(overlay, (0,0))
+    surf.blit(pooled_surface((WIN_W, WIN_H), (0,0,0,140)), (0,0))
     draw_text(surf, "GAME OVER", 56, WIN_W//2, 100, WHITE, "center")
     draw_text(surf, f"Score: {score}", 28, WIN_W//2, 180, WHITE, "center")
     if entering_name:
@@ -147,6 +147,21 @@ DAS_DELAY = 160  # Delayed Auto Shift
 ARR_DELAY = 30  # Auto Repeat Rate
 
 
+# --- Surface Pool ---
+# Translucent fills are built once per (size, color) and reused every frame.
+_SURFACE_POOL = {}
+
+
+def pooled_surface(size, rgba):
+    key = (size, rgba)
+    surf = _SURFACE_POOL.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        _SURFACE_POOL[key] = surf
+    return surf
+
+
 # #############################################################################
 # SECTION 2: PIECE CLASS (from piece.py)
 # #############################################################################
@@ -521,9 +536,7 @@ class Game:
 
             if alpha < 255:
                 # Drawing with transparency
-                surface = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
-                pygame.draw.rect(surface, (*piece.color, alpha), (0, 0, BLOCK_SIZE, BLOCK_SIZE), 0)
-                self.screen.blit(surface, rect.topleft)
+                self.screen.blit(pooled_surface((BLOCK_SIZE, BLOCK_SIZE), (*piece.color, alpha)), rect.topleft)
             else:
                 pygame.draw.rect(self.screen, piece.color, rect)
 
@@ -567,9 +580,7 @@ class Game:
 
         if self.board.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(pooled_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 180)), (0, 0))
 
             font_game_over = pygame.font.Font(None, 72)
             game_over_text = font_game_over.render("GAME OVER", True, (255, 0, 0))
@@ -132,6 +132,9 @@ SHAPE_COLORS = [
     (128, 0, 128)  # T - Purple
 ]
 
+# Colour of an empty grid cell
+EMPTY = (0, 0, 0)
+
 
 # --- Game Classes ---
 
@@ -162,6 +165,25 @@ class Piece:
         return positions
 
 
+class BackgroundCache:
+    """Holds the pre-rendered playfield grid and side panels so they are not redrawn every frame."""
+
+    def __init__(self, render):
+        self.render = render  # render(surface) paints the static layer
+        self.key = None
+        self.surface = None
+
+    def blit(self, target, theme=None):
+        key = (target.get_size(), theme)
+        if key != self.key:
+            bg = pygame.Surface(target.get_size())
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert()
+            self.render(bg)
+            self.surface, self.key = bg, key
+        target.blit(self.surface, (0, 0))
+
+
 class TetrisGame:
     """The main class that orchestrates the game."""
 
@@ -175,13 +197,13 @@ class TetrisGame:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont('Arial', 30)
         self.small_font = pygame.font.SysFont('Arial', 24)
+        self.background = BackgroundCache(self.draw_background)
 
         self.reset_game()
 
     def reset_game(self):
         """Initializes or resets all game state variables."""
-        self.locked_positions = {}  # (x, y): (r, g, b)
-        self.grid = self.create_grid()
+        self.grid = self.create_grid()  # grid[y][x] = (r, g, b), EMPTY if free
 
         self.change_piece = False
         self.run_game = True
@@ -218,34 +240,21 @@ class TetrisGame:
         return Piece(3, 0, shape_index)
 
     def create_grid(self):
-        """Creates an empty 10x20 grid and populates it with locked pieces."""
-        grid = [[(0, 0, 0) for _ in range(10)] for _ in range(20)]
-        for y in range(len(grid)):
-            for x in range(len(grid[y])):
-                if (x, y) in self.locked_positions:
-                    grid[y][x] = self.locked_positions[(x, y)]
-        return grid
+        """Creates an empty 10x20 grid; locked blocks are written into it in place."""
+        return [[EMPTY for _ in range(10)] for _ in range(20)]
 
     def is_valid_space(self, piece):
         """Checks if the piece's current position is valid."""
-        accepted_pos = [[(j, i) for j in range(10) if self.grid[i][j] == (0, 0, 0)] for i in range(20)]
-        accepted_pos = [j for sub in accepted_pos for j in sub]
-
-        formatted_shape = piece.get_formatted_shape()
-
-        for pos in formatted_shape:
-            if pos not in accepted_pos:
-                if pos[1] > -1:  # Allow pieces to be above the visible grid
-                    return False
+        for x, y in piece.get_formatted_shape():
+            if y < 0:  # Allow pieces to be above the visible grid
+                continue
+            if not 0 <= x < 10 or y >= 20 or self.grid[y][x] != EMPTY:
+                return False
         return True
 
     def check_lost(self):
-        """Checks if any locked piece is above the visible playfield."""
-        for pos in self.locked_positions:
-            x, y = pos
-            if y < 1:
-                return True
-        return False
+        """Checks if any locked block has reached the top row of the playfield."""
+        return any(cell != EMPTY for cell in self.grid[0])
 
     def clear_lines(self):
         """Checks for and clears completed lines, returns number of lines cleared."""
@@ -253,29 +262,12 @@ class TetrisGame:
 
         # Iterate from bottom to top
         for y in range(19, -1, -1):
-            row_full = True
-            for x in range(10):
-                if self.grid[y][x] == (0, 0, 0):
-                    row_full = False
-                    break
-
-            if row_full:
+            if EMPTY not in self.grid[y]:
                 lines_to_clear += 1
                 # TODO: Play line clear sound
-                # Shift every row above this one down
-                for y_above in range(y, 0, -1):
-                    for x_inner in range(10):
-                        self.grid[y_above][x_inner] = self.grid[y_above - 1][x_inner]
-                for x_inner in range(10):
-                    self.grid[0][x_inner] = (0, 0, 0)
-
-        # Update locked_positions from the modified grid
-        new_locked = {}
-        for y_new in range(len(self.grid)):
-            for x_new in range(len(self.grid[y_new])):
-                if self.grid[y_new][x_new] != (0, 0, 0):
-                    new_locked[(x_new, y_new)] = self.grid[y_new][x_new]
-        self.locked_positions = new_locked
+                # Shift every row above this one down by moving row references
+                del self.grid[y]
+                self.grid.insert(0, [EMPTY for _ in range(10)])
 
         return lines_to_clear
 
@@ -310,12 +302,11 @@ class TetrisGame:
 
     def lock_piece(self):
         """Locks the current piece to the grid."""
-        for pos in self.current_piece.get_formatted_shape():
-            p = (pos[0], pos[1])
-            self.locked_positions[p] = self.current_piece.color
+        for x, y in self.current_piece.get_formatted_shape():
+            if y > -1:  # Blocks above the visible grid are dropped, as before
+                self.grid[y][x] = self.current_piece.color
 
         self.change_piece = True
-        self.grid = self.create_grid()
         lines_cleared = self.clear_lines()
         if lines_cleared > 0:
             self.update_score(lines_cleared)
@@ -413,22 +404,34 @@ class TetrisGame:
         if is_on_ground:
             self.lock_timer = pygame.time.get_ticks()
 
-    def draw_grid_lines(self):
+    def draw_grid_lines(self, surface):
         """Draws the grid lines for the playfield."""
         for i in range(21):
-            pygame.draw.line(self.screen, (128, 128, 128), (TOP_LEFT_X, TOP_LEFT_Y + i * BLOCK_SIZE),
+            pygame.draw.line(surface, (128, 128, 128), (TOP_LEFT_X, TOP_LEFT_Y + i * BLOCK_SIZE),
                              (TOP_LEFT_X + PLAY_WIDTH, TOP_LEFT_Y + i * BLOCK_SIZE))
         for j in range(11):
-            pygame.draw.line(self.screen, (128, 128, 128), (TOP_LEFT_X + j * BLOCK_SIZE, TOP_LEFT_Y),
+            pygame.draw.line(surface, (128, 128, 128), (TOP_LEFT_X + j * BLOCK_SIZE, TOP_LEFT_Y),
                              (TOP_LEFT_X + j * BLOCK_SIZE, TOP_LEFT_Y + PLAY_HEIGHT))
 
-    def draw_window(self):
-        """Draws everything to the screen."""
-        self.screen.fill((20, 20, 30))  # Dark blue background
+    def draw_background(self, surface):
+        """Draws the static parts of the window: fill, title, labels, border and grid lines."""
+        surface.fill((20, 20, 30))  # Dark blue background
 
-        # Draw Title
         title_text = self.font.render("Tetris Classic", True, (255, 255, 255))
-        self.screen.blit(title_text, (TOP_LEFT_X + PLAY_WIDTH / 2 - title_text.get_width() / 2, 15))
+        surface.blit(title_text, (TOP_LEFT_X + PLAY_WIDTH / 2 - title_text.get_width() / 2, 15))
+
+        next_label = self.font.render("NEXT", True, (255, 255, 255))
+        surface.blit(next_label, (TOP_LEFT_X + PLAY_WIDTH + 50, TOP_LEFT_Y))
+        hold_label = self.font.render("HOLD", True, (255, 255, 255))
+        surface.blit(hold_label, (TOP_LEFT_X - 150, TOP_LEFT_Y))
+
+        pygame.draw.rect(surface, (150, 150, 150), (TOP_LEFT_X, TOP_LEFT_Y, PLAY_WIDTH, PLAY_HEIGHT), 2)
+        self.draw_grid_lines(surface)
+
+    def draw_window(self):
+        """Draws everything to the screen."""
+        # Background, title, labels and playfield grid are cached; only redrawn on resize
+        self.background.blit(self.screen)
 
         # Draw HUD: Score, Level, Lines
         score_label = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
@@ -440,26 +443,18 @@ class TetrisGame:
         self.screen.blit(lines_label, (TOP_LEFT_X + PLAY_WIDTH + 50, TOP_LEFT_Y + 300))
 
         # Draw "NEXT" queue
-        next_label = self.font.render("NEXT", True, (255, 255, 255))
-        self.screen.blit(next_label, (TOP_LEFT_X + PLAY_WIDTH + 50, TOP_LEFT_Y))
         for i, piece in enumerate(self.next_piece_shapes[:3]):
             self.draw_small_piece(piece, TOP_LEFT_X + PLAY_WIDTH + 50, TOP_LEFT_Y + 50 + i * 80)
 
         # Draw "HOLD" queue
-        hold_label = self.font.render("HOLD", True, (255, 255, 255))
-        self.screen.blit(hold_label, (TOP_LEFT_X - 150, TOP_LEFT_Y))
         if self.held_piece_shape_index is not None:
             held_piece = Piece(0, 0, self.held_piece_shape_index)
             self.draw_small_piece(held_piece, TOP_LEFT_X - 150, TOP_LEFT_Y + 50)
 
-        # Draw the playfield border and grid lines
-        pygame.draw.rect(self.screen, (150, 150, 150), (TOP_LEFT_X, TOP_LEFT_Y, PLAY_WIDTH, PLAY_HEIGHT), 2)
-        self.draw_grid_lines()
-
         # Draw the locked blocks
         for y in range(len(self.grid)):
             for x in range(len(self.grid[y])):
-                if self.grid[y][x] != (0, 0, 0):
+                if self.grid[y][x] != EMPTY:
                     pygame.draw.rect(self.screen, self.grid[y][x],
                                      (TOP_LEFT_X + x * BLOCK_SIZE, TOP_LEFT_Y + y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE),
                                      0)
@@ -545,7 +540,6 @@ class TetrisGame:
         self.draw_start_screen()
 
         while self.run_game:
-            self.grid = self.create_grid()
             self.fall_time += self.clock.get_rawtime()
             self.clock.tick()
 
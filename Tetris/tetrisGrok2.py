@@ -13,6 +13,11 @@ PLAYFIELD_HEIGHT = 20
 BUFFER_ROWS = 4
 TOTAL_HEIGHT = PLAYFIELD_HEIGHT + BUFFER_ROWS
 
+# HUD layout (top-left corners)
+HOLD_X, HOLD_Y = 50, 100
+PLAY_X, PLAY_Y = 200, 50
+NEXT_X, NEXT_Y = 500, 100
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -228,6 +233,37 @@ class Board:
     def is_game_over(self, piece):
         return self.check_collision(piece, 0, 0)
 
+class BackgroundCache:
+    # HUD panels and grid outlines, drawn once and reused until the screen size or colors change
+    def __init__(self, render):
+        self.render = render  # render(surface) paints the static layer
+        self.key = None
+        self.surface = None
+
+    def blit(self, target, theme=None):
+        key = (target.get_size(), theme)
+        if key != self.key:
+            bg = pygame.Surface(target.get_size())
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert()
+            self.render(bg)
+            self.surface, self.key = bg, key
+        target.blit(self.surface, (0, 0))
+
+def draw_hud_background(surface):
+    # Screen fill, HOLD/NEXT panels and the empty playfield grid
+    small_font = pygame.font.SysFont("Arial", 18)
+    surface.fill(BLACK)
+    pygame.draw.rect(surface, DARK_GRAY, (HOLD_X - 10, HOLD_Y - 30, 120, 120))
+    surface.blit(small_font.render("HOLD", True, WHITE), (HOLD_X, HOLD_Y - 25))
+    for dy in range(PLAYFIELD_HEIGHT):
+        for dx in range(PLAYFIELD_WIDTH):
+            pygame.draw.rect(surface, GRAY, (PLAY_X + dx * GRID_SIZE, PLAY_Y + dy * GRID_SIZE, GRID_SIZE, GRID_SIZE), 1)
+    pygame.draw.rect(surface, DARK_GRAY, (NEXT_X - 10, NEXT_Y - 30, 120, 420))
+    surface.blit(small_font.render("NEXT", True, WHITE), (NEXT_X, NEXT_Y - 25))
+
+HUD_BACKGROUND = BackgroundCache(draw_hud_background)
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -385,12 +421,13 @@ class Game:
             self.lock_piece()
 
     def draw_grid(self, surface, x, y, width, height, buffer=False):
+        # Empty cell outlines are part of HUD_BACKGROUND; only filled cells are drawn here
         for dy in range(height if buffer else PLAYFIELD_HEIGHT):
             for dx in range(width):
                 color = self.board.grid[dy + (BUFFER_ROWS if not buffer else 0)][dx]
                 if color:
                     pygame.draw.rect(surface, color, (x + dx * GRID_SIZE, y + dy * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-                pygame.draw.rect(surface, GRAY, (x + dx * GRID_SIZE, y + dy * GRID_SIZE, GRID_SIZE, GRID_SIZE), 1)
+                    pygame.draw.rect(surface, GRAY, (x + dx * GRID_SIZE, y + dy * GRID_SIZE, GRID_SIZE, GRID_SIZE), 1)
 
     def draw_piece(self, surface, piece, ox, oy, ghost=False):
         color = GRAY if ghost else piece.color
@@ -429,25 +466,24 @@ class Game:
                     pygame.draw.rect(surface, piece.color, (x + dx * GRID_SIZE * scale, y + dy * GRID_SIZE * scale, GRID_SIZE * scale, GRID_SIZE * scale))
 
     def draw_hud(self):
+        # Panels, labels and grid outlines come from the cached static layer
+        HUD_BACKGROUND.blit(self.screen, (BLACK, GRAY, DARK_GRAY, WHITE))
+
         # Left: Hold
-        hold_x = 50
-        hold_y = 100
-        pygame.draw.rect(self.screen, DARK_GRAY, (hold_x - 10, hold_y - 30, 120, 120))
-        self.screen.blit(self.small_font.render("HOLD", True, WHITE), (hold_x, hold_y - 25))
+        hold_x = HOLD_X
+        hold_y = HOLD_Y
         self.draw_hold(self.screen, hold_x, hold_y)
 
         # Center: Playfield
-        play_x = 200
-        play_y = 50
+        play_x = PLAY_X
+        play_y = PLAY_Y
         self.draw_grid(self.screen, play_x, play_y, PLAYFIELD_WIDTH, PLAYFIELD_HEIGHT)
         self.draw_ghost(self.screen, play_x, play_y)
         self.draw_piece(self.screen, self.current_piece, play_x, play_y)
 
         # Right: Next, Score, etc.
-        next_x = 500
-        next_y = 100
-        pygame.draw.rect(self.screen, DARK_GRAY, (next_x - 10, next_y - 30, 120, 420))
-        self.screen.blit(self.small_font.render("NEXT", True, WHITE), (next_x, next_y - 25))
+        next_x = NEXT_X
+        next_y = NEXT_Y
         self.draw_next(self.screen, next_x, next_y)
 
         info_y = next_y + 400
@@ -626,7 +662,7 @@ class Game:
 
             self.update(dt)
 
-            self.screen.fill(BLACK)
+            # draw_hud blits a cached background; the other screens fill their own
             if self.game_state == "playing":
                 self.draw_hud()
             elif self.game_state == "menu":
@@ -0,0 +1,298 @@
+# blockBlastMonteCarlo.py
+# Monte Carlo comparison of piece distributions for Best/blockBlastGPT5.py.
+#
+# Plays many headless Block Blast games per piece distribution (how trays of three shapes
+# are dealt) with a pluggable placement policy, on the game's bitboard core
+# (Best/blockBlastBitboard.py) so pygame is never imported. The rules match the game: a
+# placement clears every full row and column and scores clear_points; a new tray is dealt
+# once all three pieces are used; the game ends as soon as no piece left in the tray fits.
+# Games are split into batches over a process pool and the per-batch tallies merged.
+#
+# Per distribution it reports mean/median score and trays survived, a survival curve (share
+# of games still alive after N trays), and game-over causes: how many pieces were stuck,
+# whether a freshly dealt tray was already dead, and which shapes were stuck most often.
+#
+# Usage:
+#   python Tools/blockBlastMonteCarlo.py                                # all distributions
+#   python Tools/blockBlastMonteCarlo.py --games 200000 --policy first uniform bag
+#   python Tools/blockBlastMonteCarlo.py --policy greedy --max-trays 500 --json mc.json
+#
+# Add distributions to DISTRIBUTIONS (a factory taking an rng and returning a deal() that
+# yields three shape indices) and policies to POLICIES (a factory taking an rng and
+# returning choose(geo, board, tray) -> (slot, Placement) or None).
+
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "Best"))
+
+from blockBlastBitboard import SHAPES, clear_points, geometry, solve_tray  # noqa: E402
+
+SHAPE_NAMES = ["dot", "domino-h", "domino-v", "line3-h", "line3-v", "square",
+               "L", "J", "L-flip", "J-flip", "T-down", "T-up", "corner", "corner-flip", "plus"]
+SURVIVAL_TRAYS = (5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+# --------------------------
+# Distributions
+# --------------------------
+def uniform(rng):
+    """random_piece in the game: every shape equally likely, independently."""
+    n = len(SHAPES)
+    return lambda: [rng.randrange(n) for _ in range(3)]
+
+
+def by_size(weight):
+    def factory(rng):
+        sizes = [len(cells) for cells in SHAPES]
+        weights = [weight(s) for s in sizes]
+        shapes = range(len(SHAPES))
+        return lambda: rng.choices(shapes, weights, k=3)
+    return factory
+
+
+def bag(rng):
+    """Shuffled bag of all shapes, dealt three at a time and refilled when empty."""
+    pool = []
+
+    def deal():
+        tray = []
+        while len(tray) < 3:
+            if not pool:
+                pool.extend(range(len(SHAPES)))
+                rng.shuffle(pool)
+            tray.append(pool.pop())
+        return tray
+    return deal
+
+
+def distinct(rng):
+    """Three different shapes per tray."""
+    shapes = range(len(SHAPES))
+    return lambda: rng.sample(shapes, 3)
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "small-heavy": by_size(lambda cells: 1.0 / cells),
+    "large-heavy": by_size(lambda cells: float(cells)),
+    "bag": bag,
+    "distinct": distinct,
+}
+
+
+# --------------------------
+# Policies
+# --------------------------
+def first_fit(rng):
+    """First tray piece that fits, at its first (row-major) position."""
+    def choose(geo, board, tray):
+        for slot, shape in enumerate(tray):
+            if shape is None:
+                continue
+            for p in geo.placements[shape]:
+                if not board & p.mask:
+                    return slot, p
+        return None
+    return choose
+
+
+def random_fit(rng):
+    """Uniformly random legal (piece, position)."""
+    def choose(geo, board, tray):
+        legal = [(slot, p) for slot, shape in enumerate(tray) if shape is not None
+                 for p in geo.placements[shape] if not board & p.mask]
+        return rng.choice(legal) if legal else None
+    return choose
+
+
+def greedy(rng):
+    """Best single placement by points plus Geometry.evaluate."""
+    def choose(geo, board, tray):
+        best, best_score = None, None
+        for slot, shape in enumerate(tray):
+            if shape is None or shape in tray[:slot]:
+                continue
+            for p in geo.placements[shape]:
+                if not board & p.mask:
+                    after, n_lines = geo.place(board, p)
+                    score = clear_points(n_lines) + geo.evaluate(after)
+                    if best_score is None or score > best_score:
+                        best, best_score = (slot, p), score
+        return best
+    return choose
+
+
+def solver(rng):
+    """The game's hint/autoplay solver, re-run before every placement."""
+    def choose(geo, board, tray):
+        slots = [i for i, s in enumerate(tray) if s is not None]
+        moves, _, _ = solve_tray(geo, board, [tray[i] for i in slots])
+        if not moves:
+            return None
+        i, p = moves[0]
+        return slots[i], p
+    return choose
+
+
+POLICIES = {
+    "first": first_fit,
+    "random": random_fit,
+    "greedy": greedy,
+    "solver": solver,
+}
+
+
+# --------------------------
+# Simulation
+# --------------------------
+def play_game(geo, deal, choose, max_trays):
+    """One game; returns (score, trays dealt, placements, stuck shapes, fresh tray was dead)."""
+    board = 0
+    score = placements = 0
+    trays = 0
+    while trays < max_trays:
+        tray = deal()
+        trays += 1
+        fresh = True
+        while any(s is not None for s in tray):
+            if not any(geo.fits_anywhere(board, s) for s in tray if s is not None):
+                return score, trays, placements, [s for s in tray if s is not None], fresh
+            slot, p = choose(geo, board, tray)
+            board, n_lines = geo.place(board, p)
+            score += clear_points(n_lines)
+            placements += 1
+            tray[slot] = None
+            fresh = False
+    return score, trays, placements, [], False
+
+
+def run_batch(job):
+    """A batch of games for one distribution; returns mergeable tallies."""
+    dist_name, policy_name, seed, games, max_trays, size = job
+    rng = random.Random(seed)
+    geo = geometry(size)
+    deal = DISTRIBUTIONS[dist_name](rng)
+    choose = POLICIES[policy_name](rng)
+    t = {"games": 0, "scores": [], "trays": [], "placements": 0, "capped": 0,
+         "stuck_count": [0, 0, 0, 0], "fresh_dead": 0, "stuck_shape": [0] * len(SHAPES),
+         "seconds": 0.0}
+    start = time.perf_counter()
+    for _ in range(games):
+        score, trays, placements, stuck, fresh = play_game(geo, deal, choose, max_trays)
+        t["games"] += 1
+        t["scores"].append(score)
+        t["trays"].append(trays)
+        t["placements"] += placements
+        if not stuck:
+            t["capped"] += 1
+            continue
+        t["stuck_count"][len(stuck)] += 1
+        t["fresh_dead"] += fresh
+        for s in set(stuck):
+            t["stuck_shape"][s] += 1
+    t["seconds"] = time.perf_counter() - start
+    return dist_name, t
+
+
+def merge(into, t):
+    for key, value in t.items():
+        if key not in into:
+            into[key] = value
+        elif isinstance(value, list) and key in ("stuck_count", "stuck_shape"):
+            into[key] = [a + b for a, b in zip(into[key], value)]
+        else:
+            into[key] += value
+
+
+def summarize(t):
+    games = t["games"]
+    scores = sorted(t["scores"])
+    trays = sorted(t["trays"])
+    ended = games - t["capped"]
+    return {
+        "games": games,
+        "mean_score": sum(scores) / games,
+        "median_score": scores[games // 2],
+        "mean_trays": sum(trays) / games,
+        "median_trays": trays[games // 2],
+        "survival": {n: sum(1 for x in trays if x > n) / games for n in SURVIVAL_TRAYS},
+        "capped": t["capped"],
+        "stuck_pieces": {k: t["stuck_count"][k] / max(ended, 1) for k in (1, 2, 3)},
+        "fresh_tray_dead": t["fresh_dead"] / max(ended, 1),
+        "stuck_shapes": {SHAPE_NAMES[s]: t["stuck_shape"][s] / max(ended, 1)
+                         for s in range(len(SHAPES))},
+        "placements_per_s": t["placements"] / t["seconds"] if t["seconds"] else None,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Monte Carlo piece-distribution analysis for Block Blast.")
+    ap.add_argument("distributions", nargs="*", help=f"default: all of {', '.join(DISTRIBUTIONS)}")
+    ap.add_argument("--games", type=int, default=20000, help="games per distribution")
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="first")
+    ap.add_argument("--max-trays", type=int, default=1000, help="stop a game after this many trays")
+    ap.add_argument("--size", type=int, default=8, help="board cells per side")
+    ap.add_argument("--batch", type=int, default=500, help="games per pool task")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--json", help="also write the summaries to this file")
+    args = ap.parse_args()
+
+    names = args.distributions or list(DISTRIBUTIONS)
+    for name in names:
+        if name not in DISTRIBUTIONS:
+            ap.error(f"unknown distribution {name!r}")
+    jobs = []
+    for d, name in enumerate(names):
+        for b, start in enumerate(range(0, args.games, args.batch)):
+            seed = (args.seed * 1000003 + d) * 100003 + b
+            jobs.append((name, args.policy, seed, min(args.batch, args.games - start),
+                         args.max_trays, args.size))
+
+    start = time.perf_counter()
+    tallies = {name: {} for name in names}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for name, t in pool.map(run_batch, jobs):
+            merge(tallies[name], t)
+    elapsed = time.perf_counter() - start
+    results = {name: summarize(tallies[name]) for name in names}
+
+    width = max(len(n) for n in names)
+    print(f"policy {args.policy}, {args.games} games per distribution, {args.size}x{args.size}, "
+          f"cap {args.max_trays} trays")
+    print(f"{'distribution':<{width}}  {'score':>8} {'median':>7} {'trays':>7} {'median':>6} "
+          f"{'capped':>6} {'place/s/job':>11}")
+    for name in names:
+        r = results[name]
+        print(f"{name:<{width}}  {r['mean_score']:>8.0f} {r['median_score']:>7} {r['mean_trays']:>7.1f} "
+              f"{r['median_trays']:>6} {r['capped']:>6} {r['placements_per_s']:>11,.0f}")
+
+    print("\nsurvival: share of games alive after N trays")
+    print(f"{'distribution':<{width}}  " + " ".join(f"{n:>6}" for n in SURVIVAL_TRAYS))
+    for name in names:
+        s = results[name]["survival"]
+        print(f"{name:<{width}}  " + " ".join(f"{s[n]:>6.1%}" for n in SURVIVAL_TRAYS))
+
+    print("\ngame-over causes: pieces stuck, fresh tray already dead, shapes most often stuck")
+    for name in names:
+        r = results[name]
+        stuck = " ".join(f"{k}:{r['stuck_pieces'][k]:.0%}" for k in (1, 2, 3))
+        shapes = sorted(r["stuck_shapes"].items(), key=lambda kv: -kv[1])[:4]
+        print(f"{name:<{width}}  {stuck}  fresh dead {r['fresh_tray_dead']:.0%}  "
+              + ", ".join(f"{s} {v:.0%}" for s, v in shapes))
+    print(f"\n{len(names) * args.games} games in {elapsed:.1f} s with {args.jobs} jobs")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"policy": args.policy, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
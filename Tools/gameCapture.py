@@ -0,0 +1,378 @@
+# gameCapture.py
+# Frame-exact, unattended video capture for any game script in this repo.
+#
+# The game runs unmodified in this process. pygame.display.flip/update are wrapped so every
+# presented frame is grabbed from the display surface and handed to a background writer
+# thread through a bounded queue; the writer saves a PNG sequence, appends raw RGB24 to a
+# single file, or pipes into a local ffmpeg binary. The game thread only copies pixels.
+#
+# Determinism: while capturing, pygame's clocks (Clock, get_ticks, wait/delay) and
+# time.time/perf_counter run on a virtual clock that advances exactly 1/fps per frame,
+# and `random` is seeded. Input can be recorded to a JSON-lines log (--record) and
+# replayed (--replay): events are fed back on the same frame and event.get() call they
+# were first seen on, and key/mouse state is rebuilt from them. Replaying the same log
+# twice therefore yields identical frames.
+#
+# Usage:
+#   python Tools/gameCapture.py Best/tetrisGPT5.py --record run.jsonl          # play, log input
+#   python Tools/gameCapture.py Best/tetrisGPT5.py --replay run.jsonl --format ffmpeg --out run.mp4
+#   python Tools/gameCapture.py Best/pacmanGPT5.py --frames 600 --format png --out frames/
+#
+# Queue: by default a full queue makes the game wait for the writer (no frame is ever
+# lost, which is what frame-exact output needs; with the virtual clock this only affects
+# wall time). --drop-when-full drops frames instead, for live sessions.
+#
+# Requires: pygame; ffmpeg on PATH (or --ffmpeg) for --format ffmpeg
+
+import argparse
+import json
+import os
+import queue
+import random
+import runpy
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+CONTROL_EVENT_ATTRS = ("pos", "rel")
+
+
+# ----------------------------- Writer ----------------------------------
+
+class FrameWriter(threading.Thread):
+    """Drains (index, size, rgb_bytes) frames from a bounded queue and writes them out."""
+
+    def __init__(self, out, fmt, fps, maxsize=64, drop_when_full=False, ffmpeg="ffmpeg"):
+        super().__init__(name="frame-writer", daemon=True)
+        self.out = out
+        self.fmt = fmt
+        self.fps = fps
+        self.drop_when_full = drop_when_full
+        self.ffmpeg = ffmpeg
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.size = None
+        self.written = 0
+        self.dropped = 0
+        self.skipped = 0  # frames whose size differs from the first one (raw/ffmpeg only)
+        self.error = None
+        self._sink = None
+
+    def submit(self, index, size, data):
+        if self.size is None:
+            self.size = size
+        elif size != self.size and self.fmt != "png":
+            self.skipped += 1
+            return
+        try:
+            self.queue.put((index, size, data), block=not self.drop_when_full)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        self.queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+
+    def run(self):
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                self._write(*item)
+                self.written += 1
+        except Exception as exc:  # surfaced by close()
+            self.error = exc
+            # keep draining so the game thread never blocks on a dead writer
+            while self.queue.get() is not None:
+                pass
+        finally:
+            self._finish()
+
+    def _open(self, size):
+        w, h = size
+        if self.fmt == "png":
+            os.makedirs(self.out, exist_ok=True)
+        elif self.fmt == "raw":
+            self._sink = open(self.out, "wb")
+            with open(self.out + ".json", "w") as f:
+                json.dump({"width": w, "height": h, "fps": self.fps, "pix_fmt": "rgb24"}, f)
+        else:
+            cmd = [self.ffmpeg, "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(self.fps),
+                   "-i", "-", "-c:v", "libx264", "-pix_fmt", "yuv420p", self.out]
+            self._sink = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def _write(self, index, size, data):
+        if self.written == 0:
+            self._open(size)
+        if self.fmt == "png":
+            import pygame
+            surf = pygame.image.frombytes(data, size, "RGB")
+            pygame.image.save(surf, os.path.join(self.out, f"frame_{index:06d}.png"))
+        elif self.fmt == "raw":
+            self._sink.write(data)
+        else:
+            self._sink.stdin.write(data)
+
+    def _finish(self):
+        if self._sink is None:
+            return
+        if self.fmt == "raw":
+            self._sink.close()
+        else:
+            self._sink.stdin.close()
+            self._sink.wait()
+
+
+# -------------------------- Virtual time -------------------------------
+
+class VirtualTime:
+    """Fixed-step time base: each presented frame is exactly 1/fps seconds."""
+
+    def __init__(self, fps, realtime):
+        self.fps = fps
+        self.realtime = realtime  # sleep to real-time pace (live play while recording)
+        self.ms = 0.0
+        self._wall = time.perf_counter  # keep the real clock; time.* gets patched to this one
+        self._wall_start = self._wall()
+        self._epoch = time.time()
+
+    def advance(self, ms):
+        self.ms += ms
+        if self.realtime:
+            lag = self.ms / 1000.0 - (self._wall() - self._wall_start)
+            if lag > 0:
+                time.sleep(lag)
+
+    def seconds(self):
+        return self.ms / 1000.0
+
+
+def make_clock_class(vt):
+    class VirtualClock:
+        # Same surface as pygame.time.Clock, but every tick is one fixed frame step
+        def __init__(self):
+            self._last = vt.ms
+            self._carry = 0.0
+            self._dt = 0
+
+        def tick(self, framerate=0):
+            target = self._last + 1000.0 / vt.fps
+            if vt.ms < target:
+                vt.advance(target - vt.ms)
+            exact = vt.ms - self._last + self._carry
+            self._dt = int(exact)
+            self._carry = exact - self._dt
+            self._last = vt.ms
+            return self._dt
+
+        tick_busy_loop = tick
+
+        def get_time(self):
+            return self._dt
+
+        def get_rawtime(self):
+            return self._dt
+
+        def get_fps(self):
+            return float(vt.fps)
+
+    return VirtualClock
+
+
+# --------------------------- Input log ---------------------------------
+
+def event_to_record(frame, call, event):
+    attrs = {}
+    for k, v in event.dict.items():
+        if isinstance(v, tuple):
+            v = list(v)
+        if isinstance(v, (int, float, str, bool, list)) or v is None:
+            attrs[k] = v
+    return {"frame": frame, "call": call, "type": event.type, "attrs": attrs}
+
+
+def record_to_event(pygame, rec):
+    attrs = dict(rec["attrs"])
+    for k in CONTROL_EVENT_ATTRS:
+        if isinstance(attrs.get(k), list):
+            attrs[k] = tuple(attrs[k])
+    return pygame.event.Event(rec["type"], attrs)
+
+
+class PressedKeys:
+    """Replacement for pygame.key.get_pressed() rebuilt from replayed events."""
+
+    def __init__(self):
+        self.down = set()
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+# ----------------------------- Capture ---------------------------------
+
+class Capture:
+    def __init__(self, args):
+        self.args = args
+        self.frame = 0
+        self.calls_this_frame = 0
+        self.log = None
+        self.replay = {}
+        self.last_replay_frame = -1
+        self.keys = PressedKeys()
+        self.mouse_pos = (0, 0)
+        self.writer = None
+
+    def install(self):
+        args = self.args
+        header = {}
+        if args.replay:
+            with open(args.replay) as f:
+                header = json.loads(f.readline())
+                for line in f:
+                    rec = json.loads(line)
+                    self.replay.setdefault((rec["frame"], rec["call"]), []).append(rec)
+                    self.last_replay_frame = max(self.last_replay_frame, rec["frame"])
+        fps = header.get("fps", args.fps)
+        seed = header.get("seed", args.seed)
+        if args.headless or args.replay:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        import pygame
+        self.pygame = pygame
+        random.seed(seed)
+
+        self.vt = VirtualTime(fps, realtime=not (args.headless or args.replay))
+        vt = self.vt
+        pygame.time.Clock = make_clock_class(vt)
+        pygame.time.get_ticks = lambda: int(vt.ms)
+        pygame.time.wait = pygame.time.delay = lambda ms: (vt.advance(ms), int(ms))[1]
+        time.time = lambda: vt._epoch + vt.seconds()
+        time.perf_counter = vt.seconds
+        time.monotonic = vt.seconds
+
+        if args.record:
+            self.log = open(args.record, "w")
+            self.log.write(json.dumps({"game": args.game, "fps": fps, "seed": seed}) + "\n")
+
+        self._orig_get = pygame.event.get
+        self._orig_flip = pygame.display.flip
+        self._orig_update = pygame.display.update
+        pygame.event.get = self.event_get
+        pygame.display.flip = self.flip
+        pygame.display.update = self.update
+        if args.replay:
+            pygame.key.get_pressed = lambda: self.keys
+            pygame.mouse.get_pos = lambda: self.mouse_pos
+
+        if args.out:
+            self.writer = FrameWriter(args.out, args.format, fps, args.queue,
+                                      args.drop_when_full, args.ffmpeg)
+            self.writer.start()
+
+    # -- pygame hooks --
+
+    def event_get(self, *a, **kw):
+        pygame = self.pygame
+        call = self.calls_this_frame
+        self.calls_this_frame += 1
+        if self.args.replay:
+            real = self._orig_get()  # keep the OS queue drained; only QUIT gets through
+            events = [record_to_event(pygame, r) for r in self.replay.get((self.frame, call), [])]
+            events += [e for e in real if e.type == pygame.QUIT]
+            for e in events:
+                if e.type == pygame.KEYDOWN:
+                    self.keys.down.add(e.key)
+                elif e.type == pygame.KEYUP:
+                    self.keys.down.discard(e.key)
+                if hasattr(e, "pos"):
+                    self.mouse_pos = e.pos
+        else:
+            events = self._orig_get(*a, **kw)
+            if self.log:
+                for e in events:
+                    self.log.write(json.dumps(event_to_record(self.frame, call, e)) + "\n")
+        if self._should_stop():
+            events.append(pygame.event.Event(pygame.QUIT))
+        return events
+
+    def flip(self):
+        self._present()
+        return self._orig_flip()
+
+    def update(self, *a, **kw):
+        self._present()
+        return self._orig_update(*a, **kw)
+
+    def _present(self):
+        pygame = self.pygame
+        # frames presented after the stop frame (while the game handles QUIT) are not kept
+        if self.writer is not None and not self._should_stop():
+            surf = pygame.display.get_surface()
+            if surf is not None:
+                tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+                self.writer.submit(self.frame, surf.get_size(), tobytes(surf, "RGB"))
+        self.frame += 1
+        self.calls_this_frame = 0
+        # Games that ignore QUIT still stop a few frames after the budget
+        if self._should_stop() and self.frame > self._stop_frame() + 30:
+            raise SystemExit(0)
+
+    def _stop_frame(self):
+        if self.args.frames:
+            return self.args.frames
+        if self.args.replay:
+            return self.last_replay_frame + 1
+        return None
+
+    def _should_stop(self):
+        stop = self._stop_frame()
+        return stop is not None and self.frame >= stop
+
+    def finish(self):
+        if self.log:
+            self.log.close()
+        if self.writer is not None:
+            self.writer.close()
+            w = self.writer
+            print(f"captured {w.written} frames ({w.dropped} dropped, {w.skipped} size-mismatched) -> {w.out}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Capture frame-exact video of a pygame game script.")
+    ap.add_argument("game", help="path to the game .py file")
+    ap.add_argument("--out", help="output: directory (png), file (raw) or video file (ffmpeg)")
+    ap.add_argument("--format", choices=("png", "raw", "ffmpeg"), default="png")
+    ap.add_argument("--fps", type=int, default=60, help="virtual frame rate (and video rate)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--frames", type=int, default=0, help="stop after this many frames")
+    ap.add_argument("--record", help="write input events to this JSON-lines log")
+    ap.add_argument("--replay", help="replay input events from a --record log (implies headless)")
+    ap.add_argument("--headless", action="store_true", help="dummy SDL video, run as fast as possible")
+    ap.add_argument("--queue", type=int, default=64, help="frames buffered between game and writer")
+    ap.add_argument("--drop-when-full", action="store_true", help="drop frames instead of waiting")
+    ap.add_argument("--ffmpeg", default=shutil.which("ffmpeg") or "ffmpeg")
+    args = ap.parse_args()
+    if args.format == "ffmpeg" and args.out and shutil.which(args.ffmpeg) is None:
+        ap.error(f"ffmpeg binary not found: {args.ffmpeg}")
+
+    cap = Capture(args)
+    cap.install()
+    game_path = os.path.abspath(args.game)
+    sys.path.insert(0, os.path.dirname(game_path))
+    sys.argv = [game_path]
+    try:
+        runpy.run_path(game_path, run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        cap.finish()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# smokeMatrix.py
+# Parallel smoke-and-perf pass over every game script in the repo.
+#
+# Each game (every .py under PacMan/, Tetris/, Tank/, BlockBlast/ and Best/ that opens a
+# display) runs in its own Python subprocess on the dummy SDL driver, from a scratch working
+# directory so high-score files don't land in the repo. Inside the child, pygame is patched
+# to feed synthetic input (random keys held for a few frames, clicks and drags at random
+# positions) and to count presented frames; after the wall-clock budget the game is stopped.
+# Up to one child per CPU runs at a time.
+#
+# Per game it records: status (ok / exited / crash / hang), startup time (launch to first
+# presented frame), sustained FPS (frames after a short warm-up), pygame.Surface()
+# constructions per frame after the same warm-up (0 means the steady-state loop allocates
+# no surfaces of its own; font renders and copies are not counted), and peak RSS.
+#
+# Usage:
+#   python Tools/smokeMatrix.py                      # all games, 5 s each
+#   python Tools/smokeMatrix.py --seconds 10 --uncapped --json smoke.json
+#   python Tools/smokeMatrix.py Tetris/tetrisGrok.py Best/pacmanGPT5.py
+#
+# --uncapped makes Clock.tick() ignore its framerate argument, so FPS shows how fast a game
+# can run rather than the cap it asks for.
+
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_DIRS = ("PacMan", "Tetris", "Tank", "BlockBlast", "Best")
+RESULT_PREFIX = "SMOKE_RESULT "
+WARMUP_SECONDS = 0.5
+
+
+def find_games():
+    games = []
+    for d in GAME_DIRS:
+        folder = os.path.join(REPO_ROOT, d)
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if name.endswith(".py") and "display.set_mode" in open(path, encoding="utf-8").read():
+                games.append(os.path.join(d, name))
+    return games
+
+
+# ------------------------------ Child ----------------------------------
+
+class BudgetDone(Exception):
+    pass
+
+
+class PressedKeys:
+    def __init__(self, real):
+        self.real = real
+        self.down = set()
+
+    def __getitem__(self, key):
+        return key in self.down or self.real[key]
+
+
+class SyntheticPlayer:
+    """Hooks pygame so the game sees random input and reports its frame timing."""
+
+    KEY_NAMES = ("LEFT", "RIGHT", "UP", "DOWN", "SPACE", "RETURN", "a", "d", "w", "s",
+                 "z", "x", "c", "p", "r", "1", "2", "f", "LSHIFT", "RCTRL")
+
+    def __init__(self, seconds, uncapped, seed):
+        import pygame
+        self.pygame = pygame
+        self.rng = random.Random(seed)
+        self.seconds = seconds
+        self.frames = 0
+        self.first_frame = None  # time.time() of the first presented frame
+        self.warm_frame = None   # (perf_counter, frames, surfaces) once warm-up has passed
+        self.last_frame = None
+        self.held = {}           # key -> frames left
+        self.mouse_pos = (0, 0)
+        self.dragging = False
+        self.deadline = None
+        self.keys = [getattr(pygame, "K_" + n) for n in self.KEY_NAMES]
+        self.surfaces = 0        # pygame.Surface(...) calls made by the game
+
+        player = self
+        real_surface = pygame.Surface
+
+        class CountingSurface(real_surface):
+            def __init__(self, *a, **kw):
+                player.surfaces += 1
+                super().__init__(*a, **kw)
+
+        pygame.Surface = CountingSurface
+
+        self._get = pygame.event.get
+        self._flip = pygame.display.flip
+        self._update = pygame.display.update
+        self._get_pressed = pygame.key.get_pressed
+        pygame.event.get = self.event_get
+        pygame.display.flip = self.flip
+        pygame.display.update = self.update
+        pygame.key.get_pressed = lambda: PressedKeys(self._get_pressed())
+        pygame.mouse.get_pos = lambda: self.mouse_pos
+        if uncapped:
+            real_clock = pygame.time.Clock
+
+            class UncappedClock:
+                def __init__(self):
+                    self._clock = real_clock()
+
+                def tick(self, framerate=0):
+                    return self._clock.tick()
+
+                def __getattr__(self, name):
+                    return getattr(self._clock, name)
+
+            pygame.time.Clock = UncappedClock
+
+    def _check_budget(self):
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now + self.seconds
+        elif now >= self.deadline:
+            raise BudgetDone()
+
+    def _synthetic_events(self):
+        pygame, rng = self.pygame, self.rng
+        events = []
+        for key in list(self.held):
+            self.held[key] -= 1
+            if self.held[key] <= 0:
+                del self.held[key]
+                events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+        if rng.random() < 0.25:
+            key = rng.choice(self.keys)
+            if key not in self.held:
+                self.held[key] = rng.randint(1, 12)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        surf = pygame.display.get_surface()
+        if surf is not None and rng.random() < 0.1:
+            w, h = surf.get_size()
+            self.mouse_pos = (rng.randrange(w), rng.randrange(h))
+            if self.dragging:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=self.mouse_pos, button=1))
+            else:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=self.mouse_pos, button=1))
+            self.dragging = not self.dragging
+        if self.dragging:
+            events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=self.mouse_pos, rel=(0, 0), buttons=(1, 0, 0)))
+        return events
+
+    # -- pygame hooks --
+
+    def event_get(self, *a, **kw):
+        self._check_budget()
+        # Drain the real queue; the game only sees synthetic input
+        self._get(*a, **kw)
+        return self._synthetic_events()
+
+    def flip(self):
+        self._present()
+        return self._flip()
+
+    def update(self, *a, **kw):
+        self._present()
+        return self._update(*a, **kw)
+
+    def _present(self):
+        now = time.perf_counter()
+        if self.first_frame is None:
+            self.first_frame = time.time()
+            self.first_perf = now
+        elif self.warm_frame is None and now - self.first_perf >= WARMUP_SECONDS:
+            self.warm_frame = (now, self.frames, self.surfaces)
+        self.frames += 1
+        self.last_frame = now
+        self._check_budget()
+
+    def result(self):
+        fps = surfaces = None
+        if self.warm_frame is not None and self.last_frame > self.warm_frame[0]:
+            warm_time, warm_frames, warm_surfaces = self.warm_frame
+            frames = self.frames - 1 - warm_frames
+            fps = frames / (self.last_frame - warm_time)
+            surfaces = (self.surfaces - warm_surfaces) / max(frames, 1)
+        return {"frames": self.frames, "first_frame": self.first_frame, "fps": fps,
+                "surfaces_per_frame": surfaces}
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024.0 / (1024.0 if sys.platform == "darwin" else 1.0)
+
+
+def run_child(game, seconds, uncapped, seed):
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    random.seed(seed)
+    player = SyntheticPlayer(seconds, uncapped, seed)
+    path = os.path.join(REPO_ROOT, game)
+    sys.path.insert(0, os.path.dirname(path))
+    sys.argv = [path]
+    status, error = "ok", None
+    try:
+        runpy.run_path(path, run_name="__main__")
+        status = "exited"
+    except BudgetDone:
+        pass
+    except SystemExit:
+        status = "exited"
+    except Exception as exc:
+        status = "crash"
+        error = traceback.format_exception_only(type(exc), exc)[-1].strip()
+    result = player.result()
+    result.update(status=status, error=error, peak_rss_mb=peak_rss_mb())
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+# ------------------------------ Parent ---------------------------------
+
+def run_one(game, seconds, uncapped, seed):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", game,
+           "--seconds", str(seconds), "--seed", str(seed)]
+    if uncapped:
+        cmd.append("--uncapped")
+    row = {"game": game, "status": "hang", "error": None, "startup_s": None,
+           "fps": None, "frames": 0, "surfaces_per_frame": None, "peak_rss_mb": None}
+    launched = time.time()
+    with tempfile.TemporaryDirectory() as scratch:
+        try:
+            proc = subprocess.run(cmd, cwd=scratch, capture_output=True, text=True,
+                                  timeout=seconds + 20)
+        except subprocess.TimeoutExpired:
+            row["error"] = "no frame or input poll within the budget"
+            return row
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            child = json.loads(line[len(RESULT_PREFIX):])
+            row.update(status=child["status"], error=child["error"], fps=child["fps"],
+                       frames=child["frames"], surfaces_per_frame=child["surfaces_per_frame"],
+                       peak_rss_mb=child["peak_rss_mb"])
+            if child["first_frame"] is not None:
+                row["startup_s"] = child["first_frame"] - launched
+            break
+    else:
+        tail = proc.stderr.strip().splitlines()
+        row.update(status="crash", error=tail[-1] if tail else f"exit code {proc.returncode}")
+    return row
+
+
+def fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Smoke-test and profile every game script in parallel.")
+    ap.add_argument("games", nargs="*", help="game paths relative to the repo root (default: all)")
+    ap.add_argument("--seconds", type=float, default=5.0, help="wall-clock budget per game")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--uncapped", action="store_true", help="ignore Clock.tick framerate caps")
+    ap.add_argument("--json", help="also write the results to this file")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        run_child(args.child, args.seconds, args.uncapped, args.seed)
+        return
+
+    games = args.games or find_games()
+    start = time.perf_counter()
+    # Threads only wait on the subprocesses; each game is its own process
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        rows = list(pool.map(lambda g: run_one(g, args.seconds, args.uncapped, args.seed), games))
+    elapsed = time.perf_counter() - start
+
+    width = max(len(r["game"]) for r in rows)
+    print(f"{'game':<{width}}  {'status':<7} {'startup s':>9} {'fps':>8} {'surf/f':>7} {'rss MB':>7}  error")
+    for r in rows:
+        print(f"{r['game']:<{width}}  {r['status']:<7} {fmt(r['startup_s'], '9.2f')} "
+              f"{fmt(r['fps'], '8.1f')} {fmt(r['surfaces_per_frame'], '7.2f')} "
+              f"{fmt(r['peak_rss_mb'], '7.1f')}  {r['error'] or ''}")
+    bad = sum(r["status"] in ("crash", "hang") for r in rows)
+    print(f"{len(rows)} games, {bad} crashed or hung, {elapsed:.1f} s with {args.jobs} jobs")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
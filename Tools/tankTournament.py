@@ -0,0 +1,347 @@
+# tankTournament.py
+# Headless AI-vs-AI matches for Best/tank_duelGrok4GPT5Improved.py, spread over a process pool.
+#
+# The game's Arena runs without a display: nothing is drawn and the simulation steps at a
+# fixed dt as fast as the CPU allows. The player tank is driven by a pluggable policy
+# instead of the keyboard; "mirror" is a copy of Tank.update_ai aimed at the nearest enemy,
+# so the match is the enemy AI against itself. A cleared level advances to the next one
+# (with twice the enemies); a match ends when the player dies, a level runs past
+# --level-time simulated seconds, or --max-level is cleared.
+#
+# Per level it records: enemy count, outcome, time-to-kill (simulated seconds to clear the
+# level), shots fired by each side, blocks destroyed, and the enemy AI's wall time per tick
+# (Arena.ai_time). The summary ends with AI cost per level, which shows how it scales with
+# the doubling enemy count; compare runs before and after bfs/check_los changes.
+#
+# By default every enemy thinks every tick (AI_FRAME_BUDGET = None), so AI ms/tick is the
+# full cost of bfs/check_los; --ai-budget UNITS runs the game's frame-budgeted AIScheduler.
+#
+# Usage:
+#   python Tools/tankTournament.py                                 # 8 matches, mirror policy
+#   python Tools/tankTournament.py --matches 32 --max-level 7 --size 128 --json runs.json
+#   python Tools/tankTournament.py --policy turret --jobs 4
+#
+# A policy is a class with act(arena, dt) -> (keys, fire), called once per tick before
+# Arena.update(dt, keys); it may move arena.player itself and pass NO_KEYS. Add new ones to
+# POLICIES.
+#
+# Requires: pygame, numpy (the game's own dependencies)
+
+import argparse
+import concurrent.futures
+import importlib.util
+import json
+import math
+import os
+import random
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME = "Best/tank_duelGrok4GPT5Improved.py"
+
+tank = None  # the game module, loaded once per worker process
+
+
+def load_tank(size=None):
+    global tank
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    spec = importlib.util.spec_from_file_location("tank_duel", os.path.join(REPO_ROOT, GAME))
+    tank = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tank)
+    if size:
+        tank.set_arena_size(size)
+
+
+class Keys:
+    def __init__(self, *down):
+        self.down = set(down)
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+NO_KEYS = Keys()
+
+
+def nearest_enemy(arena):
+    me = arena.player.center
+    alive = [e for e in arena.enemies if e.alive]
+    return min(alive, key=lambda e: tank.dist(me, e.center)) if alive else None
+
+
+def move_with_collision(t, move_x, move_y, block_positions):
+    # Same axis-separated sweep as the end of Tank.update_ai
+    temp = t.rect.copy()
+    temp.x += move_x
+    temp.clamp_ip(tank.pygame.Rect(0, 0, tank.WIDTH, tank.HEIGHT))
+    for br in tank.blocks_touching(temp, block_positions):
+        if temp.colliderect(br):
+            if move_x > 0: temp.right = br.left
+            elif move_x < 0: temp.left = br.right
+    t.rect.x = temp.x
+
+    temp = t.rect.copy()
+    temp.y += move_y
+    temp.clamp_ip(tank.pygame.Rect(0, 0, tank.WIDTH, tank.HEIGHT))
+    for br in tank.blocks_touching(temp, block_positions):
+        if temp.colliderect(br):
+            if move_y > 0: temp.bottom = br.top
+            elif move_y < 0: temp.top = br.bottom
+    t.rect.y = temp.y
+
+
+class MirrorAIPolicy:
+    """Tank.update_ai, copied, hunting the nearest enemy at player speed."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.cooldown = 0.0
+        self.path = None
+        self.path_timer = 0.0
+        self.target = None
+        self.strafe = None
+
+    def act(self, arena, dt):
+        me = arena.player
+        target_tank = nearest_enemy(arena)
+        if target_tank is None:
+            return NO_KEYS, False
+        if target_tank is not self.target:
+            self.target = target_tank
+            self.path_timer = 0.0  # repath at once on a new target
+        block_positions = arena.block_positions
+        self.cooldown -= dt
+        self.path_timer -= dt
+
+        my = me.center
+        target = target_tank.center
+        d = tank.dist(my, target)
+        has_los = tank.check_los(my, target, block_positions)
+
+        dx = target[0] - my[0]
+        dy = target[1] - my[1]
+        if abs(dx) > abs(dy):
+            me.facing = 'right' if dx > 0 else 'left'
+        else:
+            me.facing = 'down' if dy > 0 else 'up'
+
+        want_advance = (d > tank.AI_STANDOFF_DIST) or (not has_los)
+        speed = me.speed
+        move_x = move_y = 0
+        if want_advance:
+            if self.path_timer <= 0:
+                start = (me.rect.centery // tank.CELL_SIZE, me.rect.centerx // tank.CELL_SIZE)
+                goal = (target_tank.rect.centery // tank.CELL_SIZE, target_tank.rect.centerx // tank.CELL_SIZE)
+                self.path = tank.bfs(start, goal, block_positions)
+                self.path_timer = tank.AI_REPATH_TIME
+            if self.path and len(self.path) > 1:
+                tx, ty = tank.cell_center(*self.path[1])
+                vx, vy = tx - my[0], ty - my[1]
+                mag = math.hypot(vx, vy)
+                if mag > 1e-5:
+                    vx /= mag
+                    vy /= mag
+                    move_x = vx * speed * dt
+                    move_y = vy * speed * dt
+                    if abs(vx) > abs(vy):
+                        me.facing = 'right' if vx > 0 else 'left'
+                    else:
+                        me.facing = 'down' if vy > 0 else 'up'
+                if mag < speed * dt * 1.2:
+                    self.path = self.path[1:]
+            else:
+                mag = math.hypot(dx, dy)
+                if mag > 1e-5:
+                    move_x = (dx / mag) * speed * dt
+                    move_y = (dy / mag) * speed * dt
+        else:
+            if self.rng.random() < 0.04 and abs(dx) + abs(dy) > 0:
+                mag = math.hypot(dy, dx)
+                self.strafe = (-dy / mag, dx / mag, self.rng.uniform(0.2, 0.5))
+            if self.strafe:
+                sx, sy, t = self.strafe
+                move_x = sx * speed * 0.6 * dt
+                move_y = sy * speed * 0.6 * dt
+                self.strafe = (sx, sy, t - dt) if t - dt > 0 else None
+
+        if move_x or move_y:
+            move_with_collision(me, move_x, move_y, block_positions)
+
+        fire_ok = has_los or (self.rng.random() < 0.15 and d < tank.AI_STANDOFF_DIST * 1.2)
+        if fire_ok and self.cooldown <= 0:
+            self.cooldown = tank.AI_FIRE_COOLDOWN
+            return NO_KEYS, True
+        return NO_KEYS, False
+
+
+class TurretPolicy:
+    """Never moves; turns toward the nearest enemy and fires whenever it has line of sight."""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def act(self, arena, dt):
+        me = arena.player
+        target_tank = nearest_enemy(arena)
+        if target_tank is None:
+            return NO_KEYS, False
+        (mx, my), (tx, ty) = me.center, target_tank.center
+        if abs(tx - mx) > abs(ty - my):
+            me.facing = 'right' if tx > mx else 'left'
+        else:
+            me.facing = 'down' if ty > my else 'up'
+        return NO_KEYS, tank.check_los(me.center, target_tank.center, arena.block_positions)
+
+
+class RandomKeysPolicy:
+    """Holds a random arrow key for a while and fires at random, like a button masher."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.keys = NO_KEYS
+        self.hold = 0
+
+    def act(self, arena, dt):
+        self.hold -= 1
+        if self.hold <= 0:
+            self.keys = Keys(self.rng.choice([tank.K_UP, tank.K_DOWN, tank.K_LEFT, tank.K_RIGHT]))
+            self.hold = self.rng.randint(10, 60)
+        return self.keys, self.rng.random() < 0.1
+
+
+POLICIES = {
+    "mirror": MirrorAIPolicy,
+    "turret": TurretPolicy,
+    "random": RandomKeysPolicy,
+}
+
+
+def play_match(policy_name, seed, start_level, max_level, level_time, dt, weapon, ai_budget):
+    """One match from start_level until the player dies, times out or clears max_level."""
+    tank.AI_FRAME_BUDGET = ai_budget
+    random.seed(seed)
+    policy = POLICIES[policy_name](random.Random(seed * 7919 + 1))
+    arena = tank.Arena()
+    arena.player_weapon_idx = weapon
+    if start_level > 1:
+        arena.level = start_level
+        arena.new_game()
+    wall_start = time.perf_counter()
+    levels = []
+    while True:
+        level_start = arena.time
+        ai_start = arena.ai_time
+        blocks_start = len(arena.block_positions)
+        ticks = player_shots = 0
+        while not arena.game_over and arena.time - level_start < level_time:
+            keys, fire = policy.act(arena, dt)
+            if fire and arena.fire_player():
+                player_shots += 1
+            arena.update(dt, keys)
+            ticks += 1
+        outcome = arena.winner or "timeout"
+        levels.append({
+            "level": arena.level,
+            "enemies": len(arena.enemies),
+            "outcome": outcome,
+            "sim_s": arena.time - level_start,
+            "ticks": ticks,
+            "player_shots": player_shots,
+            "ai_shots": arena.bullets.fired - player_shots,
+            "blocks_destroyed": blocks_start - len(arena.block_positions),
+            "ai_ms_per_tick": (arena.ai_time - ai_start) * 1000.0 / max(ticks, 1),
+        })
+        if outcome != "player" or arena.level >= max_level:
+            break
+        arena.new_game(advance=True)
+    wall = time.perf_counter() - wall_start
+    cleared = [lv for lv in levels if lv["outcome"] == "player"]
+    ticks = sum(lv["ticks"] for lv in levels)
+    return {
+        "policy": policy_name,
+        "seed": seed,
+        "level_reached": levels[-1]["level"],
+        "levels_cleared": len(cleared),
+        "end": levels[-1]["outcome"],
+        "time_to_kill_s": [lv["sim_s"] for lv in cleared],
+        "shots_fired": sum(lv["player_shots"] + lv["ai_shots"] for lv in levels),
+        "blocks_destroyed": sum(lv["blocks_destroyed"] for lv in levels),
+        "ai_ms_per_tick": sum(lv["ai_ms_per_tick"] * lv["ticks"] for lv in levels) / max(ticks, 1),
+        "wall_s": wall,
+        "speedup": arena.time / wall if wall > 0 else None,
+        "levels": levels,
+    }
+
+
+def run_match(args):
+    return play_match(*args)
+
+
+def fmt(value, spec):
+    # a missing value prints as "-" padded to the spec's width, so columns stay aligned
+    if value is None:
+        return format("-", ">" + spec.split(".")[0].strip("<>^=+- ,"))
+    return format(value, spec)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Headless AI-vs-AI Tank Duel matches on a process pool.")
+    ap.add_argument("--matches", type=int, default=8)
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="mirror")
+    ap.add_argument("--seed", type=int, default=0, help="match i uses seed + i")
+    ap.add_argument("--size", type=int, help="arena cells per side (default: the game's)")
+    ap.add_argument("--start-level", type=int, default=1)
+    ap.add_argument("--max-level", type=int, default=6)
+    ap.add_argument("--level-time", type=float, default=120.0, help="simulated seconds before a level times out")
+    ap.add_argument("--weapon", type=int, default=0, help="player weapon index (radius from PLAYER_WEAPON_RADII)")
+    ap.add_argument("--ai-budget", type=int, help="enemy AI think units per tick (default: no limit)")
+    ap.add_argument("--fps", type=float, default=60.0, help="simulation ticks per simulated second")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--json", help="also write per-match results to this file")
+    args = ap.parse_args()
+
+    load_tank(args.size)
+    jobs = [(args.policy, args.seed + i, args.start_level, args.max_level, args.level_time,
+             1.0 / args.fps, args.weapon, args.ai_budget)
+            for i in range(args.matches)]
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs, initializer=load_tank,
+                                                initargs=(args.size,)) as pool:
+        results = list(pool.map(run_match, jobs))
+    elapsed = time.perf_counter() - start
+
+    print(f"{tank.COLS}x{tank.ROWS} arena, policy {args.policy}, {args.matches} matches")
+    print(f"{'seed':>5} {'level':>5} {'end':<8} {'ttk s (mean)':>12} {'shots':>6} {'blocks':>6} "
+          f"{'AI ms/tick':>10} {'wall s':>7} {'x real':>7}")
+    for r in results:
+        ttk = r["time_to_kill_s"]
+        print(f"{r['seed']:>5} {r['level_reached']:>5} {r['end']:<8} "
+              f"{fmt(sum(ttk) / len(ttk) if ttk else None, '12.1f')} {r['shots_fired']:>6} "
+              f"{r['blocks_destroyed']:>6} {r['ai_ms_per_tick']:>10.3f} {r['wall_s']:>7.1f} "
+              f"{fmt(r['speedup'], '7.0f')}")
+
+    # AI cost by level: how it scales with 2 ** (level - 1) enemies
+    by_level = {}
+    for r in results:
+        for lv in r["levels"]:
+            by_level.setdefault(lv["level"], []).append(lv)
+    print(f"\n{'level':>5} {'enemies':>7} {'played':>6} {'cleared':>7} {'ttk s':>7} "
+          f"{'AI ms/tick':>10} {'per enemy':>9}")
+    for level in sorted(by_level):
+        rows = by_level[level]
+        won = [lv["sim_s"] for lv in rows if lv["outcome"] == "player"]
+        ai = sum(lv["ai_ms_per_tick"] for lv in rows) / len(rows)
+        enemies = rows[0]["enemies"]
+        print(f"{level:>5} {enemies:>7} {len(rows):>6} {len(won):>7} "
+              f"{fmt(sum(won) / len(won) if won else None, '7.1f')} {ai:>10.3f} {ai / enemies:>9.4f}")
+    print(f"{args.matches} matches in {elapsed:.1f} s with {args.jobs} jobs")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()